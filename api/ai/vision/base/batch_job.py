@@ -0,0 +1,57 @@
+import json
+
+
+class BatchJob(object):
+    DEFAULT_BATCH_SIZE = 100
+
+    def __init__(
+        self,
+        operation: object,
+        output_uri: str,
+        count: int,
+        batch_size: int,
+        storage: object,
+        serialize: callable,
+    ):
+        self.operation = operation
+        self.output_uri = output_uri
+        self.count = count
+        self.batch_size = batch_size
+        self.storage = storage
+        self.serialize = serialize
+
+    def done(self) -> bool:
+        return self.operation.done()
+
+    def wait(self, timeout: float = None) -> None:
+        self.operation.result(timeout=timeout)
+
+    def results(self, timeout: float = None) -> iter:
+        self.wait(timeout)
+
+        bucket, prefix = self.output_location()
+        storage = self.storage.for_bucket(bucket)
+
+        for output_file_path in self.output_file_paths(prefix):
+            with storage.request_open(output_file_path) as output_file:
+                output = json.load(output_file)
+
+            for response in output.get("responses", []):
+                yield self.parse(response)
+
+    def output_location(self) -> tuple:
+        bucket, _, prefix = self.output_uri.replace("gs://", "", 1).partition("/")
+
+        return bucket, prefix
+
+    def output_file_paths(self, prefix: str) -> list:
+        output_file_paths = []
+
+        for start in range(1, self.count + 1, self.batch_size):
+            end = min(start + self.batch_size - 1, self.count)
+            output_file_paths.append(f"{prefix}output-{start}-to-{end}.json")
+
+        return output_file_paths
+
+    def parse(self, response: dict) -> object:
+        raise NotImplementedError
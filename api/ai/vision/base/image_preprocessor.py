@@ -0,0 +1,119 @@
+import io
+import threading
+
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from PIL import Image, ImageOps
+
+from lib.ai import errors as AIError
+
+
+class ImagePreprocessor(object):
+    DEFAULT_QUALITY = 85
+
+    def __init__(
+        self, max_dimension: int = None, quality: int = None, max_workers: int = None
+    ):
+        self.max_dimension = max_dimension
+        self.quality = quality
+        self.max_workers = max_workers
+
+        self.__executor = None
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def is_local(source: object) -> bool:
+        return not isinstance(source, str) or "://" not in source
+
+    @staticmethod
+    def preprocess(source: object, max_dimension: int, quality: int) -> bytes:
+        try:
+            if isinstance(source, str):
+                with open(source, "rb") as image_file:
+                    content = image_file.read()
+            else:
+                content = bytes(source)
+        except FileNotFoundError:
+            raise AIError.FileObjectNotFound(f"image {source} not found")
+        except OSError as e:
+            raise AIError.InvalidImage(f"image {source} can not be read: {e}")
+
+        if max_dimension is None and quality is None:
+            return content
+
+        try:
+            return ImagePreprocessor.__transform(content, max_dimension, quality)
+        except OSError as e:
+            raise AIError.InvalidImage(f"image can not be decoded: {e}")
+
+    def process(self, source: object) -> object:
+        if not self.is_local(source):
+            return source
+
+        return self.preprocess(source, self.max_dimension, self.quality)
+
+    def process_many(self, sources: list) -> list:
+        futures = [self.__submit(source) for source in sources]
+
+        return [self.__result(future) for future in futures]
+
+    def shutdown(self) -> None:
+        with self.__lock:
+            if self.__executor is not None:
+                self.__executor.shutdown(wait=True)
+                self.__executor = None
+
+    # private
+
+    @staticmethod
+    def __transform(content: bytes, max_dimension: int, quality: int) -> bytes:
+        with Image.open(io.BytesIO(content)) as image:
+            if quality is None and max(image.size) <= max_dimension:
+                return content
+
+            image = ImageOps.exif_transpose(image)
+
+            if max_dimension is not None:
+                image.thumbnail((max_dimension, max_dimension), Image.LANCZOS)
+
+            output = io.BytesIO()
+            image.convert("RGB").save(
+                output,
+                format="JPEG",
+                quality=quality or ImagePreprocessor.DEFAULT_QUALITY,
+                optimize=True,
+            )
+
+            return output.getvalue()
+
+    def __submit(self, source: object) -> Future:
+        if not self.is_local(source) or (
+            self.max_dimension is None and self.quality is None
+        ):
+            future = Future()
+
+            try:
+                future.set_result(self.process(source))
+            except Exception as e:
+                future.set_exception(e)
+
+            return future
+
+        return self.__get_executor().submit(
+            self.preprocess, source, self.max_dimension, self.quality
+        )
+
+    def __get_executor(self) -> ProcessPoolExecutor:
+        with self.__lock:
+            if self.__executor is None:
+                self.__executor = ProcessPoolExecutor(max_workers=self.max_workers)
+
+            return self.__executor
+
+    def __result(self, future: Future) -> object:
+        error = future.exception()
+
+        if error is not None:
+            return error
+
+        return future.result()
@@ -0,0 +1,87 @@
+import io
+import threading
+
+import numpy
+
+from PIL import Image
+
+
+class PerceptualIndex(object):
+    DEFAULT_THRESHOLD = 4
+    HASH_SIZE = 8
+    INITIAL_CAPACITY = 1024
+
+    def __init__(self, threshold: int = DEFAULT_THRESHOLD):
+        self.threshold = threshold
+        self.hits = 0
+        self.misses = 0
+
+        self.__namespaces = {}
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def digest(cls, content: bytes) -> int:
+        try:
+            with Image.open(io.BytesIO(content)) as image:
+                grayscale = image.convert("L").resize(
+                    (cls.HASH_SIZE + 1, cls.HASH_SIZE), Image.LANCZOS
+                )
+                pixels = numpy.asarray(grayscale, dtype=numpy.int16)
+        except OSError:
+            return None
+
+        bits = (pixels[:, 1:] > pixels[:, :-1]).flatten()
+
+        return int.from_bytes(numpy.packbits(bits).tobytes(), "big")
+
+    @staticmethod
+    def distance(first: int, second: int) -> int:
+        return bin(first ^ second).count("1")
+
+    def is_near(self, first: int, second: int) -> bool:
+        return self.distance(first, second) <= self.threshold
+
+    def lookup(self, namespace: str, digest: int) -> object:
+        with self.__lock:
+            hashes, results = self.__namespaces.get(namespace, (None, []))
+
+            if results:
+                distances = self.__distances(hashes[: len(results)], digest)
+                nearest = int(numpy.argmin(distances))
+
+                if distances[nearest] <= self.threshold:
+                    self.hits += 1
+                    return results[nearest]
+
+            self.misses += 1
+
+            return None
+
+    def add(self, namespace: str, digest: int, result: object) -> None:
+        with self.__lock:
+            hashes, results = self.__namespaces.get(
+                namespace,
+                (numpy.zeros(self.INITIAL_CAPACITY, dtype=numpy.uint64), []),
+            )
+
+            if len(results) == len(hashes):
+                hashes = numpy.concatenate([hashes, numpy.zeros_like(hashes)])
+
+            hashes[len(results)] = numpy.uint64(digest)
+            results.append(result)
+
+            self.__namespaces[namespace] = (hashes, results)
+
+    def stats(self) -> dict:
+        with self.__lock:
+            size = sum(len(results) for _, results in self.__namespaces.values())
+
+            return {"hits": self.hits, "misses": self.misses, "size": size}
+
+    # private
+
+    def __distances(self, hashes: numpy.ndarray, digest: int) -> numpy.ndarray:
+        differences = numpy.bitwise_xor(hashes, numpy.uint64(digest))
+        bits = numpy.unpackbits(differences.view(numpy.uint8))
+
+        return bits.reshape(-1, 64).sum(axis=1)
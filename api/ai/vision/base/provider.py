@@ -1,8 +1,51 @@
+from lib.ai import errors as AIError
+from lib.common.circuit_breaker_group import CircuitBreakerGroup
+from lib.common.retry_policy import RetryPolicy
+from lib.common.worker_pool import WorkerPool
+
+
 class Provider(object):
     PROVIDER = None
+    STORAGE_PROVIDER = None
+    STORAGE_OPTIONS = {}
+
+    def __init__(
+        self,
+        max_workers: int = WorkerPool.DEFAULT_MAX_WORKERS,
+        retry_policy: RetryPolicy = None,
+        circuit_breakers: CircuitBreakerGroup = None,
+    ):
+        self.worker_pool = WorkerPool(max_workers)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breakers = circuit_breakers or CircuitBreakerGroup(
+            AIError.CircuitOpen,
+            failure_errors=RetryPolicy.REJECTED_ERRORS + RetryPolicy.TRANSIENT_ERRORS,
+        )
 
     def request_web_detection(self, uri: str) -> list:
         raise NotImplementedError
 
     def request_logo_detection(self, uri: str) -> list:
         raise NotImplementedError
+
+    def request_annotate(self, uri: str, features: list) -> dict:
+        raise NotImplementedError
+
+    def request_web_detection_many(self, uris: list) -> list:
+        raise NotImplementedError
+
+    def request_logo_detection_many(self, uris: list) -> list:
+        raise NotImplementedError
+
+    def request_web_detection_job(
+        self, uris: list, output_uri: str, storage: object, batch_size: int
+    ) -> object:
+        raise NotImplementedError
+
+    def request_logo_detection_job(
+        self, uris: list, output_uri: str, storage: object, batch_size: int
+    ) -> object:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        self.worker_pool.shutdown()
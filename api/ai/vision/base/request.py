@@ -4,3 +4,17 @@ class Request(object):
 
     def detect_logo(uri: str) -> object:
         raise NotImplementedError
+
+    def detect_web_many(self, uris: list) -> list:
+        raise NotImplementedError
+
+    def detect_logo_many(self, uris: list) -> list:
+        raise NotImplementedError
+
+    def annotate(self, uri: str, features: list) -> object:
+        raise NotImplementedError
+
+    def async_batch_annotate(
+        self, uris: list, features: list, output_uri: str, batch_size: int
+    ) -> object:
+        raise NotImplementedError
@@ -7,3 +7,9 @@ class Response(object):
 
     def logo_detection_serialize(self) -> list:
         raise NotImplementedError
+
+    def label_detection_serialize(self) -> list:
+        raise NotImplementedError
+
+    def annotate_serialize(self, features: list) -> dict:
+        raise NotImplementedError
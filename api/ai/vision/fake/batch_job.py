@@ -0,0 +1,15 @@
+from lib.ai import errors as AIError
+
+from api.ai.vision.base.batch_job import BatchJob as BaseBatchJob
+
+from api.ai.vision.fake.response import Response as FakeResponse
+
+
+class BatchJob(BaseBatchJob):
+    def parse(self, response: dict) -> object:
+        error = response.get("error") or {}
+
+        if error.get("message"):
+            return AIError.FileObjectNotFound(error["message"])
+
+        return self.serialize(FakeResponse.json_deserialize(response))
@@ -0,0 +1,225 @@
+import json
+
+from concurrent.futures import Future
+
+from lib.ai import errors as AIError
+from lib.common.circuit_breaker_group import CircuitBreakerGroup
+from lib.common.fault_injector import FaultInjector
+from lib.common.retry_policy import RetryPolicy
+from lib.common.token_bucket import TokenBucket
+from lib.common.worker_pool import WorkerPool
+
+from api.ai.vision.base.provider import Provider as BaseProvider
+
+from api.ai.vision.fake.batch_job import BatchJob
+from api.ai.vision.fake.request import Request as FakeRequest
+from api.ai.vision.fake.response import Response as FakeResponse
+
+
+class Provider(BaseProvider):
+    PROVIDER = "fake"
+    STORAGE_PROVIDER = "local"
+    STORAGE_OPTIONS = {"create_buckets": True}
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        distribution: str = FaultInjector.UNIFORM,
+        error_rate: float = 0.0,
+        error_rates: dict = None,
+        quota: float = None,
+        max_batch_size: int = FakeRequest.MAX_BATCH_SIZE,
+        seed: int = None,
+        max_workers: int = WorkerPool.DEFAULT_MAX_WORKERS,
+        retry_policy: RetryPolicy = None,
+        circuit_breakers: CircuitBreakerGroup = None,
+    ):
+        super().__init__(
+            max_workers,
+            retry_policy or RetryPolicy(retryable=(AIError.QuotaExceeded,)),
+            circuit_breakers,
+        )
+
+        self.fault_injector = FaultInjector(
+            latency,
+            jitter,
+            error_rate=error_rate,
+            error_rates=error_rates,
+            seed=seed,
+            distribution=distribution,
+        )
+        self.quota = TokenBucket(quota) if quota else None
+        self.max_batch_size = max_batch_size
+
+    def request_web_detection(self, uri: str) -> list:
+        request = self.__request()
+        web_detection_response = self.__call("web_detection", request.detect_web, uri)
+
+        response = FakeResponse(web_detection_response)
+
+        return response.web_detection_serialize()
+
+    def request_logo_detection(self, uri: str) -> list:
+        request = self.__request()
+        logo_detection_response = self.__call(
+            "logo_detection", request.detect_logo, uri
+        )
+
+        response = FakeResponse(logo_detection_response)
+
+        return response.logo_detection_serialize()
+
+    def request_annotate(self, uri: str, features: list) -> dict:
+        request = self.__request()
+        annotate_response = self.__call("annotate", request.annotate, uri, features)
+
+        response = FakeResponse(annotate_response)
+
+        return response.annotate_serialize(features)
+
+    def request_web_detection_many(self, uris: list) -> list:
+        responses = self.__batch(
+            "web_detection_many",
+            uris,
+            lambda request, chunk: request.detect_web_many(chunk),
+        )
+
+        return [
+            self.__serialize(res, FakeResponse.web_detection_serialize)
+            for res in responses
+        ]
+
+    def request_logo_detection_many(self, uris: list) -> list:
+        responses = self.__batch(
+            "logo_detection_many",
+            uris,
+            lambda request, chunk: request.detect_logo_many(chunk),
+        )
+
+        return [
+            self.__serialize(res, FakeResponse.logo_detection_serialize)
+            for res in responses
+        ]
+
+    def request_web_detection_job(
+        self,
+        uris: list,
+        output_uri: str,
+        storage: object,
+        batch_size: int = BatchJob.DEFAULT_BATCH_SIZE,
+    ) -> BatchJob:
+        return self.__job(
+            uris,
+            ["web"],
+            output_uri,
+            storage,
+            batch_size,
+            lambda res: FakeResponse(res.response["web"]).web_detection_serialize(),
+        )
+
+    def request_logo_detection_job(
+        self,
+        uris: list,
+        output_uri: str,
+        storage: object,
+        batch_size: int = BatchJob.DEFAULT_BATCH_SIZE,
+    ) -> BatchJob:
+        return self.__job(
+            uris,
+            ["logo"],
+            output_uri,
+            storage,
+            batch_size,
+            lambda res: FakeResponse(res.response["logo"]).logo_detection_serialize(),
+        )
+
+    # private
+
+    def __request(self) -> FakeRequest:
+        return FakeRequest(self.fault_injector, self.quota, self.max_batch_size)
+
+    def __call(
+        self, operation: str, function: callable, *args, idempotent: bool = True
+    ) -> object:
+        return self.circuit_breakers.call(
+            operation, self.retry_policy.call, function, *args, idempotent=idempotent
+        )
+
+    def __chunks(self, uris: list) -> list:
+        chunks = []
+
+        for offset in range(0, len(uris), self.max_batch_size):
+            limit = offset + self.max_batch_size
+            chunks.append(uris[offset:limit])
+
+        return chunks
+
+    def __batch(self, operation: str, uris: list, detect: callable) -> list:
+        chunks = self.__chunks(uris)
+        results = self.worker_pool.map(
+            lambda chunk: self.__call(operation, detect, self.__request(), chunk),
+            chunks,
+        )
+        responses = []
+
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, Exception):
+                responses.extend([result] * len(chunk))
+            else:
+                responses.extend(result)
+
+        return responses
+
+    def __job(
+        self,
+        uris: list,
+        features: list,
+        output_uri: str,
+        storage: object,
+        batch_size: int,
+        serialize: callable,
+    ) -> BatchJob:
+        annotations = self.__call(
+            "async_batch_annotate",
+            self.__request().async_batch_annotate,
+            uris,
+            features,
+            output_uri,
+            batch_size,
+            idempotent=False,
+        )
+        job = BatchJob(Future(), output_uri, len(uris), batch_size, storage, serialize)
+
+        self.worker_pool.submit(self.__write_outputs, job, annotations)
+
+        return job
+
+    def __write_outputs(self, job: BatchJob, annotations: list) -> None:
+        try:
+            bucket, prefix = job.output_location()
+            offsets = range(0, job.count, job.batch_size)
+            storage = job.storage.for_bucket(bucket)
+
+            for offset, output_file_path in zip(offsets, job.output_file_paths(prefix)):
+                limit = offset + job.batch_size
+                output = {
+                    "responses": [
+                        FakeResponse(res).json_serialize()
+                        for res in annotations[offset:limit]
+                    ]
+                }
+
+                storage.request_upload_stream(
+                    output_file_path, json.dumps(output).encode("utf-8")
+                )
+        except Exception as e:
+            job.operation.set_exception(e)
+        else:
+            job.operation.set_result(None)
+
+    def __serialize(self, result: object, serialize: callable) -> object:
+        if isinstance(result, Exception):
+            return result
+
+        return serialize(FakeResponse(result))
@@ -0,0 +1,110 @@
+import hashlib
+
+from lib.ai import errors as AIError
+from lib.common.fault_injector import FaultInjector
+from lib.common.token_bucket import TokenBucket
+
+from api.ai.vision.base.request import Request as BaseRequest
+
+
+class Request(BaseRequest):
+    MAX_BATCH_SIZE = 16
+    MAX_ASYNC_BATCH_SIZE = 2000
+    ENTITIES = 3
+    LABELS = (
+        "Animal",
+        "Building",
+        "Car",
+        "Dog",
+        "Food",
+        "Mountain",
+        "Person",
+        "Plant",
+        "Sky",
+        "Text",
+    )
+    LOGOS = ("Acme", "Globex", "Hooli", "Initech", "Umbrella", "Wayne")
+    FEATURES = {"web": (0, LABELS), "logo": (8, LOGOS), "label": (16, LABELS)}
+
+    def __init__(
+        self,
+        fault_injector: FaultInjector = None,
+        quota: TokenBucket = None,
+        max_batch_size: int = MAX_BATCH_SIZE,
+    ):
+        self.fault_injector = fault_injector or FaultInjector()
+        self.quota = quota
+        self.max_batch_size = max_batch_size
+
+    def detect_web(self, uri: str) -> list:
+        return self.__annotate_many("web_detection", [uri], ["web"])[0]["web"]
+
+    def detect_logo(self, uri: str) -> list:
+        return self.__annotate_many("logo_detection", [uri], ["logo"])[0]["logo"]
+
+    def annotate(self, uri: str, features: list) -> dict:
+        return self.__annotate_many("annotate", [uri], features)[0]
+
+    def detect_web_many(self, uris: list) -> list:
+        responses = self.__annotate_many("web_detection_many", uris, ["web"])
+
+        return [res["web"] for res in responses]
+
+    def detect_logo_many(self, uris: list) -> list:
+        responses = self.__annotate_many("logo_detection_many", uris, ["logo"])
+
+        return [res["logo"] for res in responses]
+
+    def async_batch_annotate(
+        self, uris: list, features: list, output_uri: str, batch_size: int
+    ) -> list:
+        if len(uris) > self.MAX_ASYNC_BATCH_SIZE:
+            raise ValueError(
+                f"async batch annotation accepts at most {self.MAX_ASYNC_BATCH_SIZE} images"
+            )
+
+        self.__admit("async_batch_annotate", len(uris))
+
+        return [self.__annotations(uri, features) for uri in uris]
+
+    # private
+
+    def __annotate_many(self, operation: str, uris: list, features: list) -> list:
+        if len(uris) > self.max_batch_size:
+            raise ValueError(
+                f"batch annotation accepts at most {self.max_batch_size} images"
+            )
+
+        annotations = [self.__annotations(uri, features) for uri in uris]
+        self.__admit(operation, len(uris))
+
+        return annotations
+
+    def __admit(self, operation: str, images: int) -> None:
+        self.fault_injector.call(operation)
+
+        if self.quota is not None and not self.quota.try_acquire(images):
+            raise AIError.QuotaExceeded(f"quota exceeded for {operation}")
+
+    def __annotations(self, uri: object, features: list) -> dict:
+        if isinstance(uri, (bytes, bytearray, memoryview)):
+            digest = hashlib.sha256(uri).digest()
+        else:
+            digest = hashlib.sha256(str(uri).encode("utf-8")).digest()
+
+        return {feature: self.__entities(digest, feature) for feature in features}
+
+    def __entities(self, digest: bytes, feature: str) -> list:
+        if feature not in self.FEATURES:
+            raise AIError.FeatureNotFound(f"feature {feature} is not available")
+
+        offset, vocabulary = self.FEATURES[feature]
+        entities = {}
+
+        for index in range(offset, offset + self.ENTITIES):
+            description = vocabulary[digest[index] % len(vocabulary)]
+            score = digest[index + self.ENTITIES] / 256
+
+            entities[description] = max(score, entities.get(description, 0.0))
+
+        return sorted(entities.items(), key=lambda entity: (-entity[1], entity[0]))
@@ -0,0 +1,66 @@
+from api.ai.vision.base.response import Response as BaseResponse
+
+
+class Response(BaseResponse):
+    def __init__(self, response):
+        self.response = response
+
+    def web_detection_serialize(self) -> list:
+        return [{"label": label, "score": score} for label, score in self.response]
+
+    def logo_detection_serialize(self) -> list:
+        return [{"logo": logo, "score": score} for logo, score in self.response]
+
+    def label_detection_serialize(self) -> list:
+        return [{"label": label, "score": score} for label, score in self.response]
+
+    def annotate_serialize(self, features: list) -> dict:
+        serializers = {
+            "web": lambda res: Response(res).web_detection_serialize(),
+            "logo": lambda res: Response(res).logo_detection_serialize(),
+            "label": lambda res: Response(res).label_detection_serialize(),
+        }
+
+        return {
+            feature: serializers[feature](self.response[feature])
+            for feature in features
+        }
+
+    @classmethod
+    def json_deserialize(cls, output: dict) -> "Response":
+        fields = {
+            "web": lambda res: res.get("webDetection", {}).get("webEntities"),
+            "logo": lambda res: res.get("logoAnnotations"),
+            "label": lambda res: res.get("labelAnnotations"),
+        }
+        response = {}
+
+        for feature, field in fields.items():
+            entities = field(output)
+
+            if entities is not None:
+                response[feature] = [
+                    (entity["description"], entity["score"]) for entity in entities
+                ]
+
+        return cls(response)
+
+    def json_serialize(self) -> dict:
+        fields = {
+            "web": lambda entities: {"webDetection": {"webEntities": entities}},
+            "logo": lambda entities: {"logoAnnotations": entities},
+            "label": lambda entities: {"labelAnnotations": entities},
+        }
+        output = {}
+
+        for feature, entities in self.response.items():
+            output.update(
+                fields[feature](
+                    [
+                        {"description": description, "score": score}
+                        for description, score in entities
+                    ]
+                )
+            )
+
+        return output
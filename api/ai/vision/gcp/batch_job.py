@@ -0,0 +1,18 @@
+from google.cloud import vision
+from google.protobuf import json_format
+
+from lib.ai import errors as AIError
+
+from api.ai.vision.base.batch_job import BatchJob as BaseBatchJob
+
+
+class BatchJob(BaseBatchJob):
+    def parse(self, response: dict) -> object:
+        annotations = json_format.ParseDict(
+            response, vision.types.AnnotateImageResponse(), ignore_unknown_fields=True
+        )
+
+        if annotations.error.message:
+            return AIError.FileObjectNotFound(annotations.error.message)
+
+        return self.serialize(annotations)
@@ -0,0 +1,66 @@
+import threading
+
+from google.cloud import vision
+
+from lib.ai import errors as AIError
+
+
+class ClientPool(object):
+    DEFAULT_SIZE = 1
+
+    __default = None
+    __default_lock = threading.Lock()
+
+    def __init__(
+        self,
+        size: int = DEFAULT_SIZE,
+        client_factory: callable = vision.ImageAnnotatorClient,
+    ):
+        if size < 1:
+            raise ValueError("client pool size must be at least 1")
+
+        self.size = size
+        self.closed = False
+
+        self.__client_factory = client_factory
+        self.__clients = []
+        self.__next = 0
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def default(cls) -> "ClientPool":
+        with cls.__default_lock:
+            if cls.__default is None or cls.__default.closed:
+                cls.__default = cls()
+
+            return cls.__default
+
+    def client(self) -> vision.ImageAnnotatorClient:
+        with self.__lock:
+            if self.closed:
+                raise AIError.ClientPoolClosed
+
+            if len(self.__clients) < self.size:
+                client = self.__client_factory()
+                self.__clients.append(client)
+
+                return client
+
+            client = self.__clients[self.__next % self.size]
+            self.__next += 1
+
+            return client
+
+    def close(self) -> None:
+        with self.__lock:
+            for client in self.__clients:
+                client.transport.channel.close()
+
+            self.__clients = []
+            self.closed = True
+
+    def __enter__(self) -> "ClientPool":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
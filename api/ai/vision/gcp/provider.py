@@ -1,24 +1,188 @@
+from lib.ai import errors as AIError
+from lib.common.circuit_breaker_group import CircuitBreakerGroup
+from lib.common.retry_policy import RetryPolicy
+from lib.common.worker_pool import WorkerPool
+
 from api.ai.vision.base.provider import Provider as BaseProvider
 
+from api.ai.vision.gcp.batch_job import BatchJob
+from api.ai.vision.gcp.client_pool import ClientPool
 from api.ai.vision.gcp.request import Request as GCPRequest
 from api.ai.vision.gcp.response import Response as GCPResponse
 
 
 class Provider(BaseProvider):
     PROVIDER = "GCP"
+    STORAGE_PROVIDER = "GCP"
+
+    def __init__(
+        self,
+        client_pool: ClientPool = None,
+        max_workers: int = WorkerPool.DEFAULT_MAX_WORKERS,
+        retry_policy: RetryPolicy = None,
+        circuit_breakers: CircuitBreakerGroup = None,
+    ):
+        super().__init__(
+            max_workers,
+            retry_policy or RetryPolicy(retryable=(AIError.QuotaExceeded,)),
+            circuit_breakers,
+        )
+
+        self.client_pool = client_pool or ClientPool.default()
+        self.owns_client_pool = client_pool is not None
 
     def request_web_detection(self, uri: str) -> list:
-        request = GCPRequest()
-        web_detection_response = request.detect_web(uri)
+        request = self.__request()
+        web_detection_response = self.__call("web_detection", request.detect_web, uri)
 
         response = GCPResponse(web_detection_response)
 
         return response.web_detection_serialize()
 
     def request_logo_detection(self, uri: str) -> list:
-        request = GCPRequest()
-        logo_detection_response = request.detect_logo(uri)
+        request = self.__request()
+        logo_detection_response = self.__call(
+            "logo_detection", request.detect_logo, uri
+        )
 
         response = GCPResponse(logo_detection_response)
 
         return response.logo_detection_serialize()
+
+    def request_annotate(self, uri: str, features: list) -> dict:
+        request = self.__request()
+        annotate_response = self.__call("annotate", request.annotate, uri, features)
+
+        response = GCPResponse(annotate_response)
+
+        return response.annotate_serialize(features)
+
+    def request_web_detection_many(self, uris: list) -> list:
+        responses = self.__batch(
+            "web_detection_many",
+            uris,
+            lambda request, chunk: request.detect_web_many(chunk),
+        )
+
+        return [
+            self.__serialize(res, GCPResponse.web_detection_serialize)
+            for res in responses
+        ]
+
+    def request_logo_detection_many(self, uris: list) -> list:
+        responses = self.__batch(
+            "logo_detection_many",
+            uris,
+            lambda request, chunk: request.detect_logo_many(chunk),
+        )
+
+        return [
+            self.__serialize(res, GCPResponse.logo_detection_serialize)
+            for res in responses
+        ]
+
+    def request_web_detection_job(
+        self,
+        uris: list,
+        output_uri: str,
+        storage: object,
+        batch_size: int = BatchJob.DEFAULT_BATCH_SIZE,
+    ) -> BatchJob:
+        return self.__job(
+            uris,
+            ["web"],
+            output_uri,
+            storage,
+            batch_size,
+            lambda res: GCPResponse(
+                res.web_detection.web_entities
+            ).web_detection_serialize(),
+        )
+
+    def request_logo_detection_job(
+        self,
+        uris: list,
+        output_uri: str,
+        storage: object,
+        batch_size: int = BatchJob.DEFAULT_BATCH_SIZE,
+    ) -> BatchJob:
+        return self.__job(
+            uris,
+            ["logo"],
+            output_uri,
+            storage,
+            batch_size,
+            lambda res: GCPResponse(res.logo_annotations).logo_detection_serialize(),
+        )
+
+    def close(self) -> None:
+        super().close()
+
+        if self.owns_client_pool:
+            self.client_pool.close()
+
+    # private
+
+    def __request(self) -> GCPRequest:
+        return GCPRequest(self.client_pool)
+
+    def __call(
+        self, operation: str, function: callable, *args, idempotent: bool = True
+    ) -> object:
+        return self.circuit_breakers.call(
+            operation, self.retry_policy.call, function, *args, idempotent=idempotent
+        )
+
+    def __chunks(self, uris: list) -> list:
+        chunks = []
+
+        for offset in range(0, len(uris), GCPRequest.MAX_BATCH_SIZE):
+            limit = offset + GCPRequest.MAX_BATCH_SIZE
+            chunks.append(uris[offset:limit])
+
+        return chunks
+
+    def __batch(self, operation: str, uris: list, detect: callable) -> list:
+        chunks = self.__chunks(uris)
+        results = self.worker_pool.map(
+            lambda chunk: self.__call(operation, detect, self.__request(), chunk),
+            chunks,
+        )
+        responses = []
+
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, Exception):
+                responses.extend([result] * len(chunk))
+            else:
+                responses.extend(result)
+
+        return responses
+
+    def __job(
+        self,
+        uris: list,
+        features: list,
+        output_uri: str,
+        storage: object,
+        batch_size: int,
+        serialize: callable,
+    ) -> BatchJob:
+        operation = self.__call(
+            "async_batch_annotate",
+            self.__request().async_batch_annotate,
+            uris,
+            features,
+            output_uri,
+            batch_size,
+            idempotent=False,
+        )
+
+        return BatchJob(
+            operation, output_uri, len(uris), batch_size, storage, serialize
+        )
+
+    def __serialize(self, result: object, serialize: callable) -> object:
+        if isinstance(result, Exception):
+            return result
+
+        return serialize(GCPResponse(result))
@@ -1,14 +1,24 @@
 from google import protobuf
+from google.api_core import exceptions
 from google.cloud import vision
 
 from lib.ai import errors as AIError
 
 from api.ai.vision.base.request import Request as BaseRequest
+from api.ai.vision.gcp.client_pool import ClientPool
 
 
 class Request(BaseRequest):
-    def __init__(self):
-        self.client = vision.ImageAnnotatorClient()
+    MAX_BATCH_SIZE = 16
+    MAX_ASYNC_BATCH_SIZE = 2000
+    FEATURES = {
+        "web": vision.enums.Feature.Type.WEB_DETECTION,
+        "logo": vision.enums.Feature.Type.LOGO_DETECTION,
+        "label": vision.enums.Feature.Type.LABEL_DETECTION,
+    }
+
+    def __init__(self, client_pool: ClientPool = None):
+        self.client = (client_pool or ClientPool.default()).client()
 
     def detect_web(
         self, uri: str
@@ -26,23 +36,109 @@ class Request(BaseRequest):
 
         return logo_response
 
+    def annotate(self, uri: str, features: list) -> vision.types.AnnotateImageResponse:
+        annotations_response = self.__batch_annotations([uri], features)[0]
+        self.__check_annotations(annotations_response)
+
+        return annotations_response
+
+    def detect_web_many(self, uris: list) -> list:
+        responses = self.__batch_annotations(uris, ["web"])
+
+        return [self.__map_annotations(self.__web_entities, res) for res in responses]
+
+    def detect_logo_many(self, uris: list) -> list:
+        responses = self.__batch_annotations(uris, ["logo"])
+
+        return [self.__map_annotations(self.__logo_entities, res) for res in responses]
+
+    def async_batch_annotate(
+        self, uris: list, features: list, output_uri: str, batch_size: int
+    ) -> object:
+        if len(uris) > self.MAX_ASYNC_BATCH_SIZE:
+            raise ValueError(
+                f"async batch annotation accepts at most {self.MAX_ASYNC_BATCH_SIZE} images"
+            )
+
+        output_config = vision.types.OutputConfig(
+            gcs_destination=vision.types.GcsDestination(uri=output_uri),
+            batch_size=batch_size,
+        )
+
+        return self.__call(
+            self.client.async_batch_annotate_images,
+            [self.__annotate_image_request(uri, features) for uri in uris],
+            output_config,
+        )
+
     # private
 
-    def __image_type(self, uri: str) -> vision.types.Image:
+    def __call(self, method: callable, *args, **kwargs) -> object:
+        try:
+            return method(*args, **kwargs)
+        except exceptions.ResourceExhausted as e:
+            raise AIError.QuotaExceeded(e.message)
+
+    def __image_type(self, uri: object) -> vision.types.Image:
         image = vision.types.Image()
-        image.source.image_uri = uri
+
+        if isinstance(uri, bytes):
+            image.content = uri
+        else:
+            image.source.image_uri = uri
 
         return image
 
     def __web_detection_annotations(
         self, image: vision.types.Image
     ) -> vision.types.AnnotateImageResponse:
-        return self.client.web_detection(image=image)
+        return self.__call(self.client.web_detection, image=image)
 
     def __logo_detection_annotations(
         self, image: vision.types.Image
     ) -> vision.types.AnnotateImageResponse:
-        return self.client.logo_detection(image=image)
+        return self.__call(self.client.logo_detection, image=image)
+
+    def __annotate_image_request(
+        self, uri: str, features: list
+    ) -> vision.types.AnnotateImageRequest:
+        return vision.types.AnnotateImageRequest(
+            image=self.__image_type(uri),
+            features=[self.__feature_type(feature) for feature in features],
+        )
+
+    def __feature_type(self, feature: str) -> vision.types.Feature:
+        if feature not in self.FEATURES:
+            raise AIError.FeatureNotFound(f"feature {feature} is not available")
+
+        return vision.types.Feature(type=self.FEATURES[feature])
+
+    def __batch_annotations(self, uris: list, features: list) -> list:
+        if len(uris) > self.MAX_BATCH_SIZE:
+            raise ValueError(
+                f"batch annotation accepts at most {self.MAX_BATCH_SIZE} images"
+            )
+
+        batch_response = self.__call(
+            self.client.batch_annotate_images,
+            [self.__annotate_image_request(uri, features) for uri in uris],
+        )
+
+        return list(batch_response.responses)
+
+    def __map_annotations(self, entities: callable, response: object) -> object:
+        try:
+            self.__check_annotations(response)
+        except AIError.FileObjectNotFound as e:
+            return e
+
+        return entities(response)
+
+    def __web_entities(self, response: vision.types.AnnotateImageResponse) -> object:
+        return response.web_detection.web_entities
+
+    def __logo_entities(self, response: vision.types.AnnotateImageResponse) -> object:
+        return response.logo_annotations
 
     def __check_annotations(self, response: vision.types.AnnotateImageResponse) -> None:
         if response.error.message:
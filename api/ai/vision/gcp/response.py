@@ -10,3 +10,21 @@ class Response(BaseResponse):
 
     def logo_detection_serialize(self) -> list:
         return [{"logo": res.description, "score": res.score} for res in self.response]
+
+    def label_detection_serialize(self) -> list:
+        return [{"label": res.description, "score": res.score} for res in self.response]
+
+    def annotate_serialize(self, features: list) -> dict:
+        serializers = {
+            "web": lambda res: Response(
+                res.web_detection.web_entities
+            ).web_detection_serialize(),
+            "logo": lambda res: Response(
+                res.logo_annotations
+            ).logo_detection_serialize(),
+            "label": lambda res: Response(
+                res.label_annotations
+            ).label_detection_serialize(),
+        }
+
+        return {feature: serializers[feature](self.response) for feature in features}
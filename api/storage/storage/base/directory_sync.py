@@ -0,0 +1,180 @@
+import datetime
+import os
+
+from lib.common.checksum import Checksum
+from lib.common.checksum_cache import ChecksumCache
+from lib.common.worker_pool import WorkerPool
+
+
+class DirectorySync(object):
+    UPLOAD = "upload"
+    DOWNLOAD = "download"
+    SIZE_MTIME = "size_mtime"
+    CHECKSUM = "checksum"
+
+    def __init__(
+        self,
+        storage: object,
+        local_dir: str,
+        remote_prefix: str,
+        direction: str = UPLOAD,
+        compare: str = SIZE_MTIME,
+        delete: bool = False,
+        checksum_cache: ChecksumCache = None,
+        max_workers: int = WorkerPool.DEFAULT_MAX_WORKERS,
+    ):
+        if direction not in (self.UPLOAD, self.DOWNLOAD):
+            raise ValueError(f"sync direction {direction} is not available")
+
+        if compare not in (self.SIZE_MTIME, self.CHECKSUM):
+            raise ValueError(f"sync comparison {compare} is not available")
+
+        self.storage = storage
+        self.local_dir = local_dir
+        self.remote_prefix = remote_prefix.strip("/") + "/" if remote_prefix else ""
+        self.direction = direction
+        self.compare = compare
+        self.delete = delete
+        self.checksum_cache = checksum_cache or ChecksumCache()
+        self.max_workers = max_workers
+
+    def plan(self) -> list:
+        local_files = self.__local_files()
+        remote_objects = self.__remote_objects()
+
+        if self.direction == self.UPLOAD:
+            sources, targets = local_files, remote_objects
+        else:
+            sources, targets = remote_objects, local_files
+
+        actions = []
+
+        for path in sorted(sources):
+            reason = self.__difference(path, local_files, remote_objects)
+
+            if reason is not None:
+                actions.append(self.__action(self.direction, path, reason))
+
+        if self.delete:
+            actions.extend(
+                self.__action("delete", path, "missing from source")
+                for path in sorted(set(targets) - set(sources))
+            )
+
+        return actions
+
+    def run(self, dry_run: bool = False) -> dict:
+        actions = self.plan()
+        summary = {"plan": actions, "results": [], "errors": 0}
+
+        if dry_run:
+            return summary
+
+        worker_pool = WorkerPool(self.max_workers)
+
+        try:
+            summary["results"] = worker_pool.map(self.__apply, actions)
+        finally:
+            worker_pool.shutdown()
+
+        summary["errors"] = sum(
+            isinstance(result, Exception) for result in summary["results"]
+        )
+
+        return summary
+
+    # private
+
+    def __local_files(self) -> dict:
+        local_files = {}
+
+        for root, _, names in os.walk(self.local_dir):
+            for name in names:
+                local_file_path = os.path.join(root, name)
+                relative = os.path.relpath(local_file_path, self.local_dir)
+                stat = os.stat(local_file_path)
+
+                local_files[relative.replace(os.sep, "/")] = {
+                    "size": stat.st_size,
+                    "mtime": stat.st_mtime,
+                }
+
+        return local_files
+
+    def __remote_objects(self) -> dict:
+        remote_objects = {}
+
+        start = len(self.remote_prefix)
+
+        for entry in self.storage.request_list(self.remote_prefix):
+            relative = entry["name"][start:]
+
+            if entry.get("prefix") or not relative or relative.endswith("/"):
+                continue
+
+            remote_objects[relative] = entry
+
+        return remote_objects
+
+    def __difference(self, path: str, local_files: dict, remote_objects: dict) -> str:
+        local = local_files.get(path)
+        remote = remote_objects.get(path)
+
+        if local is None or remote is None:
+            return "missing from target"
+
+        if local["size"] != remote.get("size"):
+            return "size differs"
+
+        if self.compare == self.CHECKSUM:
+            checksums = self.checksum_cache.get(self.__local_path(path))
+            matches = Checksum.matches(checksums, remote)
+
+            if matches is not None:
+                return None if matches else "checksum differs"
+
+        remote_updated = self.__timestamp(remote.get("updated"))
+
+        if self.direction == self.UPLOAD and local["mtime"] > remote_updated:
+            return "local file is newer"
+
+        if self.direction == self.DOWNLOAD and remote_updated > local["mtime"]:
+            return "remote object is newer"
+
+        return None
+
+    def __action(self, action: str, path: str, reason: str) -> dict:
+        return {
+            "action": action,
+            "local_file_path": self.__local_path(path),
+            "remote_file_path": self.remote_prefix + path,
+            "reason": reason,
+        }
+
+    def __apply(self, action: dict) -> object:
+        local_file_path = action["local_file_path"]
+        remote_file_path = action["remote_file_path"]
+
+        if action["action"] == self.UPLOAD:
+            return self.storage.request_upload(remote_file_path, local_file_path)
+
+        if action["action"] == self.DOWNLOAD:
+            os.makedirs(os.path.dirname(local_file_path), exist_ok=True)
+
+            return self.storage.request_download(remote_file_path, local_file_path)
+
+        if self.direction == self.UPLOAD:
+            return self.storage.request_delete(remote_file_path)
+
+        os.remove(local_file_path)
+
+        return {"name": local_file_path, "exists": False}
+
+    def __local_path(self, path: str) -> str:
+        return os.path.join(self.local_dir, *path.split("/"))
+
+    def __timestamp(self, updated: str) -> float:
+        if not updated:
+            return 0.0
+
+        return datetime.datetime.fromisoformat(updated).timestamp()
@@ -0,0 +1,139 @@
+import sqlite3
+import sys
+import threading
+import time
+
+
+class MetadataIndex(object):
+    BUSY_TIMEOUT = 30
+    MMAP_SIZE = 256 * 1024 * 1024
+    FIELDS = ("name", "size", "crc32c", "md5_hash", "generation", "updated")
+    SURROGATES = (0xD800, 0xDFFF)
+
+    def __init__(self, path: str, clock: callable = time.time):
+        self.path = path
+
+        self.__clock = clock
+        self.__lock = threading.Lock()
+        self.__connection = self.__connect()
+
+    def refresh(self, entries: iter, prefix: str = "") -> dict:
+        refreshed_at = self.__clock()
+        counts = {"added": 0, "updated": 0, "unchanged": 0, "removed": 0}
+
+        with self.__lock, self.__connection:
+            for entry in entries:
+                if entry.get("prefix"):
+                    continue
+
+                counts[self.__upsert(entry, refreshed_at)] += 1
+
+            where, parameters = self.__prefix_range(prefix)
+            counts["removed"] = self.__connection.execute(
+                f"DELETE FROM objects WHERE {where} AND seen_at < ?",
+                parameters + (refreshed_at,),
+            ).rowcount
+
+        return counts
+
+    def get(self, name: str) -> dict:
+        with self.__lock:
+            row = self.__connection.execute(
+                f"SELECT {', '.join(self.FIELDS)} FROM objects WHERE name = ?", (name,)
+            ).fetchone()
+
+        return None if row is None else dict(zip(self.FIELDS, row))
+
+    def exists(self, name: str) -> bool:
+        return self.get(name) is not None
+
+    def size(self, name: str) -> int:
+        entry = self.get(name)
+
+        return None if entry is None else entry["size"]
+
+    def names(self, prefix: str = "") -> list:
+        where, parameters = self.__prefix_range(prefix)
+
+        with self.__lock:
+            rows = self.__connection.execute(
+                f"SELECT name FROM objects WHERE {where} ORDER BY name", parameters
+            ).fetchall()
+
+        return [row[0] for row in rows]
+
+    def stats(self, prefix: str = "") -> dict:
+        where, parameters = self.__prefix_range(prefix)
+
+        with self.__lock:
+            count, total_size = self.__connection.execute(
+                f"SELECT COUNT(*), COALESCE(SUM(size), 0) FROM objects WHERE {where}",
+                parameters,
+            ).fetchone()
+
+        return {"count": count, "total_size": total_size}
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__connection.close()
+
+    # private
+
+    def __connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self.path, timeout=self.BUSY_TIMEOUT, check_same_thread=False
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(f"PRAGMA mmap_size={self.MMAP_SIZE}")
+
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS objects ("
+                "name TEXT PRIMARY KEY, size INTEGER, crc32c TEXT, md5_hash TEXT, "
+                "generation INTEGER, updated TEXT, seen_at REAL NOT NULL)"
+            )
+
+        return connection
+
+    def __upsert(self, entry: dict, refreshed_at: float) -> str:
+        row = self.__connection.execute(
+            "SELECT generation FROM objects WHERE name = ?", (entry["name"],)
+        ).fetchone()
+
+        if row is not None and row[0] == entry.get("generation"):
+            self.__connection.execute(
+                "UPDATE objects SET seen_at = ? WHERE name = ?",
+                (refreshed_at, entry["name"]),
+            )
+
+            return "unchanged"
+
+        self.__connection.execute(
+            "INSERT OR REPLACE INTO objects "
+            "(name, size, crc32c, md5_hash, generation, updated, seen_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            tuple(entry.get(field) for field in self.FIELDS) + (refreshed_at,),
+        )
+
+        return "added" if row is None else "updated"
+
+    def __prefix_range(self, prefix: str) -> tuple:
+        successor = self.__successor(prefix)
+
+        if successor is None:
+            return "name >= ?", (prefix,)
+
+        return "name >= ? AND name < ?", (prefix, successor)
+
+    def __successor(self, prefix: str) -> str:
+        prefix = prefix.rstrip(chr(sys.maxunicode))
+
+        if not prefix:
+            return None
+
+        code_point = ord(prefix[-1]) + 1
+
+        if self.SURROGATES[0] <= code_point <= self.SURROGATES[1]:
+            code_point = self.SURROGATES[1] + 1
+
+        return prefix[:-1] + chr(code_point)
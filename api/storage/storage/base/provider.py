@@ -1,6 +1,29 @@
+import io
+import os
+import time
+
+from lib.common.circuit_breaker_group import CircuitBreakerGroup
+from lib.common.retry_policy import RetryPolicy
+from lib.storage import errors as StorageError
+from lib.common.worker_pool import WorkerPool
+
+
 class Provider(object):
     PROVIDER = None
 
+    def __init__(
+        self,
+        max_workers: int = WorkerPool.DEFAULT_MAX_WORKERS,
+        retry_policy: RetryPolicy = None,
+        circuit_breakers: CircuitBreakerGroup = None,
+    ):
+        self.worker_pool = WorkerPool(max_workers)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breakers = circuit_breakers or CircuitBreakerGroup(
+            StorageError.CircuitOpen,
+            failure_errors=RetryPolicy.REJECTED_ERRORS + RetryPolicy.TRANSIENT_ERRORS,
+        )
+
     def set_bucket(self, bucket: str) -> None:
         self.bucket = bucket
 
@@ -13,5 +36,72 @@ class Provider(object):
     def request_upload(self, remote_file_path: str, local_file_path: str) -> dict:
         raise NotImplementedError
 
+    def request_upload_stream(
+        self, remote_file_path: str, source: object, chunk_size: int = None
+    ) -> dict:
+        raise NotImplementedError
+
+    def request_upload_resumable(
+        self, remote_file_path: str, local_file_path: str, chunk_size: int = None
+    ) -> dict:
+        raise NotImplementedError
+
+    def request_download(self, remote_file_path: str, local_file_path: str) -> dict:
+        raise NotImplementedError
+
+    def request_open(self, remote_file_path: str) -> io.BufferedIOBase:
+        raise NotImplementedError
+
     def request_delete(self, remote_file_path: str) -> dict:
         raise NotImplementedError
+
+    def request_list(self, prefix: str = "", delimiter: str = None) -> iter:
+        raise NotImplementedError
+
+    def request_retrieve_many(self, remote_file_paths: list) -> list:
+        raise NotImplementedError
+
+    def request_delete_many(self, remote_file_paths: list) -> list:
+        raise NotImplementedError
+
+    def request_upload_many(self, files: list, max_workers: int = None) -> dict:
+        worker_pool = self.worker_pool
+
+        if max_workers and max_workers != worker_pool.max_workers:
+            worker_pool = WorkerPool(max_workers)
+
+        started_at = time.monotonic()
+
+        try:
+            results = worker_pool.map(lambda file: self.request_upload(*file), files)
+        finally:
+            if worker_pool is not self.worker_pool:
+                worker_pool.shutdown()
+
+        elapsed = time.monotonic() - started_at
+
+        uploaded = [
+            (local_file_path, result)
+            for (_, local_file_path), result in zip(files, results)
+            if not isinstance(result, Exception)
+        ]
+        total_bytes = sum(
+            os.path.getsize(local_file_path)
+            for local_file_path, result in uploaded
+            if not result.get("skipped")
+        )
+
+        return {
+            "results": results,
+            "total_bytes": total_bytes,
+            "elapsed_seconds": elapsed,
+            "bytes_per_second": total_bytes / elapsed if elapsed else 0.0,
+            "skipped": sum(1 for _, result in uploaded if result.get("skipped")),
+            "verified": sum(1 for _, result in uploaded if result.get("verified")),
+        }
+
+    def invalidate_bucket(self, bucket: str = None) -> None:
+        pass
+
+    def close(self) -> None:
+        self.worker_pool.shutdown()
@@ -8,5 +8,34 @@ class Request(object):
     def upload(self, remote_file_path: str, local_file_path: str) -> object:
         raise NotImplementedError
 
+    def upload_stream(
+        self, remote_file_path: str, source: object, chunk_size: int = None
+    ) -> object:
+        raise NotImplementedError
+
+    def upload_resumable(
+        self,
+        remote_file_path: str,
+        local_file_path: str,
+        chunk_size: int = None,
+        state_dir: str = None,
+    ) -> object:
+        raise NotImplementedError
+
+    def download(self, remote_file_path: str, local_file_path: str) -> object:
+        raise NotImplementedError
+
+    def open(self, remote_file_path: str) -> object:
+        raise NotImplementedError
+
     def delete(self, remote_file_path: str) -> object:
         raise NotImplementedError
+
+    def list_objects(self, prefix: str = "", delimiter: str = None) -> iter:
+        raise NotImplementedError
+
+    def retrieve_many(self, remote_file_paths: list) -> list:
+        raise NotImplementedError
+
+    def delete_many(self, remote_file_paths: list) -> list:
+        raise NotImplementedError
@@ -0,0 +1,50 @@
+import io
+
+
+class StreamReader(io.RawIOBase):
+    READ_SIZE = 256 * 1024
+
+    def __init__(self, source: object):
+        self.__chunks = self.__iterate(source)
+        self.__pending = memoryview(b"")
+        self.__position = 0
+
+    @classmethod
+    def open(
+        cls, source: object, buffer_size: int = io.DEFAULT_BUFFER_SIZE
+    ) -> io.BufferedReader:
+        return io.BufferedReader(cls(source), buffer_size)
+
+    def readable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.__position
+
+    def readinto(self, buffer: memoryview) -> int:
+        while not self.__pending:
+            chunk = next(self.__chunks, None)
+
+            if chunk is None:
+                return 0
+
+            self.__pending = memoryview(chunk).cast("B")
+
+        size = min(len(buffer), len(self.__pending))
+        buffer[:size] = self.__pending[:size]
+
+        self.__pending = self.__pending[size:]
+        self.__position += size
+
+        return size
+
+    # private
+
+    def __iterate(self, source: object) -> iter:
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return iter([source])
+
+        if hasattr(source, "read"):
+            return iter(lambda: source.read(self.READ_SIZE), b"")
+
+        return iter(source)
@@ -0,0 +1,29 @@
+from google.cloud import storage
+from google.cloud import exceptions
+
+
+class Batch(storage.batch.Batch):
+    MAX_SIZE = 100
+
+    def __init__(self, client: storage.Client):
+        super().__init__(client)
+        self.errors = []
+
+    def _finish_futures(self, responses: list) -> None:
+        if len(self._target_objects) != len(responses):
+            raise ValueError("Expected a response for every request.")
+
+        self.errors = []
+
+        for target_object, response in zip(self._target_objects, responses):
+            if not 200 <= response.status_code < 300:
+                self.errors.append(exceptions.from_http_response(response))
+                continue
+
+            self.errors.append(None)
+
+            if target_object is not None:
+                try:
+                    target_object._properties = response.json()
+                except ValueError:
+                    target_object._properties = response.content
@@ -0,0 +1,56 @@
+import io
+import os
+
+from google.cloud import storage
+
+
+class BlobReader(io.RawIOBase):
+    DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+    def __init__(self, blob: storage.blob.Blob):
+        self.blob = blob
+        self.size = blob.size or 0
+
+        self.__position = 0
+
+    @classmethod
+    def open(
+        cls, blob: storage.blob.Blob, buffer_size: int = DEFAULT_BUFFER_SIZE
+    ) -> io.BufferedReader:
+        return io.BufferedReader(cls(blob), buffer_size)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.__position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self.__position
+        elif whence == os.SEEK_END:
+            offset += self.size
+
+        if offset < 0:
+            raise ValueError("negative seek position")
+
+        self.__position = offset
+
+        return self.__position
+
+    def readinto(self, buffer: memoryview) -> int:
+        end = min(self.__position + len(buffer), self.size)
+
+        if end <= self.__position:
+            return 0
+
+        content = self.blob.download_as_string(start=self.__position, end=end - 1)
+        size = len(content)
+
+        buffer[:size] = content
+        self.__position += size
+
+        return size
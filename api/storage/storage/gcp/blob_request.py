@@ -22,10 +22,17 @@ class BlobRequest(object):
         except exceptions.NotFound:
             raise StorageError.FileNotFound("Can not delete, object file not found")
 
+    def reload(self) -> bool:
+        try:
+            self.blob.reload()
+            return True
+        except exceptions.NotFound:
+            raise StorageError.FileNotFound("Can not retrieve, object file not found")
+
     def is_existed(self) -> bool:
         if not self.blob.exists():
             raise StorageError.FileNotFound(
-                f"{self.object.name} object is not existed in GCP storage"
+                f"{self.blob.name} object is not existed in GCP storage"
             )
 
         return True
@@ -2,8 +2,9 @@ from api.storage.storage.gcp.blob_request import BlobRequest
 
 
 class BlobResponse(object):
-    def __init__(self, response: BlobRequest):
+    def __init__(self, response: BlobRequest, exists: bool = None):
         self.response = response.blob
+        self.existed = exists
 
     def id(self) -> int:
         return self.response.id
@@ -21,6 +22,9 @@ class BlobResponse(object):
         return f"gs://{self.bucket()}/{self.name()}"
 
     def exists(self) -> bool:
+        if self.existed is not None:
+            return self.existed
+
         return self.response.exists()
 
     def serialize(self) -> dict:
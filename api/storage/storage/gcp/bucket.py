@@ -5,10 +5,17 @@ from lib.storage import errors as StorageError
 
 from api.storage.storage.gcp.blob_request import BlobRequest
 from api.storage.storage.gcp.blob_response import BlobResponse
+from api.storage.storage.gcp.bucket_cache import BucketCache
 
 
 class Bucket(object):
-    def __init__(self, storage_client: storage.client.Client, bucket: str):
+    def __init__(
+        self,
+        storage_client: storage.client.Client,
+        bucket: str,
+        bucket_cache: BucketCache = None,
+    ):
+        self.bucket_cache = bucket_cache
         self.client = self.__initialize_bucket(storage_client, bucket)
         self.bucket = bucket
 
@@ -17,9 +24,9 @@ class Bucket(object):
 
     def retrieve(self, remote_file_path: str) -> dict:
         blob = BlobRequest(self.client, remote_file_path)
-        blob.is_existed()
+        blob.reload()
 
-        response = BlobResponse(blob)
+        response = BlobResponse(blob, True)
 
         return response.serialize()
 
@@ -27,16 +34,15 @@ class Bucket(object):
         blob = BlobRequest(self.client, remote_file_path)
         blob.upload(local_file_path)
 
-        response = BlobResponse(blob)
+        response = BlobResponse(blob, True)
 
         return response.serialize()
 
     def delete(self, remote_file_path: str) -> dict:
         blob = BlobRequest(self.client, remote_file_path)
-        blob.is_existed()
-        blob.delete()
+        blob.delete(remote_file_path)
 
-        response = BlobResponse(blob)
+        response = BlobResponse(blob, False)
 
         return response.serialize()
 
@@ -45,6 +51,9 @@ class Bucket(object):
     def __initialize_bucket(
         self, storage_client: storage.client.Client, bucket: str
     ) -> storage.bucket.Bucket:
+        if self.bucket_cache:
+            return self.bucket_cache.get(storage_client, bucket)
+
         try:
             return storage_client.get_bucket(bucket)
         except exceptions.NotFound as e:
@@ -0,0 +1,66 @@
+import threading
+import time
+
+from google.cloud import storage
+from google.cloud import exceptions
+
+from lib.storage import errors as StorageError
+
+
+class BucketCache(object):
+    DEFAULT_TTL = 300
+    BUCKET_NOT_FOUND_MESSAGE = "the specified bucket does not exist"
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL,
+        trust_bucket: bool = False,
+        clock: callable = time.monotonic,
+    ):
+        self.ttl = ttl
+        self.trust_bucket = trust_bucket
+
+        self.__clock = clock
+        self.__entries = {}
+        self.__lock = threading.Lock()
+
+    def get(self, client: storage.Client, bucket: str) -> storage.bucket.Bucket:
+        key = (id(client), bucket)
+        now = self.__clock()
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+
+        if entry and entry[1] > now:
+            return entry[0]
+
+        handle = self.__fetch(client, bucket)
+
+        with self.__lock:
+            self.__entries[key] = (handle, now + self.ttl)
+
+        return handle
+
+    def invalidate(self, bucket: str = None) -> None:
+        with self.__lock:
+            if bucket is None:
+                self.__entries = {}
+                return
+
+            for key in [key for key in self.__entries if key[1] == bucket]:
+                del self.__entries[key]
+
+    @classmethod
+    def is_bucket_not_found(cls, error: exceptions.NotFound) -> bool:
+        return cls.BUCKET_NOT_FOUND_MESSAGE in str(error.message).lower()
+
+    # private
+
+    def __fetch(self, client: storage.Client, bucket: str) -> storage.bucket.Bucket:
+        if self.trust_bucket:
+            return client.bucket(bucket)
+
+        try:
+            return client.get_bucket(bucket)
+        except exceptions.NotFound as e:
+            raise StorageError.BucketNotFound(e.message)
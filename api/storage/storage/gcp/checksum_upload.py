@@ -0,0 +1,60 @@
+from google.cloud import storage
+from google.cloud import exceptions
+
+from lib.common.checksum import Checksum
+from lib.common.checksum_cache import ChecksumCache
+from lib.storage import errors as StorageError
+
+
+class ChecksumUpload(object):
+    def __init__(
+        self,
+        blob: storage.blob.Blob,
+        local_file_path: str,
+        upload: callable,
+        checksum_cache: ChecksumCache = None,
+    ):
+        self.blob = blob
+        self.local_file_path = local_file_path
+        self.upload = upload
+        self.checksum_cache = checksum_cache
+        self.skipped = False
+        self.verified = None
+
+    def run(self) -> storage.blob.Blob:
+        local = self.__local_checksums()
+
+        if self.__exists() and Checksum.matches(local, self.__remote_checksums()):
+            self.skipped = True
+            self.verified = True
+
+            return self.blob
+
+        self.upload(self.blob, self.local_file_path)
+        self.verified = Checksum.matches(local, self.__remote_checksums())
+
+        if self.verified is False:
+            raise StorageError.ChecksumMismatch(
+                f"uploaded object {self.blob.name} does not match {self.local_file_path}"
+            )
+
+        return self.blob
+
+    # private
+
+    def __local_checksums(self) -> dict:
+        if self.checksum_cache is None:
+            return Checksum.file(self.local_file_path)
+
+        return self.checksum_cache.get(self.local_file_path)
+
+    def __exists(self) -> bool:
+        try:
+            self.blob.reload()
+        except exceptions.NotFound:
+            return False
+
+        return True
+
+    def __remote_checksums(self) -> dict:
+        return {"md5_hash": self.blob.md5_hash, "crc32c": self.blob.crc32c}
@@ -0,0 +1,88 @@
+import threading
+
+from google.cloud import storage
+from requests.adapters import HTTPAdapter
+
+from lib.storage import errors as StorageError
+
+
+class ClientPool(object):
+    DEFAULT_SIZE = 1
+    DEFAULT_MAX_CONNECTIONS = 10
+
+    __default = None
+    __default_lock = threading.Lock()
+
+    def __init__(
+        self,
+        size: int = DEFAULT_SIZE,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        client_factory: callable = storage.Client,
+    ):
+        if size < 1:
+            raise ValueError("client pool size must be at least 1")
+
+        self.size = size
+        self.max_connections = max_connections
+        self.closed = False
+
+        self.__client_factory = client_factory
+        self.__clients = []
+        self.__next = 0
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def default(cls) -> "ClientPool":
+        with cls.__default_lock:
+            if cls.__default is None or cls.__default.closed:
+                cls.__default = cls()
+
+            return cls.__default
+
+    def client(self) -> storage.Client:
+        with self.__lock:
+            if self.closed:
+                raise StorageError.ClientPoolClosed
+
+            if len(self.__clients) < self.size:
+                client = self.__create_client()
+                self.__clients.append(client)
+
+                return client
+
+            client = self.__clients[self.__next % self.size]
+            self.__next += 1
+
+            return client
+
+    def close(self) -> None:
+        with self.__lock:
+            for client in self.__clients:
+                self.__close_client(client)
+
+            self.__clients = []
+            self.closed = True
+
+    def __enter__(self) -> "ClientPool":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    # private
+
+    def __create_client(self) -> storage.Client:
+        client = self.__client_factory()
+
+        adapter = HTTPAdapter(
+            pool_connections=self.max_connections, pool_maxsize=self.max_connections
+        )
+        client._http.mount("https://", adapter)
+
+        return client
+
+    def __close_client(self, client: storage.Client) -> None:
+        http = getattr(client, "_http_internal", None)
+
+        if http is not None:
+            http.close()
@@ -0,0 +1,137 @@
+import mimetypes
+import os
+import uuid
+
+from google.cloud import storage
+
+from lib.common.worker_pool import WorkerPool
+
+from api.storage.storage.base.stream_reader import StreamReader
+from api.storage.storage.gcp.batch import Batch
+
+
+class CompositeUpload(object):
+    DEFAULT_PARTS = 8
+    MAX_COMPONENTS = 32
+    CHUNK_SIZE = 8 * 1024 * 1024
+    READ_SIZE = 1024 * 1024
+
+    def __init__(
+        self,
+        bucket: storage.bucket.Bucket,
+        blob: storage.blob.Blob,
+        local_file_path: str,
+        parts: int = DEFAULT_PARTS,
+    ):
+        self.bucket = bucket
+        self.blob = blob
+        self.local_file_path = local_file_path
+        self.parts = max(1, parts)
+        self.prefix = f"{blob.name}.parts/{uuid.uuid4().hex}/"
+        self.cleanup_errors = []
+
+        self.__temporaries = []
+
+    def run(self) -> storage.blob.Blob:
+        size = os.path.getsize(self.local_file_path)
+        worker_pool = WorkerPool(self.parts)
+
+        try:
+            results = worker_pool.map(
+                lambda part: self.__upload_part(*part),
+                enumerate(self.__ranges(size)),
+            )
+            errors = [result for result in results if isinstance(result, Exception)]
+
+            if errors:
+                raise errors[0]
+
+            self.__compose(results)
+        finally:
+            worker_pool.shutdown()
+            self.__delete_temporaries()
+
+        return self.blob
+
+    # private
+
+    def __ranges(self, size: int) -> list:
+        part_size = -(-size // self.parts) or 1
+
+        return [
+            (start, min(part_size, size - start))
+            for start in range(0, max(size, 1), part_size)
+        ]
+
+    def __upload_part(self, index: int, byte_range: tuple) -> storage.blob.Blob:
+        start, length = byte_range
+        part = self.bucket.blob(f"{self.prefix}{index:05d}", self.CHUNK_SIZE)
+        self.__temporaries.append(part)
+
+        part.upload_from_file(
+            StreamReader.open(self.__read_range(start, length)), size=length
+        )
+
+        return part
+
+    def __read_range(self, start: int, length: int) -> iter:
+        with open(self.local_file_path, "rb") as local_file:
+            local_file.seek(start)
+
+            while length > 0:
+                chunk = local_file.read(min(self.READ_SIZE, length))
+
+                if not chunk:
+                    return
+
+                length -= len(chunk)
+
+                yield chunk
+
+    def __compose(self, sources: list) -> None:
+        level = 0
+
+        while len(sources) > self.MAX_COMPONENTS:
+            sources = [
+                self.__compose_intermediate(level, index, sources[offset:limit])
+                for index, (offset, limit) in enumerate(self.__groups(len(sources)))
+            ]
+            level += 1
+
+        self.blob.content_type = (
+            mimetypes.guess_type(self.local_file_path)[0] or "application/octet-stream"
+        )
+        self.blob.compose(sources)
+
+    def __groups(self, count: int) -> list:
+        return [
+            (offset, offset + self.MAX_COMPONENTS)
+            for offset in range(0, count, self.MAX_COMPONENTS)
+        ]
+
+    def __compose_intermediate(
+        self, level: int, index: int, sources: list
+    ) -> storage.blob.Blob:
+        intermediate = self.bucket.blob(f"{self.prefix}compose-{level}-{index:05d}")
+        self.__temporaries.append(intermediate)
+        intermediate.compose(sources)
+
+        return intermediate
+
+    def __delete_temporaries(self) -> None:
+        temporaries = self.__temporaries
+        self.__temporaries = []
+
+        for offset in range(0, len(temporaries), Batch.MAX_SIZE):
+            limit = offset + Batch.MAX_SIZE
+
+            try:
+                with Batch(self.bucket.client) as batch:
+                    for temporary in temporaries[offset:limit]:
+                        temporary.delete()
+            except Exception as e:
+                self.cleanup_errors.append(e)
+            else:
+                self.cleanup_errors.extend(
+                    error for error in batch.errors if error is not None
+                )
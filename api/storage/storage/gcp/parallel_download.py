@@ -0,0 +1,79 @@
+import os
+
+from google.cloud import storage
+
+from lib.common.worker_pool import WorkerPool
+
+
+class ParallelDownload(object):
+    DEFAULT_THRESHOLD = 32 * 1024 * 1024
+    DEFAULT_PARTS = 8
+
+    def __init__(
+        self,
+        blob: storage.blob.Blob,
+        local_file_path: str,
+        threshold: int = DEFAULT_THRESHOLD,
+        parts: int = DEFAULT_PARTS,
+    ):
+        self.blob = blob
+        self.local_file_path = local_file_path
+        self.threshold = threshold
+        self.parts = max(1, parts)
+
+    def run(self) -> storage.blob.Blob:
+        size = self.blob.size or 0
+        temp_file_path = f"{self.local_file_path}.download"
+
+        try:
+            if size <= self.threshold:
+                self.blob.download_to_filename(temp_file_path)
+            else:
+                self.__download_ranges(temp_file_path, size)
+
+            os.replace(temp_file_path, self.local_file_path)
+        except BaseException:
+            self.__remove(temp_file_path)
+            raise
+
+        return self.blob
+
+    # private
+
+    def __download_ranges(self, temp_file_path: str, size: int) -> None:
+        with open(temp_file_path, "wb") as temp_file:
+            temp_file.truncate(size)
+
+        worker_pool = WorkerPool(self.parts)
+
+        try:
+            results = worker_pool.map(
+                lambda byte_range: self.__download_range(temp_file_path, *byte_range),
+                self.__ranges(size),
+            )
+        finally:
+            worker_pool.shutdown()
+
+        errors = [result for result in results if isinstance(result, Exception)]
+
+        if errors:
+            raise errors[0]
+
+    def __ranges(self, size: int) -> list:
+        part_size = -(-size // self.parts)
+
+        return [
+            (start, min(start + part_size, size) - 1)
+            for start in range(0, size, part_size)
+        ]
+
+    def __download_range(self, temp_file_path: str, start: int, end: int) -> None:
+        with open(temp_file_path, "r+b") as temp_file:
+            temp_file.seek(start)
+            self.blob.download_to_file(temp_file, start=start, end=end)
+
+    def __remove(self, temp_file_path: str) -> None:
+        try:
+            os.remove(temp_file_path)
+        except FileNotFoundError:
+            pass
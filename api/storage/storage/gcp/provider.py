@@ -1,5 +1,20 @@
+import functools
+import io
+
+from lib.common.checksum_cache import ChecksumCache
+from lib.common.circuit_breaker_group import CircuitBreakerGroup
+from lib.common.hedger import Hedger
+from lib.common.prefetcher import Prefetcher
+from lib.common.retry_policy import RetryPolicy
+from lib.common.worker_pool import WorkerPool
+
 from api.storage.storage.base.provider import Provider as BaseProvider
 
+from api.storage.storage.gcp.bucket_cache import BucketCache
+from api.storage.storage.gcp.blob_reader import BlobReader
+from api.storage.storage.gcp.client_pool import ClientPool
+from api.storage.storage.gcp.composite_upload import CompositeUpload
+from api.storage.storage.gcp.parallel_download import ParallelDownload
 from api.storage.storage.gcp.request import Request as GCPRequest
 from api.storage.storage.gcp.response import Response as GCPResponse
 
@@ -7,6 +22,41 @@ from api.storage.storage.gcp.response import Response as GCPResponse
 class Provider(BaseProvider):
     PROVIDER = "GCP"
 
+    def __init__(
+        self,
+        client_pool: ClientPool = None,
+        bucket_ttl: float = BucketCache.DEFAULT_TTL,
+        trust_bucket: bool = False,
+        max_workers: int = WorkerPool.DEFAULT_MAX_WORKERS,
+        upload_state_dir: str = None,
+        composite_threshold: int = None,
+        composite_parts: int = CompositeUpload.DEFAULT_PARTS,
+        download_threshold: int = ParallelDownload.DEFAULT_THRESHOLD,
+        download_parts: int = ParallelDownload.DEFAULT_PARTS,
+        read_buffer_size: int = BlobReader.DEFAULT_BUFFER_SIZE,
+        retry_policy: RetryPolicy = None,
+        circuit_breakers: CircuitBreakerGroup = None,
+        hedger: Hedger = None,
+        list_prefetch: int = Prefetcher.DEFAULT_DEPTH,
+        checksum_uploads: bool = False,
+        checksum_cache: ChecksumCache = None,
+    ):
+        super().__init__(max_workers, retry_policy, circuit_breakers)
+
+        self.client_pool = client_pool or ClientPool.default()
+        self.owns_client_pool = client_pool is not None
+        self.bucket_cache = BucketCache(bucket_ttl, trust_bucket)
+        self.upload_state_dir = upload_state_dir
+        self.composite_threshold = composite_threshold
+        self.composite_parts = composite_parts
+        self.download_threshold = download_threshold
+        self.download_parts = download_parts
+        self.read_buffer_size = read_buffer_size
+        self.hedger = hedger
+        self.list_prefetch = list_prefetch
+        self.checksum_uploads = checksum_uploads
+        self.checksum_cache = checksum_cache
+
     def set_bucket(self, bucket: str) -> None:
         self.bucket = bucket
 
@@ -14,25 +64,213 @@ class Provider(BaseProvider):
         return self.bucket
 
     def request_retrieve(self, remote_file_path: str) -> dict:
-        request = GCPRequest(self.bucket)
-        retrieve_response = request.retrieve(remote_file_path)
+        request = self.__request()
+        retrieve_response = self.__call(
+            "retrieve", self.__hedged, request.retrieve, remote_file_path
+        )
 
-        response = GCPResponse(retrieve_response)
+        response = GCPResponse(retrieve_response, True)
 
         return response.serialize()
 
     def request_upload(self, remote_file_path: str, local_file_path: str) -> dict:
-        request = GCPRequest(self.bucket)
-        upload_response = request.upload(remote_file_path, local_file_path)
+        if self.checksum_uploads:
+            return self.__request_upload_checked(remote_file_path, local_file_path)
+
+        request = self.__request()
+        upload_response = self.__call(
+            "upload",
+            request.upload,
+            remote_file_path,
+            local_file_path,
+            idempotent=False,
+        )
+
+        response = GCPResponse(upload_response, True)
 
-        response = GCPResponse(upload_response)
+        return response.serialize()
+
+    def request_upload_stream(
+        self, remote_file_path: str, source: object, chunk_size: int = None
+    ) -> dict:
+        request = self.__request()
+
+        if self.__is_replayable(source):
+            upload_response = self.__call(
+                "upload_stream",
+                self.__upload_stream_replayed,
+                request,
+                remote_file_path,
+                source,
+                chunk_size,
+                source.tell() if hasattr(source, "seek") else None,
+                idempotent=False,
+            )
+        else:
+            upload_response = self.circuit_breakers.call(
+                "upload_stream",
+                request.upload_stream,
+                remote_file_path,
+                source,
+                chunk_size,
+            )
+
+        response = GCPResponse(upload_response, True)
 
         return response.serialize()
 
+    def request_upload_resumable(
+        self, remote_file_path: str, local_file_path: str, chunk_size: int = None
+    ) -> dict:
+        request = self.__request()
+        upload_response = self.__call(
+            "upload_resumable",
+            request.upload_resumable,
+            remote_file_path,
+            local_file_path,
+            chunk_size,
+            self.upload_state_dir,
+        )
+
+        response = GCPResponse(upload_response, True)
+
+        return response.serialize()
+
+    def request_download(self, remote_file_path: str, local_file_path: str) -> dict:
+        request = self.__request()
+        download_response = self.__call(
+            "download",
+            request.download,
+            remote_file_path,
+            local_file_path,
+            self.download_threshold,
+            self.download_parts,
+        )
+
+        response = GCPResponse(download_response, True)
+
+        return response.serialize()
+
+    def request_open(self, remote_file_path: str) -> io.BufferedReader:
+        request = self.__request()
+
+        return self.__call(
+            "open", self.__hedged, request.open, remote_file_path, self.read_buffer_size
+        )
+
     def request_delete(self, remote_file_path: str) -> dict:
-        request = GCPRequest(self.bucket)
-        delete_response = request.delete(remote_file_path)
+        request = self.__request()
+        delete_response = self.__call(
+            "delete", request.delete, remote_file_path, idempotent=False
+        )
 
-        response = GCPResponse(delete_response)
+        response = GCPResponse(delete_response, False)
 
         return response.serialize()
+
+    def request_list(self, prefix: str = "", delimiter: str = None) -> iter:
+        request = self.__request()
+
+        call = functools.partial(self.__call, "list")
+
+        for result in request.list_objects(prefix, delimiter, self.list_prefetch, call):
+            if isinstance(result, str):
+                yield GCPResponse.prefix_serialize(self.bucket, result)
+            else:
+                yield GCPResponse(result).list_serialize()
+
+    def request_retrieve_many(self, remote_file_paths: list) -> list:
+        request = self.__request()
+        retrieve_responses = self.__call(
+            "retrieve_many", request.retrieve_many, remote_file_paths
+        )
+
+        return [self.__serialize(res, True) for res in retrieve_responses]
+
+    def request_delete_many(self, remote_file_paths: list) -> list:
+        request = self.__request()
+        delete_responses = self.__call(
+            "delete_many", request.delete_many, remote_file_paths, idempotent=False
+        )
+
+        return [self.__serialize(res, False) for res in delete_responses]
+
+    def invalidate_bucket(self, bucket: str = None) -> None:
+        self.bucket_cache.invalidate(bucket)
+
+    def close(self) -> None:
+        super().close()
+
+        self.bucket_cache.invalidate()
+
+        if self.owns_client_pool:
+            self.client_pool.close()
+
+        if self.hedger is not None:
+            self.hedger.shutdown()
+
+    # private
+
+    def __request(self) -> GCPRequest:
+        return GCPRequest(
+            self.bucket,
+            self.client_pool,
+            self.bucket_cache,
+            self.composite_threshold,
+            self.composite_parts,
+        )
+
+    def __request_upload_checked(
+        self, remote_file_path: str, local_file_path: str
+    ) -> dict:
+        request = self.__request()
+        upload = self.__call(
+            "upload",
+            request.upload_checked,
+            remote_file_path,
+            local_file_path,
+            self.checksum_cache,
+            idempotent=False,
+        )
+
+        response = GCPResponse(upload.blob, True)
+
+        return response.upload_serialize(upload.skipped, upload.verified)
+
+    def __call(
+        self, operation: str, function: callable, *args, idempotent: bool = True
+    ) -> object:
+        return self.circuit_breakers.call(
+            operation, self.retry_policy.call, function, *args, idempotent=idempotent
+        )
+
+    def __is_replayable(self, source: object) -> bool:
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return True
+
+        return hasattr(source, "seekable") and source.seekable()
+
+    def __upload_stream_replayed(
+        self,
+        request: GCPRequest,
+        remote_file_path: str,
+        source: object,
+        chunk_size: int,
+        position: int,
+    ) -> object:
+        if position is not None:
+            source.seek(position)
+
+        return request.upload_stream(remote_file_path, source, chunk_size)
+
+    def __hedged(self, function: callable, *args) -> object:
+        if self.hedger is None:
+            return function(*args)
+
+        return self.hedger.call(function, *args)
+
+    def __serialize(self, result: object, exists: bool) -> object:
+        if isinstance(result, Exception):
+            return result
+
+        return GCPResponse(result, exists).serialize()
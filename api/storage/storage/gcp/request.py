@@ -1,37 +1,155 @@
+import io
+import os
+
 from google.cloud import storage
 from google.cloud import exceptions
 
+from lib.common.checksum_cache import ChecksumCache
+from lib.common.prefetcher import Prefetcher
 from lib.storage import errors as StorageError
 
 from api.storage.storage.base.request import Request as BaseRequest
+from api.storage.storage.base.stream_reader import StreamReader
+from api.storage.storage.gcp.batch import Batch
+from api.storage.storage.gcp.blob_reader import BlobReader
+from api.storage.storage.gcp.bucket_cache import BucketCache
+from api.storage.storage.gcp.checksum_upload import ChecksumUpload
+from api.storage.storage.gcp.client_pool import ClientPool
+from api.storage.storage.gcp.composite_upload import CompositeUpload
+from api.storage.storage.gcp.parallel_download import ParallelDownload
+from api.storage.storage.gcp.resumable_upload import ResumableUpload
 
 
 class Request(BaseRequest):
-    def __init__(self, bucket: str):
+    DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+    LIST_FIELDS = (
+        "items(name,size,crc32c,md5Hash,generation,updated),prefixes,nextPageToken"
+    )
+
+    def __init__(
+        self,
+        bucket: str,
+        client_pool: ClientPool = None,
+        bucket_cache: BucketCache = None,
+        composite_threshold: int = None,
+        composite_parts: int = CompositeUpload.DEFAULT_PARTS,
+    ):
         self.bucket = bucket
+        self.client_pool = client_pool or ClientPool.default()
+        self.bucket_cache = bucket_cache or BucketCache(ttl=0)
+        self.composite_threshold = composite_threshold
+        self.composite_parts = composite_parts
 
     def retrieve(self, remote_file_path: str) -> storage.blob.Blob:
         blob = self.__blob_object(remote_file_path)
-        retrieve_obj = self.__retrieve_from_storage(blob, remote_file_path)
+        retrieve_obj = self.__retrieve_from_storage(blob)
 
         return retrieve_obj
 
     def upload(self, remote_file_path: str, local_file_path: str) -> storage.blob.Blob:
         blob = self.__blob_object(remote_file_path)
-        upload_obj = self.__upload_to_storage(blob, local_file_path)
+        upload_obj = self.__upload_blob(blob, local_file_path)
 
         return upload_obj
 
+    def upload_checked(
+        self,
+        remote_file_path: str,
+        local_file_path: str,
+        checksum_cache: ChecksumCache = None,
+    ) -> ChecksumUpload:
+        blob = self.__blob_object(remote_file_path)
+        upload = ChecksumUpload(
+            blob, local_file_path, self.__upload_blob, checksum_cache
+        )
+
+        try:
+            upload.run()
+        except FileNotFoundError:
+            raise StorageError.FileNotFound("uploading file not found")
+        except exceptions.NotFound as e:
+            raise self.__not_found_error(e)
+
+        return upload
+
+    def upload_stream(
+        self, remote_file_path: str, source: object, chunk_size: int = None
+    ) -> storage.blob.Blob:
+        blob = self.__blob_object(remote_file_path)
+        blob.chunk_size = chunk_size or self.DEFAULT_CHUNK_SIZE
+        upload_obj = self.__upload_stream_to_storage(blob, source)
+
+        return upload_obj
+
+    def upload_resumable(
+        self,
+        remote_file_path: str,
+        local_file_path: str,
+        chunk_size: int = None,
+        state_dir: str = None,
+    ) -> storage.blob.Blob:
+        blob = self.__blob_object(remote_file_path)
+        upload_obj = self.__upload_resumable_to_storage(
+            blob, local_file_path, chunk_size or self.DEFAULT_CHUNK_SIZE, state_dir
+        )
+
+        return upload_obj
+
+    def download(
+        self,
+        remote_file_path: str,
+        local_file_path: str,
+        threshold: int = ParallelDownload.DEFAULT_THRESHOLD,
+        parts: int = ParallelDownload.DEFAULT_PARTS,
+    ) -> storage.blob.Blob:
+        blob = self.__blob_object(remote_file_path)
+        self.__reload(blob)
+        download_obj = self.__download_from_storage(
+            blob, local_file_path, threshold, parts
+        )
+
+        return download_obj
+
+    def open(
+        self, remote_file_path: str, buffer_size: int = BlobReader.DEFAULT_BUFFER_SIZE
+    ) -> io.BufferedReader:
+        blob = self.__blob_object(remote_file_path)
+        self.__reload(blob)
+
+        return BlobReader.open(blob, buffer_size)
+
     def delete(self, remote_file_path: str) -> storage.blob.Blob:
         blob = self.__blob_object(remote_file_path)
         delete_obj = self.__delete_from_storage(blob)
 
         return delete_obj
 
+    def list_objects(
+        self,
+        prefix: str = "",
+        delimiter: str = None,
+        prefetch: int = Prefetcher.DEFAULT_DEPTH,
+        call: callable = None,
+    ) -> iter:
+        pages = Prefetcher(self.__list_pages(prefix, delimiter, call), prefetch)
+
+        try:
+            for blobs, prefixes in pages:
+                yield from blobs
+                yield from prefixes
+        finally:
+            pages.close()
+
+    def retrieve_many(self, remote_file_paths: list) -> list:
+        return self.__batch(remote_file_paths, lambda blob: blob.reload())
+
+    def delete_many(self, remote_file_paths: list) -> list:
+        return self.__batch(remote_file_paths, lambda blob: blob.delete())
+
     # private
 
     def __storage_client(self) -> storage.blob:
-        return storage.Client().get_bucket(self.bucket)
+        return self.bucket_cache.get(self.client_pool.client(), self.bucket)
 
     def __blob_object(self, remote_file_path: str) -> storage.blob.Blob:
         try:
@@ -42,19 +160,93 @@ class Request(BaseRequest):
         except exceptions.NotFound as e:
             raise StorageError.BucketNotFound(e.message)
 
-    def __check_existing(self, blob: storage.blob.Blob):
-        if not blob.exists():
-            raise StorageError.FileNotFound(
-                f"{blob.name} object is not existed in GCP storage"
+    def __list_pages(self, prefix: str, delimiter: str, call: callable) -> iter:
+        call = call or (lambda function, *args: function(*args))
+        page_token = None
+
+        while True:
+            blobs, prefixes, page_token = call(
+                self.__list_page, prefix, delimiter, page_token
             )
 
-    def __retrieve_from_storage(
-        self, blob: storage.blob.Blob, remote_file_path: str
-    ) -> storage.blob.Blob:
-        self.__check_existing(blob)
+            yield blobs, prefixes
+
+            if not page_token:
+                return
+
+    def __list_page(self, prefix: str, delimiter: str, page_token: str) -> tuple:
+        try:
+            iterator = self.__bucket_object().list_blobs(
+                page_token=page_token,
+                prefix=prefix or None,
+                delimiter=delimiter,
+                fields=self.LIST_FIELDS,
+            )
+            page = next(iterator.pages)
+
+            return list(page), list(page.prefixes), iterator.next_page_token
+        except exceptions.NotFound as e:
+            raise self.__not_found_error(e)
+
+    def __bucket_object(self) -> storage.bucket.Bucket:
+        try:
+            return self.__storage_client()
+        except exceptions.NotFound as e:
+            raise StorageError.BucketNotFound(e.message)
+
+    def __batch(self, remote_file_paths: list, operation: callable) -> list:
+        bucket = self.__bucket_object()
+        results = []
+
+        for offset in range(0, len(remote_file_paths), Batch.MAX_SIZE):
+            limit = offset + Batch.MAX_SIZE
+            chunk = remote_file_paths[offset:limit]
+            blobs = [bucket.blob(remote_file_path) for remote_file_path in chunk]
+
+            with Batch(bucket.client) as batch:
+                for blob in blobs:
+                    operation(blob)
+
+            for blob, error in zip(blobs, batch.errors):
+                results.append(self.__batch_result(blob, error))
+
+        return results
+
+    def __batch_result(self, blob: storage.blob.Blob, error: Exception) -> object:
+        if error is None:
+            return blob
+
+        if isinstance(error, exceptions.NotFound):
+            return self.__not_found_error(error)
+
+        return error
+
+    def __not_found_error(self, error: exceptions.NotFound) -> Exception:
+        if BucketCache.is_bucket_not_found(error):
+            self.bucket_cache.invalidate(self.bucket)
+            return StorageError.BucketNotFound(error.message)
+
+        return StorageError.FileNotFound(error.message)
+
+    def __reload(self, blob: storage.blob.Blob) -> None:
+        try:
+            blob.reload()
+        except exceptions.NotFound as e:
+            raise self.__not_found_error(e)
+
+    def __retrieve_from_storage(self, blob: storage.blob.Blob) -> storage.blob.Blob:
+        self.__reload(blob)
 
         return blob
 
+    def __upload_blob(
+        self, blob: storage.blob.Blob, local_file_path: str
+    ) -> storage.blob.Blob:
+        if self.__is_composite(local_file_path):
+            return self.__composite_upload_to_storage(blob, local_file_path)
+
+        return self.__upload_to_storage(blob, local_file_path)
+
     def __upload_to_storage(
         self, blob: storage.blob.Blob, local_file_path: str
     ) -> storage.blob.Blob:
@@ -62,11 +254,80 @@ class Request(BaseRequest):
             blob.upload_from_filename(local_file_path)
         except FileNotFoundError:
             raise StorageError.FileNotFound("uploading file not found")
+        except exceptions.NotFound as e:
+            raise self.__not_found_error(e)
 
         return blob
 
+    def __is_composite(self, local_file_path: str) -> bool:
+        if self.composite_threshold is None:
+            return False
+
+        try:
+            return os.path.getsize(local_file_path) > self.composite_threshold
+        except FileNotFoundError:
+            raise StorageError.FileNotFound("uploading file not found")
+
+    def __composite_upload_to_storage(
+        self, blob: storage.blob.Blob, local_file_path: str
+    ) -> storage.blob.Blob:
+        try:
+            upload = CompositeUpload(
+                blob.bucket, blob, local_file_path, self.composite_parts
+            )
+
+            return upload.run()
+        except FileNotFoundError:
+            raise StorageError.FileNotFound("uploading file not found")
+        except exceptions.NotFound as e:
+            raise self.__not_found_error(e)
+
+    def __upload_stream_to_storage(
+        self, blob: storage.blob.Blob, source: object
+    ) -> storage.blob.Blob:
+        try:
+            blob.upload_from_file(StreamReader.open(source))
+        except exceptions.NotFound as e:
+            raise self.__not_found_error(e)
+
+        return blob
+
+    def __upload_resumable_to_storage(
+        self,
+        blob: storage.blob.Blob,
+        local_file_path: str,
+        chunk_size: int,
+        state_dir: str,
+    ) -> storage.blob.Blob:
+        try:
+            upload = ResumableUpload(blob, local_file_path, chunk_size, state_dir)
+
+            return upload.run()
+        except FileNotFoundError:
+            raise StorageError.FileNotFound("uploading file not found")
+        except exceptions.NotFound as e:
+            raise self.__not_found_error(e)
+
+    def __download_from_storage(
+        self,
+        blob: storage.blob.Blob,
+        local_file_path: str,
+        threshold: int,
+        parts: int,
+    ) -> storage.blob.Blob:
+        try:
+            download = ParallelDownload(blob, local_file_path, threshold, parts)
+
+            return download.run()
+        except FileNotFoundError:
+            raise StorageError.FileNotFound("downloading destination not found")
+        except exceptions.NotFound as e:
+            raise self.__not_found_error(e)
+
     def __delete_from_storage(self, blob: storage.blob.Blob) -> storage.blob.Blob:
-        self.__check_existing(blob)
-        blob.delete()
+        try:
+            blob.delete()
+        except exceptions.NotFound as e:
+            raise self.__not_found_error(e)
 
         return blob
@@ -0,0 +1,70 @@
+from google.cloud import storage
+
+
+class Response(object):
+    def __init__(self, response: storage.blob.Blob, exists: bool = None):
+        self.response = response
+        self.existed = exists
+
+    def id(self) -> int:
+        return self.response.id
+
+    def bucket(self) -> str:
+        return self.response.bucket.name
+
+    def name(self) -> str:
+        return self.response.name
+
+    def public_url(self) -> str:
+        return self.response.public_url
+
+    def uri(self) -> str:
+        return f"gs://{self.bucket()}/{self.name()}"
+
+    def exists(self) -> bool:
+        if self.existed is not None:
+            return self.existed
+
+        return self.response.exists()
+
+    def serialize(self) -> dict:
+        return {
+            "id": self.id(),
+            "bucket": self.bucket(),
+            "name": self.name(),
+            "public_url": self.public_url(),
+            "uri": self.uri(),
+            "exists": self.exists(),
+        }
+
+    def upload_serialize(self, skipped: bool, verified: bool) -> dict:
+        return {**self.serialize(), "skipped": skipped, "verified": verified}
+
+    def list_serialize(self) -> dict:
+        updated = self.response.updated
+
+        return {
+            "bucket": self.bucket(),
+            "name": self.name(),
+            "uri": self.uri(),
+            "prefix": False,
+            "size": self.response.size,
+            "crc32c": self.response.crc32c,
+            "md5_hash": self.response.md5_hash,
+            "generation": self.response.generation,
+            "updated": updated.isoformat() if updated else None,
+        }
+
+    @staticmethod
+    def prefix_serialize(bucket: str, prefix: str) -> dict:
+        return {
+            "bucket": bucket,
+            "name": prefix,
+            "uri": f"gs://{bucket}/{prefix}",
+            "prefix": True,
+            "size": None,
+            "crc32c": None,
+            "md5_hash": None,
+            "generation": None,
+            "updated": None,
+        }
@@ -0,0 +1,186 @@
+import hashlib
+import json
+import mimetypes
+import os
+import tempfile
+
+from google.cloud import storage
+from google.resumable_media import common
+
+
+class ResumableUpload(object):
+    DEFAULT_STATE_DIR = os.path.join(
+        tempfile.gettempdir(), "cloud-services-portal", "uploads"
+    )
+    CHUNK_ALIGNMENT = 256 * 1024
+    DONE_STATUS_CODES = (200, 201)
+    INCOMPLETE_STATUS_CODE = 308
+    RESTART_STATUS_CODES = (404, 410)
+
+    def __init__(
+        self,
+        blob: storage.blob.Blob,
+        local_file_path: str,
+        chunk_size: int,
+        state_dir: str = None,
+    ):
+        if chunk_size % self.CHUNK_ALIGNMENT:
+            raise ValueError(
+                f"chunk size must be a multiple of {self.CHUNK_ALIGNMENT} bytes"
+            )
+
+        self.blob = blob
+        self.local_file_path = local_file_path
+        self.chunk_size = chunk_size
+        self.state_dir = state_dir or self.DEFAULT_STATE_DIR
+
+        stat = os.stat(local_file_path)
+
+        self.size = stat.st_size
+        self.mtime = stat.st_mtime
+        self.content_type = (
+            mimetypes.guess_type(local_file_path)[0] or "application/octet-stream"
+        )
+
+    def state_file(self) -> str:
+        key = "\n".join(
+            [
+                self.blob.bucket.name,
+                self.blob.name,
+                os.path.abspath(self.local_file_path),
+                str(self.size),
+                str(self.mtime),
+            ]
+        )
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+        return os.path.join(self.state_dir, f"{digest}.json")
+
+    def run(self) -> storage.blob.Blob:
+        transport = self.blob.client._http
+        session_url, response = self.__resume(transport)
+
+        if response is not None and response.status_code in self.DONE_STATUS_CODES:
+            self.__clear_state()
+            self.blob.reload()
+
+            return self.blob
+
+        if session_url is None:
+            session_url = self.__initiate()
+            offset = 0
+        else:
+            offset = self.__bytes_uploaded(response)
+
+        with open(self.local_file_path, "rb") as stream:
+            response = self.__transmit(transport, session_url, stream, offset)
+
+        self.__clear_state()
+        self.blob._set_properties(response.json())
+
+        return self.blob
+
+    # private
+
+    def __initiate(self) -> str:
+        session_url = self.blob.create_resumable_upload_session(
+            content_type=self.content_type, size=self.size
+        )
+
+        self.__save_state(session_url, 0)
+
+        return session_url
+
+    def __resume(self, transport: object) -> tuple:
+        state = self.__load_state()
+
+        if state is None:
+            return None, None
+
+        response = self.__put(
+            transport, state["session_url"], b"", f"bytes */{self.size}"
+        )
+
+        if response.status_code in self.RESTART_STATUS_CODES:
+            self.__clear_state()
+
+            return None, None
+
+        if response.status_code not in self.DONE_STATUS_CODES + (
+            self.INCOMPLETE_STATUS_CODE,
+        ):
+            raise common.InvalidResponse(
+                response, "unexpected status while resuming upload"
+            )
+
+        return state["session_url"], response
+
+    def __transmit(
+        self, transport: object, session_url: str, stream: object, offset: int
+    ) -> object:
+        while True:
+            stream.seek(offset)
+            chunk = stream.read(self.chunk_size)
+
+            if chunk:
+                content_range = f"bytes {offset}-{offset + len(chunk) - 1}/{self.size}"
+            else:
+                content_range = f"bytes */{self.size}"
+
+            response = self.__put(transport, session_url, chunk, content_range)
+
+            if response.status_code in self.DONE_STATUS_CODES:
+                return response
+
+            if response.status_code != self.INCOMPLETE_STATUS_CODE:
+                raise common.InvalidResponse(
+                    response, "unexpected status while uploading chunk"
+                )
+
+            offset = self.__bytes_uploaded(response)
+            self.__save_state(session_url, offset)
+
+    def __put(
+        self, transport: object, session_url: str, data: bytes, content_range: str
+    ) -> object:
+        return transport.request(
+            "PUT", session_url, data=data, headers={"content-range": content_range}
+        )
+
+    def __bytes_uploaded(self, response: object) -> int:
+        committed = response.headers.get("range")
+
+        if not committed:
+            return 0
+
+        return int(committed.rpartition("-")[2]) + 1
+
+    def __load_state(self) -> dict:
+        try:
+            with open(self.state_file()) as state_file:
+                return json.load(state_file)
+        except (OSError, ValueError):
+            return None
+
+    def __save_state(self, session_url: str, offset: int) -> None:
+        os.makedirs(self.state_dir, exist_ok=True)
+
+        state = {
+            "session_url": session_url,
+            "remote_file_path": self.blob.name,
+            "local_file_path": self.local_file_path,
+            "size": self.size,
+            "offset": offset,
+        }
+        temp_file = f"{self.state_file()}.tmp"
+
+        with open(temp_file, "w") as state_file:
+            json.dump(state, state_file)
+
+        os.replace(temp_file, self.state_file())
+
+    def __clear_state(self) -> None:
+        try:
+            os.remove(self.state_file())
+        except FileNotFoundError:
+            pass
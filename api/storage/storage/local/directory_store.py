@@ -0,0 +1,109 @@
+import datetime
+import os
+import pathlib
+import uuid
+
+from lib.common.checksum_cache import ChecksumCache
+from lib.storage import errors as StorageError
+
+
+class DirectoryStore(object):
+    TEMP_DIR = ".uploads"
+
+    def __init__(self, root: str, checksum_cache: ChecksumCache = None):
+        self.root = os.path.abspath(root)
+        self.checksum_cache = checksum_cache or ChecksumCache()
+
+    def create_bucket(self, bucket: str) -> None:
+        os.makedirs(os.path.join(self.root, bucket), exist_ok=True)
+
+    def has_bucket(self, bucket: str) -> bool:
+        return bucket != self.TEMP_DIR and os.path.isdir(
+            os.path.join(self.root, bucket)
+        )
+
+    def write(self, bucket: str, name: str, content: bytes) -> dict:
+        path = self.__path(bucket, name)
+        temp_dir = os.path.join(self.root, self.TEMP_DIR)
+        temp_file = os.path.join(temp_dir, uuid.uuid4().hex)
+
+        os.makedirs(temp_dir, exist_ok=True)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(temp_file, "wb") as local_file:
+            local_file.write(content)
+
+        os.replace(temp_file, path)
+
+        return self.stat(bucket, name)
+
+    def read(self, bucket: str, name: str) -> bytes:
+        try:
+            with open(self.__path(bucket, name), "rb") as local_file:
+                return local_file.read()
+        except (FileNotFoundError, IsADirectoryError):
+            raise StorageError.FileNotFound(f"No such object: {bucket}/{name}")
+
+    def stat(self, bucket: str, name: str) -> dict:
+        path = self.__path(bucket, name)
+
+        try:
+            stat = os.stat(path)
+            checksums = self.checksum_cache.get(path)
+        except (FileNotFoundError, IsADirectoryError):
+            raise StorageError.FileNotFound(f"No such object: {bucket}/{name}")
+
+        return {
+            "bucket": bucket,
+            "name": name,
+            "url": pathlib.Path(path).as_uri(),
+            "size": stat.st_size,
+            "md5_hash": checksums.get("md5"),
+            "crc32c": checksums.get("crc32c"),
+            "generation": stat.st_mtime_ns,
+            "updated": datetime.datetime.fromtimestamp(
+                stat.st_mtime, datetime.timezone.utc
+            ),
+        }
+
+    def delete(self, bucket: str, name: str) -> dict:
+        metadata = self.stat(bucket, name)
+
+        try:
+            os.remove(self.__path(bucket, name))
+        except FileNotFoundError:
+            raise StorageError.FileNotFound(f"No such object: {bucket}/{name}")
+
+        return metadata
+
+    def names(self, bucket: str, prefix: str = "") -> list:
+        bucket_dir = self.__bucket_dir(bucket)
+        names = []
+
+        for directory, _, file_names in os.walk(bucket_dir):
+            relative_dir = os.path.relpath(directory, bucket_dir)
+
+            for file_name in file_names:
+                name = pathlib.PurePath(relative_dir, file_name).as_posix()
+
+                if name.startswith(prefix):
+                    names.append(name)
+
+        return sorted(names)
+
+    # private
+
+    def __bucket_dir(self, bucket: str) -> str:
+        if not self.has_bucket(bucket):
+            raise StorageError.BucketNotFound(f"bucket {bucket} does not exist")
+
+        return os.path.join(self.root, bucket)
+
+    def __path(self, bucket: str, name: str) -> str:
+        bucket_dir = self.__bucket_dir(bucket)
+        path = os.path.abspath(os.path.join(bucket_dir, *name.split("/")))
+
+        if not path.startswith(bucket_dir + os.sep):
+            raise StorageError.FileNotFound(f"invalid object name: {name}")
+
+        return path
@@ -0,0 +1,77 @@
+import datetime
+import itertools
+import threading
+
+from lib.common.checksum import Checksum
+from lib.storage import errors as StorageError
+
+
+class MemoryStore(object):
+    def __init__(self):
+        self.__buckets = {}
+        self.__generations = itertools.count(1)
+        self.__lock = threading.Lock()
+
+    def create_bucket(self, bucket: str) -> None:
+        with self.__lock:
+            self.__buckets.setdefault(bucket, {})
+
+    def has_bucket(self, bucket: str) -> bool:
+        with self.__lock:
+            return bucket in self.__buckets
+
+    def write(self, bucket: str, name: str, content: bytes) -> dict:
+        checksums = Checksum.data(content)
+        metadata = {
+            "bucket": bucket,
+            "name": name,
+            "url": None,
+            "size": len(content),
+            "md5_hash": checksums.get("md5"),
+            "crc32c": checksums.get("crc32c"),
+            "generation": next(self.__generations),
+            "updated": datetime.datetime.now(datetime.timezone.utc),
+        }
+
+        with self.__lock:
+            self.__objects(bucket)[name] = (bytes(content), metadata)
+
+        return dict(metadata)
+
+    def read(self, bucket: str, name: str) -> bytes:
+        return self.__entry(bucket, name)[0]
+
+    def stat(self, bucket: str, name: str) -> dict:
+        return dict(self.__entry(bucket, name)[1])
+
+    def delete(self, bucket: str, name: str) -> dict:
+        with self.__lock:
+            objects = self.__objects(bucket)
+
+            if name not in objects:
+                raise StorageError.FileNotFound(f"No such object: {bucket}/{name}")
+
+            return dict(objects.pop(name)[1])
+
+    def names(self, bucket: str, prefix: str = "") -> list:
+        with self.__lock:
+            return sorted(
+                name for name in self.__objects(bucket) if name.startswith(prefix)
+            )
+
+    # private
+
+    def __objects(self, bucket: str) -> dict:
+        if bucket not in self.__buckets:
+            raise StorageError.BucketNotFound(f"bucket {bucket} does not exist")
+
+        return self.__buckets[bucket]
+
+    def __entry(self, bucket: str, name: str) -> tuple:
+        with self.__lock:
+            entry = self.__objects(bucket).get(name)
+
+        if entry is None:
+            raise StorageError.FileNotFound(f"No such object: {bucket}/{name}")
+
+        return entry
@@ -0,0 +1,178 @@
+import io
+
+from lib.common.circuit_breaker_group import CircuitBreakerGroup
+from lib.common.fault_injector import FaultInjector
+from lib.common.retry_policy import RetryPolicy
+from lib.common.worker_pool import WorkerPool
+
+from api.storage.storage.base.provider import Provider as BaseProvider
+
+from api.storage.storage.local.directory_store import DirectoryStore
+from api.storage.storage.local.memory_store import MemoryStore
+from api.storage.storage.local.request import Request as LocalRequest
+from api.storage.storage.local.response import Response as LocalResponse
+
+
+class Provider(BaseProvider):
+    PROVIDER = "local"
+
+    def __init__(
+        self,
+        root: str = None,
+        buckets: list = None,
+        create_buckets: bool = False,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        bandwidth: float = None,
+        error_rate: float = 0.0,
+        error_rates: dict = None,
+        errors: tuple = FaultInjector.DEFAULT_ERRORS,
+        seed: int = None,
+        distribution: str = FaultInjector.UNIFORM,
+        max_workers: int = WorkerPool.DEFAULT_MAX_WORKERS,
+        retry_policy: RetryPolicy = None,
+        circuit_breakers: CircuitBreakerGroup = None,
+    ):
+        super().__init__(max_workers, retry_policy, circuit_breakers)
+
+        self.store = DirectoryStore(root) if root else MemoryStore()
+        self.create_buckets = create_buckets
+        self.fault_injector = FaultInjector(
+            latency,
+            jitter,
+            bandwidth,
+            error_rate,
+            error_rates,
+            errors,
+            seed,
+            distribution,
+        )
+
+        for bucket in buckets or []:
+            self.store.create_bucket(bucket)
+
+    def set_bucket(self, bucket: str) -> None:
+        self.bucket = bucket
+
+    def get_bucket(self) -> str:
+        return self.bucket
+
+    def request_retrieve(self, remote_file_path: str) -> dict:
+        request = self.__request()
+        retrieve_response = self.__call("retrieve", request.retrieve, remote_file_path)
+
+        response = LocalResponse(retrieve_response, True)
+
+        return response.serialize()
+
+    def request_upload(self, remote_file_path: str, local_file_path: str) -> dict:
+        request = self.__request()
+        upload_response = self.__call(
+            "upload",
+            request.upload,
+            remote_file_path,
+            local_file_path,
+            idempotent=False,
+        )
+
+        response = LocalResponse(upload_response, True)
+
+        return response.serialize()
+
+    def request_upload_stream(
+        self, remote_file_path: str, source: object, chunk_size: int = None
+    ) -> dict:
+        request = self.__request()
+        upload_response = self.circuit_breakers.call(
+            "upload_stream", request.upload_stream, remote_file_path, source, chunk_size
+        )
+
+        response = LocalResponse(upload_response, True)
+
+        return response.serialize()
+
+    def request_upload_resumable(
+        self, remote_file_path: str, local_file_path: str, chunk_size: int = None
+    ) -> dict:
+        request = self.__request()
+        upload_response = self.__call(
+            "upload_resumable",
+            request.upload_resumable,
+            remote_file_path,
+            local_file_path,
+            chunk_size,
+        )
+
+        response = LocalResponse(upload_response, True)
+
+        return response.serialize()
+
+    def request_download(self, remote_file_path: str, local_file_path: str) -> dict:
+        request = self.__request()
+        download_response = self.__call(
+            "download", request.download, remote_file_path, local_file_path
+        )
+
+        response = LocalResponse(download_response, True)
+
+        return response.serialize()
+
+    def request_open(self, remote_file_path: str) -> io.BytesIO:
+        request = self.__request()
+
+        return self.__call("open", request.open, remote_file_path)
+
+    def request_delete(self, remote_file_path: str) -> dict:
+        request = self.__request()
+        delete_response = self.__call(
+            "delete", request.delete, remote_file_path, idempotent=False
+        )
+
+        response = LocalResponse(delete_response, False)
+
+        return response.serialize()
+
+    def request_list(self, prefix: str = "", delimiter: str = None) -> iter:
+        request = self.__request()
+
+        for result in request.list_objects(prefix, delimiter):
+            if isinstance(result, str):
+                yield LocalResponse.prefix_serialize(self.bucket, result)
+            else:
+                yield LocalResponse(result).list_serialize()
+
+    def request_retrieve_many(self, remote_file_paths: list) -> list:
+        request = self.__request()
+        retrieve_responses = self.__call(
+            "retrieve_many", request.retrieve_many, remote_file_paths
+        )
+
+        return [self.__serialize(res, True) for res in retrieve_responses]
+
+    def request_delete_many(self, remote_file_paths: list) -> list:
+        request = self.__request()
+        delete_responses = self.__call(
+            "delete_many", request.delete_many, remote_file_paths, idempotent=False
+        )
+
+        return [self.__serialize(res, False) for res in delete_responses]
+
+    # private
+
+    def __request(self) -> LocalRequest:
+        return LocalRequest(
+            self.bucket, self.store, self.fault_injector, self.create_buckets
+        )
+
+    def __call(
+        self, operation: str, function: callable, *args, idempotent: bool = True
+    ) -> object:
+        return self.circuit_breakers.call(
+            operation, self.retry_policy.call, function, *args, idempotent=idempotent
+        )
+
+    def __serialize(self, result: object, exists: bool) -> object:
+        if isinstance(result, Exception):
+            return result
+
+        return LocalResponse(result, exists).serialize()
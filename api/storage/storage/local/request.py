@@ -0,0 +1,148 @@
+import io
+import os
+import uuid
+
+from lib.common.fault_injector import FaultInjector
+from lib.storage import errors as StorageError
+
+from api.storage.storage.base.request import Request as BaseRequest
+from api.storage.storage.base.stream_reader import StreamReader
+
+
+class Request(BaseRequest):
+    MAX_BATCH_SIZE = 100
+
+    def __init__(
+        self,
+        bucket: str,
+        store: object,
+        fault_injector: FaultInjector = None,
+        create_buckets: bool = False,
+    ):
+        self.bucket = bucket
+        self.store = store
+        self.fault_injector = fault_injector or FaultInjector()
+        self.create_buckets = create_buckets
+
+    def retrieve(self, remote_file_path: str) -> dict:
+        self.fault_injector.call("retrieve")
+
+        return self.store.stat(self.bucket, remote_file_path)
+
+    def upload(self, remote_file_path: str, local_file_path: str) -> dict:
+        try:
+            with open(local_file_path, "rb") as local_file:
+                content = local_file.read()
+        except FileNotFoundError:
+            raise StorageError.FileNotFound("uploading file not found")
+
+        return self.__write("upload", remote_file_path, content)
+
+    def upload_stream(
+        self, remote_file_path: str, source: object, chunk_size: int = None
+    ) -> dict:
+        content = StreamReader.open(source).read()
+
+        return self.__write("upload_stream", remote_file_path, content)
+
+    def upload_resumable(
+        self,
+        remote_file_path: str,
+        local_file_path: str,
+        chunk_size: int = None,
+        state_dir: str = None,
+    ) -> dict:
+        return self.upload(remote_file_path, local_file_path)
+
+    def download(self, remote_file_path: str, local_file_path: str) -> dict:
+        content = self.__read("download", remote_file_path)
+        temp_file_path = f"{local_file_path}.{uuid.uuid4().hex}.download"
+
+        try:
+            with open(temp_file_path, "wb") as local_file:
+                local_file.write(content)
+        except FileNotFoundError:
+            raise StorageError.FileNotFound("downloading destination not found")
+
+        os.replace(temp_file_path, local_file_path)
+
+        return self.store.stat(self.bucket, remote_file_path)
+
+    def open(self, remote_file_path: str) -> io.BytesIO:
+        return io.BytesIO(self.__read("open", remote_file_path))
+
+    def delete(self, remote_file_path: str) -> dict:
+        self.fault_injector.call("delete")
+
+        return self.store.delete(self.bucket, remote_file_path)
+
+    def list_objects(self, prefix: str = "", delimiter: str = None) -> iter:
+        self.fault_injector.call("list")
+        prefixes = set()
+
+        for name in self.store.names(self.bucket, prefix):
+            start = len(prefix)
+            position = name.find(delimiter, start) if delimiter else -1
+
+            if position < 0:
+                try:
+                    yield self.store.stat(self.bucket, name)
+                except StorageError.FileNotFound:
+                    pass
+
+                continue
+
+            limit = position + len(delimiter)
+            prefixes.add(name[:limit])
+
+        yield from sorted(prefixes)
+
+    def retrieve_many(self, remote_file_paths: list) -> list:
+        return self.__batch("retrieve_many", remote_file_paths, self.store.stat)
+
+    def delete_many(self, remote_file_paths: list) -> list:
+        return self.__batch("delete_many", remote_file_paths, self.store.delete)
+
+    # private
+
+    def __write(self, operation: str, remote_file_path: str, content: bytes) -> dict:
+        self.fault_injector.call(operation)
+
+        if self.create_buckets:
+            self.store.create_bucket(self.bucket)
+
+        if not self.store.has_bucket(self.bucket):
+            raise StorageError.BucketNotFound(f"bucket {self.bucket} does not exist")
+
+        self.fault_injector.transfer(len(content))
+
+        return self.store.write(self.bucket, remote_file_path, content)
+
+    def __read(self, operation: str, remote_file_path: str) -> bytes:
+        self.fault_injector.call(operation)
+        content = self.store.read(self.bucket, remote_file_path)
+        self.fault_injector.transfer(len(content))
+
+        return content
+
+    def __batch(
+        self, operation: str, remote_file_paths: list, function: callable
+    ) -> list:
+        results = []
+
+        for offset in range(0, len(remote_file_paths), self.MAX_BATCH_SIZE):
+            limit = offset + self.MAX_BATCH_SIZE
+            self.fault_injector.call(operation)
+
+            if not self.store.has_bucket(self.bucket):
+                raise StorageError.BucketNotFound(
+                    f"bucket {self.bucket} does not exist"
+                )
+
+            for remote_file_path in remote_file_paths[offset:limit]:
+                try:
+                    results.append(function(self.bucket, remote_file_path))
+                except StorageError.FileNotFound as e:
+                    results.append(e)
+
+        return results
@@ -0,0 +1,64 @@
+class Response(object):
+    def __init__(self, response: dict, exists: bool = True):
+        self.response = response
+        self.existed = exists
+
+    def id(self) -> str:
+        if not self.existed:
+            return None
+
+        return f"{self.bucket()}/{self.name()}/{self.response['generation']}"
+
+    def bucket(self) -> str:
+        return self.response["bucket"]
+
+    def name(self) -> str:
+        return self.response["name"]
+
+    def public_url(self) -> str:
+        return self.response["url"]
+
+    def uri(self) -> str:
+        return f"local://{self.bucket()}/{self.name()}"
+
+    def exists(self) -> bool:
+        return self.existed
+
+    def serialize(self) -> dict:
+        return {
+            "id": self.id(),
+            "bucket": self.bucket(),
+            "name": self.name(),
+            "public_url": self.public_url(),
+            "uri": self.uri(),
+            "exists": self.exists(),
+        }
+
+    def list_serialize(self) -> dict:
+        updated = self.response["updated"]
+
+        return {
+            "bucket": self.bucket(),
+            "name": self.name(),
+            "uri": self.uri(),
+            "prefix": False,
+            "size": self.response["size"],
+            "crc32c": self.response["crc32c"],
+            "md5_hash": self.response["md5_hash"],
+            "generation": self.response["generation"],
+            "updated": updated.isoformat() if updated else None,
+        }
+
+    @staticmethod
+    def prefix_serialize(bucket: str, prefix: str) -> dict:
+        return {
+            "bucket": bucket,
+            "name": prefix,
+            "uri": f"local://{bucket}/{prefix}",
+            "prefix": True,
+            "size": None,
+            "crc32c": None,
+            "md5_hash": None,
+            "generation": None,
+            "updated": None,
+        }
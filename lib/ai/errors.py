@@ -6,3 +6,28 @@ class FileObjectNotFound(Exception):
 class ProviderNotFound(Exception):
     def __init__(self, message="Provider not found", *args, **kwargs):
         super().__init__(message, *args, **kwargs)
+
+
+class ClientPoolClosed(Exception):
+    def __init__(self, message="Client pool is closed", *args, **kwargs):
+        super().__init__(message, *args, **kwargs)
+
+
+class FeatureNotFound(Exception):
+    def __init__(self, message="Feature not found", *args, **kwargs):
+        super().__init__(message, *args, **kwargs)
+
+
+class QuotaExceeded(Exception):
+    def __init__(self, message="Quota exceeded", *args, **kwargs):
+        super().__init__(message, *args, **kwargs)
+
+
+class CircuitOpen(Exception):
+    def __init__(self, message="Circuit is open", *args, **kwargs):
+        super().__init__(message, *args, **kwargs)
+
+
+class InvalidImage(Exception):
+    def __init__(self, message="Invalid image", *args, **kwargs):
+        super().__init__(message, *args, **kwargs)
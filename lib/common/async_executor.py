@@ -0,0 +1,37 @@
+import asyncio
+import functools
+
+from concurrent.futures import ThreadPoolExecutor
+
+
+class AsyncExecutor(object):
+    DEFAULT_CONCURRENCY = 32
+
+    def __init__(self, concurrency: int = DEFAULT_CONCURRENCY):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        self.concurrency = concurrency
+
+        self.__executor = ThreadPoolExecutor(max_workers=concurrency)
+        self.__semaphores = {}
+
+    async def run(self, function: callable, *args, **kwargs) -> object:
+        loop = asyncio.get_running_loop()
+
+        async with self.__semaphore(loop):
+            return await loop.run_in_executor(
+                self.__executor, functools.partial(function, *args, **kwargs)
+            )
+
+    def shutdown(self) -> None:
+        self.__executor.shutdown(wait=True)
+        self.__semaphores = {}
+
+    # private
+
+    def __semaphore(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        if loop not in self.__semaphores:
+            self.__semaphores[loop] = asyncio.Semaphore(self.concurrency)
+
+        return self.__semaphores[loop]
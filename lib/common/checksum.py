@@ -0,0 +1,61 @@
+import base64
+import hashlib
+
+try:
+    import crcmod.predefined
+except ImportError:
+    crcmod = None
+
+
+class Checksum(object):
+    CHUNK_SIZE = 1024 * 1024
+    ALGORITHMS = ("md5", "crc32c")
+
+    @staticmethod
+    def available(algorithm: str) -> bool:
+        return algorithm == "md5" or (algorithm == "crc32c" and crcmod is not None)
+
+    @classmethod
+    def file(cls, local_file_path: str, algorithms: tuple = ALGORITHMS) -> dict:
+        with open(local_file_path, "rb") as local_file:
+            chunks = iter(lambda: local_file.read(cls.CHUNK_SIZE), b"")
+
+            return cls.__digest(chunks, algorithms)
+
+    @classmethod
+    def data(cls, content: bytes, algorithms: tuple = ALGORITHMS) -> dict:
+        return cls.__digest([content], algorithms)
+
+    @classmethod
+    def matches(cls, local: dict, remote: dict) -> bool:
+        for algorithm, remote_key in (("md5", "md5_hash"), ("crc32c", "crc32c")):
+            if remote.get(remote_key) and local.get(algorithm):
+                return remote[remote_key] == local[algorithm]
+
+        return None
+
+    # private
+
+    @classmethod
+    def __digest(cls, chunks: iter, algorithms: tuple) -> dict:
+        hashers = {
+            algorithm: cls.__hasher(algorithm)
+            for algorithm in algorithms
+            if cls.available(algorithm)
+        }
+
+        for chunk in chunks:
+            for hasher in hashers.values():
+                hasher.update(chunk)
+
+        return {
+            algorithm: base64.b64encode(hasher.digest()).decode("ascii")
+            for algorithm, hasher in hashers.items()
+        }
+
+    @staticmethod
+    def __hasher(algorithm: str) -> object:
+        if algorithm == "md5":
+            return hashlib.md5()
+
+        return crcmod.predefined.Crc("crc-32c")
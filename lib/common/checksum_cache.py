@@ -0,0 +1,79 @@
+import os
+import sqlite3
+import threading
+
+from lib.common.checksum import Checksum
+
+
+class ChecksumCache(object):
+    BUSY_TIMEOUT = 30
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+
+        self.__lock = threading.Lock()
+        self.__connection = self.__connect()
+
+    def get(
+        self, local_file_path: str, algorithms: tuple = Checksum.ALGORITHMS
+    ) -> dict:
+        key = os.path.abspath(local_file_path)
+        stat = os.stat(local_file_path)
+        algorithms = tuple(a for a in algorithms if Checksum.available(a))
+
+        with self.__lock:
+            row = self.__connection.execute(
+                "SELECT md5, crc32c FROM checksums "
+                "WHERE path = ? AND size = ? AND mtime_ns = ?",
+                (key, stat.st_size, stat.st_mtime_ns),
+            ).fetchone()
+
+        cached = dict(zip(Checksum.ALGORITHMS, row or (None, None)))
+
+        if all(cached.get(algorithm) for algorithm in algorithms):
+            self.__count("hits")
+            return {algorithm: cached[algorithm] for algorithm in algorithms}
+
+        self.__count("misses")
+        checksums = Checksum.file(local_file_path)
+
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO checksums "
+                "(path, size, mtime_ns, md5, crc32c) VALUES (?, ?, ?, ?, ?)",
+                (
+                    key,
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                    checksums.get("md5"),
+                    checksums.get("crc32c"),
+                ),
+            )
+
+        return {algorithm: checksums[algorithm] for algorithm in algorithms}
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__connection.close()
+
+    # private
+
+    def __connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self.path, timeout=self.BUSY_TIMEOUT, check_same_thread=False
+        )
+
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS checksums ("
+                "path TEXT PRIMARY KEY, size INTEGER NOT NULL, "
+                "mtime_ns INTEGER NOT NULL, md5 TEXT, crc32c TEXT)"
+            )
+
+        return connection
+
+    def __count(self, counter: str) -> None:
+        with self.__lock:
+            setattr(self, counter, getattr(self, counter) + 1)
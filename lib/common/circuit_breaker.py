@@ -0,0 +1,94 @@
+import collections
+import threading
+import time
+
+
+class CircuitBreaker(object):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    DEFAULT_FAILURE_RATE = 0.5
+    DEFAULT_WINDOW = 20
+    DEFAULT_MINIMUM_CALLS = 10
+    DEFAULT_RESET_TIMEOUT = 30.0
+
+    def __init__(
+        self,
+        name: str,
+        error: type = RuntimeError,
+        failure_rate: float = DEFAULT_FAILURE_RATE,
+        window: int = DEFAULT_WINDOW,
+        minimum_calls: int = DEFAULT_MINIMUM_CALLS,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        failure_errors: tuple = (Exception,),
+        clock: callable = time.monotonic,
+    ):
+        self.name = name
+        self.error = error
+        self.failure_rate = failure_rate
+        self.minimum_calls = min(minimum_calls, window)
+        self.reset_timeout = reset_timeout
+        self.failure_errors = failure_errors
+        self.state = self.CLOSED
+
+        self.__clock = clock
+        self.__outcomes = collections.deque(maxlen=window)
+        self.__opened_at = None
+        self.__probing = False
+        self.__lock = threading.Lock()
+
+    def call(self, function: callable, *args, **kwargs) -> object:
+        self.__before()
+
+        try:
+            result = function(*args, **kwargs)
+        except Exception as e:
+            self.__after(not isinstance(e, self.failure_errors))
+            raise
+
+        self.__after(True)
+
+        return result
+
+    # private
+
+    def __before(self) -> None:
+        with self.__lock:
+            if self.state == self.OPEN:
+                if self.__clock() - self.__opened_at < self.reset_timeout:
+                    raise self.error(f"circuit {self.name} is open")
+
+                self.state = self.HALF_OPEN
+
+            if self.state == self.HALF_OPEN:
+                if self.__probing:
+                    raise self.error(f"circuit {self.name} is half open")
+
+                self.__probing = True
+
+    def __after(self, success: bool) -> None:
+        with self.__lock:
+            if self.state == self.HALF_OPEN:
+                self.__probing = False
+
+                if success:
+                    self.state = self.CLOSED
+                else:
+                    self.__open()
+
+                return
+
+            self.__outcomes.append(success)
+            failures = self.__outcomes.count(False)
+
+            if (
+                len(self.__outcomes) >= self.minimum_calls
+                and failures / len(self.__outcomes) >= self.failure_rate
+            ):
+                self.__open()
+
+    def __open(self) -> None:
+        self.state = self.OPEN
+        self.__opened_at = self.__clock()
+        self.__outcomes.clear()
@@ -0,0 +1,28 @@
+import threading
+
+from lib.common.circuit_breaker import CircuitBreaker
+
+
+class CircuitBreakerGroup(object):
+    def __init__(self, error: type = RuntimeError, **settings):
+        self.error = error
+        self.settings = settings
+
+        self.__breakers = {}
+        self.__lock = threading.Lock()
+
+    def get(self, operation: str) -> CircuitBreaker:
+        with self.__lock:
+            if operation not in self.__breakers:
+                self.__breakers[operation] = CircuitBreaker(
+                    operation, self.error, **self.settings
+                )
+
+            return self.__breakers[operation]
+
+    def call(self, operation: str, function: callable, *args, **kwargs) -> object:
+        return self.get(operation).call(function, *args, **kwargs)
+
+    def states(self) -> dict:
+        with self.__lock:
+            return {name: breaker.state for name, breaker in self.__breakers.items()}
@@ -0,0 +1,97 @@
+import random
+import threading
+import time
+
+from google.api_core import exceptions
+
+from lib.common.token_bucket import TokenBucket
+
+
+class FaultInjector(object):
+    DEFAULT_ERRORS = (exceptions.ServiceUnavailable,)
+    UNIFORM = "uniform"
+    NORMAL = "normal"
+    EXPONENTIAL = "exponential"
+    DISTRIBUTIONS = (UNIFORM, NORMAL, EXPONENTIAL)
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        bandwidth: float = None,
+        error_rate: float = 0.0,
+        error_rates: dict = None,
+        errors: tuple = DEFAULT_ERRORS,
+        seed: int = None,
+        distribution: str = UNIFORM,
+        sleep: callable = time.sleep,
+        clock: callable = time.monotonic,
+    ):
+        if distribution not in self.DISTRIBUTIONS:
+            raise ValueError(f"latency distribution {distribution} is not available")
+
+        self.latency = latency
+        self.jitter = jitter
+        self.bandwidth = bandwidth
+        self.error_rate = error_rate
+        self.error_rates = error_rates or {}
+        self.errors = errors
+        self.distribution = distribution
+        self.calls = 0
+        self.failures = 0
+        self.transferred = 0
+
+        self.__random = random.Random(seed)
+        self.__sleep = sleep
+        self.__bucket = TokenBucket(bandwidth, clock=clock) if bandwidth else None
+        self.__lock = threading.Lock()
+
+    def call(self, operation: str) -> None:
+        with self.__lock:
+            self.calls += 1
+            delay = self.__delay()
+            failed = self.__random.random() < self.error_rates.get(
+                operation, self.error_rate
+            )
+            error = self.__random.choice(self.errors) if failed else None
+
+            if failed:
+                self.failures += 1
+
+        if delay > 0:
+            self.__sleep(delay)
+
+        if error is not None:
+            raise error(f"injected failure in {operation}")
+
+    def transfer(self, size: int) -> None:
+        with self.__lock:
+            self.transferred += size
+
+            if self.__bucket is None or size <= 0:
+                return
+
+            self.__bucket.take(size)
+            delay = self.__bucket.wait_time(0)
+
+        if delay > 0:
+            self.__sleep(delay)
+
+    def stats(self) -> dict:
+        with self.__lock:
+            return {
+                "calls": self.calls,
+                "failures": self.failures,
+                "transferred": self.transferred,
+            }
+
+    # private
+
+    def __delay(self) -> float:
+        if self.distribution == self.NORMAL:
+            return max(0.0, self.__random.gauss(self.latency, self.jitter))
+
+        if self.distribution == self.EXPONENTIAL and self.jitter > 0:
+            return self.latency + self.__random.expovariate(1 / self.jitter)
+
+        return self.latency + self.__random.uniform(0, self.jitter)
@@ -0,0 +1,110 @@
+import collections
+import threading
+import time
+
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+
+from lib.common.worker_pool import WorkerPool
+
+
+class Hedger(object):
+    DEFAULT_PERCENTILE = 95
+    DEFAULT_WINDOW = 200
+    DEFAULT_MIN_SAMPLES = 20
+    DEFAULT_MAX_HEDGES = 2
+
+    def __init__(
+        self,
+        percentile: float = DEFAULT_PERCENTILE,
+        window: int = DEFAULT_WINDOW,
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+        max_workers: int = WorkerPool.DEFAULT_MAX_WORKERS,
+        max_hedges: int = DEFAULT_MAX_HEDGES,
+        clock: callable = time.monotonic,
+    ):
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.worker_pool = WorkerPool(max_workers)
+        self.hedge_pool = WorkerPool(max_hedges)
+        self.hedges = 0
+        self.skipped_hedges = 0
+
+        self.__clock = clock
+        self.__samples = collections.deque(maxlen=window)
+        self.__hedge_slots = threading.BoundedSemaphore(max_hedges)
+        self.__lock = threading.Lock()
+
+    def threshold(self) -> float:
+        with self.__lock:
+            if len(self.__samples) < self.min_samples:
+                return None
+
+            samples = sorted(self.__samples)
+
+        index = min(len(samples) - 1, int(len(samples) * self.percentile / 100))
+
+        return samples[index]
+
+    def call(self, function: callable, *args, **kwargs) -> object:
+        threshold = self.threshold()
+        started = threading.Event()
+        pending = {
+            self.worker_pool.submit(self.__timed, started, function, *args, **kwargs)
+        }
+
+        if threshold is not None:
+            started.wait()
+            done, _ = wait(pending, timeout=threshold)
+
+            hedge = None if done else self.__hedge(function, *args, **kwargs)
+
+            if hedge is not None:
+                pending.add(hedge)
+
+        error = None
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+
+                error = error or future.exception()
+
+        raise error
+
+    def shutdown(self) -> None:
+        self.worker_pool.shutdown()
+        self.hedge_pool.shutdown()
+
+    # private
+
+    def __hedge(self, function: callable, *args, **kwargs) -> Future:
+        if not self.__hedge_slots.acquire(blocking=False):
+            with self.__lock:
+                self.skipped_hedges += 1
+
+            return None
+
+        future = self.hedge_pool.submit(
+            self.__timed, threading.Event(), function, *args, **kwargs
+        )
+        future.add_done_callback(lambda _: self.__hedge_slots.release())
+
+        with self.__lock:
+            self.hedges += 1
+
+        return future
+
+    def __timed(
+        self, started: threading.Event, function: callable, *args, **kwargs
+    ) -> object:
+        started.set()
+        started_at = self.__clock()
+        result = function(*args, **kwargs)
+
+        with self.__lock:
+            self.__samples.append(self.__clock() - started_at)
+
+        return result
@@ -0,0 +1,64 @@
+import threading
+import time
+
+from collections import OrderedDict
+
+
+class MemoryCache(object):
+    DEFAULT_MAX_ENTRIES = 1024
+    DEFAULT_TTL = 3600
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: float = DEFAULT_TTL,
+        clock: callable = time.monotonic,
+    ):
+        if max_entries < 1:
+            raise ValueError("cache needs room for at least 1 entry")
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+        self.__clock = clock
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get(self, key: str) -> object:
+        with self.__lock:
+            entry = self.__entries.get(key)
+
+            if entry is None or entry[1] <= self.__clock():
+                self.__entries.pop(key, None)
+                self.misses += 1
+                return None
+
+            self.__entries.move_to_end(key)
+            self.hits += 1
+
+            return entry[0]
+
+    def set(self, key: str, value: object) -> None:
+        with self.__lock:
+            self.__entries[key] = (value, self.__clock() + self.ttl)
+            self.__entries.move_to_end(key)
+
+            while len(self.__entries) > self.max_entries:
+                self.__entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        with self.__lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self.__entries),
+            }
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+
+    def close(self) -> None:
+        self.clear()
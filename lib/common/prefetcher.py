@@ -0,0 +1,60 @@
+import queue
+import threading
+
+
+class Prefetcher(object):
+    DEFAULT_DEPTH = 1
+    PUT_TIMEOUT = 0.1
+
+    def __init__(self, iterable: iter, depth: int = DEFAULT_DEPTH):
+        self.iterable = iterable
+
+        self.__queue = queue.Queue(maxsize=depth)
+        self.__closed = threading.Event()
+        self.__thread = None
+
+    def __iter__(self) -> "Prefetcher":
+        return self
+
+    def __next__(self) -> object:
+        if self.__thread is None:
+            self.__thread = threading.Thread(target=self.__fill, daemon=True)
+            self.__thread.start()
+
+        kind, value = self.__queue.get()
+
+        if kind == "error":
+            self.close()
+            raise value
+
+        if kind == "done":
+            self.close()
+            raise StopIteration
+
+        return value
+
+    def close(self) -> None:
+        self.__closed.set()
+
+    # private
+
+    def __fill(self) -> None:
+        try:
+            for item in self.iterable:
+                if not self.__put(("item", item)):
+                    return
+        except Exception as e:
+            self.__put(("error", e))
+            return
+
+        self.__put(("done", None))
+
+    def __put(self, entry: tuple) -> bool:
+        while not self.__closed.is_set():
+            try:
+                self.__queue.put(entry, timeout=self.PUT_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+
+        return False
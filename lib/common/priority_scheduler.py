@@ -0,0 +1,68 @@
+import heapq
+import itertools
+import threading
+import time
+
+from lib.common.rate_limiter import RateLimiter
+
+
+class PriorityScheduler(object):
+    INTERACTIVE = 0
+    BACKFILL = 10
+
+    def __init__(self, rate_limiter: RateLimiter, clock: callable = time.monotonic):
+        self.rate_limiter = rate_limiter
+
+        self.__clock = clock
+        self.__waiting = []
+        self.__counter = itertools.count()
+        self.__condition = threading.Condition()
+
+    def acquire(
+        self,
+        features: list,
+        tokens: int = 1,
+        priority: int = INTERACTIVE,
+        timeout: float = None,
+    ) -> bool:
+        deadline = None if timeout is None else self.__clock() + timeout
+        ticket = (priority, next(self.__counter))
+
+        with self.__condition:
+            heapq.heappush(self.__waiting, ticket)
+
+            try:
+                while True:
+                    wait = self.__reserve(ticket, features, tokens)
+
+                    if wait == 0.0:
+                        return True
+
+                    if deadline is not None:
+                        remaining = deadline - self.__clock()
+
+                        if remaining <= 0:
+                            return False
+
+                        wait = remaining if wait is None else min(wait, remaining)
+
+                    self.__condition.wait(wait)
+            finally:
+                self.__waiting.remove(ticket)
+                heapq.heapify(self.__waiting)
+                self.__condition.notify_all()
+
+    def exhausted(self, features: list) -> None:
+        self.rate_limiter.drain(features)
+
+    def pending(self) -> int:
+        with self.__condition:
+            return len(self.__waiting)
+
+    # private
+
+    def __reserve(self, ticket: tuple, features: list, tokens: int) -> float:
+        if self.__waiting[0] != ticket:
+            return None
+
+        return self.rate_limiter.reserve(features, tokens)
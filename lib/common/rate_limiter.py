@@ -0,0 +1,67 @@
+import threading
+import time
+
+from lib.common.token_bucket import TokenBucket
+
+
+class RateLimiter(object):
+    __shared = {}
+    __shared_options = {}
+    __shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        rate: float = None,
+        feature_rates: dict = None,
+        clock: callable = time.monotonic,
+    ):
+        self.bucket = TokenBucket(rate, clock=clock) if rate else None
+        self.feature_buckets = {
+            feature: TokenBucket(feature_rate, clock=clock)
+            for feature, feature_rate in (feature_rates or {}).items()
+        }
+
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, project: str, **kwargs) -> "RateLimiter":
+        with cls.__shared_lock:
+            if project not in cls.__shared:
+                cls.__shared[project] = cls(**kwargs)
+                cls.__shared_options[project] = kwargs
+            elif kwargs and kwargs != cls.__shared_options[project]:
+                raise ValueError(
+                    f"rate limiter for {project} is already shared with other options"
+                )
+
+            return cls.__shared[project]
+
+    def reserve(self, features: list, tokens: float = 1) -> float:
+        charges = self.__charges(features, tokens)
+
+        with self.__lock:
+            wait = max([bucket.wait_time(charge) for bucket, charge in charges] + [0.0])
+
+            if wait == 0.0:
+                for bucket, charge in charges:
+                    bucket.take(charge)
+
+            return wait
+
+    def drain(self, features: list) -> None:
+        for bucket, _ in self.__charges(features, 0):
+            bucket.drain()
+
+    # private
+
+    def __charges(self, features: list, tokens: float) -> list:
+        charges = [
+            (self.feature_buckets[f], tokens)
+            for f in features
+            if f in self.feature_buckets
+        ]
+
+        if self.bucket is not None:
+            charges.append((self.bucket, tokens * max(1, len(features))))
+
+        return charges
@@ -0,0 +1,103 @@
+import random
+import threading
+import time
+
+import requests
+
+from google.api_core import exceptions
+
+
+class RetryPolicy(object):
+    DEFAULT_MAX_ATTEMPTS = 5
+    DEFAULT_DEADLINE = 60.0
+    DEFAULT_INITIAL_BACKOFF = 0.2
+    DEFAULT_MAX_BACKOFF = 10.0
+    DEFAULT_MULTIPLIER = 2.0
+    REJECTED_ERRORS = (exceptions.TooManyRequests,)
+    TRANSIENT_ERRORS = (
+        exceptions.InternalServerError,
+        exceptions.BadGateway,
+        exceptions.ServiceUnavailable,
+        exceptions.GatewayTimeout,
+        requests.exceptions.ConnectionError,
+        requests.exceptions.ChunkedEncodingError,
+        ConnectionError,
+    )
+
+    def __init__(
+        self,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        deadline: float = DEFAULT_DEADLINE,
+        initial_backoff: float = DEFAULT_INITIAL_BACKOFF,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        multiplier: float = DEFAULT_MULTIPLIER,
+        retryable: tuple = (),
+        clock: callable = time.monotonic,
+        sleep: callable = time.sleep,
+    ):
+        if max_attempts < 1:
+            raise ValueError("retry policy needs at least 1 attempt")
+
+        self.max_attempts = max_attempts
+        self.deadline = deadline
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.multiplier = multiplier
+        self.rejected_errors = self.REJECTED_ERRORS + tuple(retryable)
+        self.calls = 0
+        self.retries = 0
+        self.failures = 0
+
+        self.__clock = clock
+        self.__sleep = sleep
+        self.__lock = threading.Lock()
+
+    def call(
+        self, function: callable, *args, idempotent: bool = True, **kwargs
+    ) -> object:
+        started_at = self.__clock()
+        self.__count("calls")
+
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                return function(*args, **kwargs)
+            except Exception as e:
+                backoff = self.backoff(attempt)
+
+                if (
+                    attempt == self.max_attempts
+                    or not self.is_retryable(e, idempotent)
+                    or self.__clock() - started_at + backoff > self.deadline
+                ):
+                    self.__count("failures")
+                    raise
+
+            self.__count("retries")
+            self.__sleep(backoff)
+
+    def is_retryable(self, error: Exception, idempotent: bool = True) -> bool:
+        if isinstance(error, self.rejected_errors):
+            return True
+
+        return idempotent and isinstance(error, self.TRANSIENT_ERRORS)
+
+    def backoff(self, attempt: int) -> float:
+        ceiling = min(
+            self.max_backoff, self.initial_backoff * self.multiplier ** (attempt - 1)
+        )
+
+        return random.uniform(0, ceiling)
+
+    def stats(self) -> dict:
+        with self.__lock:
+            return {
+                "calls": self.calls,
+                "retries": self.retries,
+                "failures": self.failures,
+            }
+
+    # private
+
+    def __count(self, counter: str) -> None:
+        with self.__lock:
+            setattr(self, counter, getattr(self, counter) + 1)
@@ -0,0 +1,123 @@
+import json
+import sqlite3
+import threading
+import time
+
+
+class SQLiteCache(object):
+    DEFAULT_MAX_ENTRIES = 100000
+    DEFAULT_TTL = 86400
+    DEFAULT_ACCESS_RESOLUTION = 60
+    EVICT_INTERVAL = 1000
+    BUSY_TIMEOUT = 30
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: float = DEFAULT_TTL,
+        access_resolution: float = DEFAULT_ACCESS_RESOLUTION,
+        clock: callable = time.time,
+    ):
+        if max_entries < 1:
+            raise ValueError("cache needs room for at least 1 entry")
+
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.access_resolution = access_resolution
+        self.evict_interval = max(1, min(self.EVICT_INTERVAL, max_entries // 10))
+        self.hits = 0
+        self.misses = 0
+
+        self.__clock = clock
+        self.__lock = threading.Lock()
+        self.__sets = 0
+        self.__connection = self.__connect()
+
+    def get(self, key: str) -> object:
+        now = self.__clock()
+
+        with self.__lock, self.__connection:
+            row = self.__connection.execute(
+                "SELECT value, expires_at, accessed_at FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+            if row is None or row[1] <= now:
+                self.__connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self.misses += 1
+                return None
+
+            if now - row[2] >= self.access_resolution:
+                self.__connection.execute(
+                    "UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+
+            self.hits += 1
+
+        return json.loads(row[0])
+
+    def set(self, key: str, value: object) -> None:
+        now = self.__clock()
+
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO entries (key, value, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), now + self.ttl, now),
+            )
+            self.__evict(now)
+
+    def stats(self) -> dict:
+        with self.__lock:
+            size = self.__connection.execute("SELECT COUNT(*) FROM entries").fetchone()
+
+            return {"hits": self.hits, "misses": self.misses, "size": size[0]}
+
+    def clear(self) -> None:
+        with self.__lock, self.__connection:
+            self.__connection.execute("DELETE FROM entries")
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__connection.close()
+
+    # private
+
+    def __connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self.path, timeout=self.BUSY_TIMEOUT, check_same_thread=False
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS entries_expires_at ON entries (expires_at)"
+            )
+
+        return connection
+
+    def __evict(self, now: float) -> None:
+        self.__sets += 1
+
+        if self.__sets % self.evict_interval:
+            return
+
+        self.__connection.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+        size = self.__connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+        if size > self.max_entries:
+            self.__connection.execute(
+                "DELETE FROM entries WHERE key IN ("
+                "SELECT key FROM entries ORDER BY accessed_at LIMIT ?)",
+                (size - self.max_entries,),
+            )
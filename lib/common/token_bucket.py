@@ -0,0 +1,54 @@
+import threading
+import time
+
+
+class TokenBucket(object):
+    def __init__(
+        self, rate: float, capacity: float = None, clock: callable = time.monotonic
+    ):
+        if rate <= 0:
+            raise ValueError("token bucket rate must be positive")
+
+        self.rate = rate
+        self.capacity = capacity or rate
+
+        self.__clock = clock
+        self.__tokens = self.capacity
+        self.__updated_at = clock()
+        self.__lock = threading.Lock()
+
+    def wait_time(self, tokens: float = 1) -> float:
+        with self.__lock:
+            self.__refill()
+
+            return max(0.0, (min(tokens, self.capacity) - self.__tokens) / self.rate)
+
+    def take(self, tokens: float = 1) -> None:
+        with self.__lock:
+            self.__refill()
+            self.__tokens -= tokens
+
+    def try_acquire(self, tokens: float = 1) -> bool:
+        with self.__lock:
+            self.__refill()
+
+            if self.__tokens < min(tokens, self.capacity):
+                return False
+
+            self.__tokens -= tokens
+
+            return True
+
+    def drain(self) -> None:
+        with self.__lock:
+            self.__refill()
+            self.__tokens = min(self.__tokens, 0.0)
+
+    # private
+
+    def __refill(self) -> None:
+        now = self.__clock()
+        elapsed = max(0.0, now - self.__updated_at)
+
+        self.__tokens = min(self.capacity, self.__tokens + elapsed * self.rate)
+        self.__updated_at = now
@@ -0,0 +1,55 @@
+import threading
+
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class WorkerPool(object):
+    DEFAULT_MAX_WORKERS = 8
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        if max_workers < 1:
+            raise ValueError("worker pool needs at least 1 worker")
+
+        self.max_workers = max_workers
+
+        self.__executor = None
+        self.__lock = threading.Lock()
+
+    def submit(self, function: callable, *args, **kwargs) -> Future:
+        return self.__get_executor().submit(function, *args, **kwargs)
+
+    def map(self, function: callable, items: list, max_in_flight: int = None) -> list:
+        in_flight = threading.BoundedSemaphore(max_in_flight or self.max_workers)
+        futures = []
+
+        for item in items:
+            in_flight.acquire()
+
+            future = self.submit(function, item)
+            future.add_done_callback(lambda _: in_flight.release())
+            futures.append(future)
+
+        return [self.__result(future) for future in futures]
+
+    def shutdown(self) -> None:
+        with self.__lock:
+            if self.__executor is not None:
+                self.__executor.shutdown(wait=True)
+                self.__executor = None
+
+    # private
+
+    def __get_executor(self) -> ThreadPoolExecutor:
+        with self.__lock:
+            if self.__executor is None:
+                self.__executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+            return self.__executor
+
+    def __result(self, future: Future) -> object:
+        error = future.exception()
+
+        if error is not None:
+            return error
+
+        return future.result()
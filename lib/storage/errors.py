@@ -11,3 +11,18 @@ class FileNotFound(Exception):
 class ProviderNotFound(Exception):
     def __init__(self, message="Provider not found", *args, **kwargs):
         super().__init__(message, *args, **kwargs)
+
+
+class ClientPoolClosed(Exception):
+    def __init__(self, message="Client pool is closed", *args, **kwargs):
+        super().__init__(message, *args, **kwargs)
+
+
+class CircuitOpen(Exception):
+    def __init__(self, message="Circuit is open", *args, **kwargs):
+        super().__init__(message, *args, **kwargs)
+
+
+class ChecksumMismatch(Exception):
+    def __init__(self, message="Checksum mismatch", *args, **kwargs):
+        super().__init__(message, *args, **kwargs)
@@ -1,11 +1,20 @@
+import asyncio
+import copy
+import io
+
+from lib.common.async_executor import AsyncExecutor
+from lib.common.checksum_cache import ChecksumCache
+from lib.common.worker_pool import WorkerPool
 from lib.storage import errors as StorageError
 
+from api.storage.storage.base.directory_sync import DirectorySync
 from api.storage.storage.gcp.provider import Provider as GCPProvider
+from api.storage.storage.local.provider import Provider as LocalProvider
 
 
 class StorageService(object):
-    def __init__(self, identifier):
-        self.provider = self.__from_identifier(identifier)()
+    def __init__(self, identifier, **options):
+        self.provider = self.__from_identifier(identifier)(**options)
 
     def get_bucket(self) -> str:
         return self.provider.bucket
@@ -13,6 +22,13 @@ class StorageService(object):
     def set_bucket(self, bucket: str) -> None:
         return self.provider.set_bucket(bucket)
 
+    def for_bucket(self, bucket: str) -> "StorageService":
+        service = copy.copy(self)
+        service.provider = copy.copy(self.provider)
+        service.set_bucket(bucket)
+
+        return service
+
     def request_retrieve(self, remote_file_path: str) -> dict:
         try:
             return self.provider.request_retrieve(remote_file_path)
@@ -29,6 +45,50 @@ class StorageService(object):
         except StorageError.FileNotFound:
             raise StorageError.FileNotFound
 
+    def request_upload_many(self, files: list, max_workers: int = None) -> dict:
+        try:
+            return self.provider.request_upload_many(files, max_workers)
+        except StorageError.BucketNotFound:
+            raise StorageError.BucketNotFound
+
+    def request_upload_stream(
+        self, remote_file_path: str, source: object, chunk_size: int = None
+    ) -> dict:
+        try:
+            return self.provider.request_upload_stream(
+                remote_file_path, source, chunk_size
+            )
+        except StorageError.BucketNotFound:
+            raise StorageError.BucketNotFound
+
+    def request_upload_resumable(
+        self, remote_file_path: str, local_file_path: str, chunk_size: int = None
+    ) -> dict:
+        try:
+            return self.provider.request_upload_resumable(
+                remote_file_path, local_file_path, chunk_size
+            )
+        except StorageError.BucketNotFound:
+            raise StorageError.BucketNotFound
+        except StorageError.FileNotFound:
+            raise StorageError.FileNotFound
+
+    def request_download(self, remote_file_path: str, local_file_path: str) -> dict:
+        try:
+            return self.provider.request_download(remote_file_path, local_file_path)
+        except StorageError.BucketNotFound:
+            raise StorageError.BucketNotFound
+        except StorageError.FileNotFound:
+            raise StorageError.FileNotFound
+
+    def request_open(self, remote_file_path: str) -> io.BufferedIOBase:
+        try:
+            return self.provider.request_open(remote_file_path)
+        except StorageError.BucketNotFound:
+            raise StorageError.BucketNotFound
+        except StorageError.FileNotFound:
+            raise StorageError.FileNotFound
+
     def request_delete(self, remote_file_path: str) -> dict:
         try:
             return self.provider.request_delete(remote_file_path)
@@ -37,6 +97,63 @@ class StorageService(object):
         except StorageError.FileNotFound:
             raise StorageError.FileNotFound
 
+    def request_list(self, prefix: str = "", delimiter: str = None) -> iter:
+        try:
+            yield from self.provider.request_list(prefix, delimiter)
+        except StorageError.BucketNotFound:
+            raise StorageError.BucketNotFound
+
+    def sync(
+        self,
+        local_dir: str,
+        remote_prefix: str,
+        direction: str = DirectorySync.UPLOAD,
+        compare: str = DirectorySync.SIZE_MTIME,
+        delete: bool = False,
+        dry_run: bool = False,
+        checksum_cache: ChecksumCache = None,
+        max_workers: int = WorkerPool.DEFAULT_MAX_WORKERS,
+    ) -> dict:
+        directory_sync = DirectorySync(
+            self,
+            local_dir,
+            remote_prefix,
+            direction,
+            compare,
+            delete,
+            checksum_cache,
+            max_workers,
+        )
+
+        try:
+            return directory_sync.run(dry_run)
+        except StorageError.BucketNotFound:
+            raise StorageError.BucketNotFound
+
+    def request_retrieve_many(self, remote_file_paths: list) -> list:
+        try:
+            return self.provider.request_retrieve_many(remote_file_paths)
+        except StorageError.BucketNotFound:
+            raise StorageError.BucketNotFound
+
+    def request_delete_many(self, remote_file_paths: list) -> list:
+        try:
+            return self.provider.request_delete_many(remote_file_paths)
+        except StorageError.BucketNotFound:
+            raise StorageError.BucketNotFound
+
+    def invalidate_bucket(self, bucket: str = None) -> None:
+        return self.provider.invalidate_bucket(bucket)
+
+    def close(self) -> None:
+        self.provider.close()
+
+    def __enter__(self) -> "StorageService":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
     # private
 
     def __from_identifier(self, identifier: str) -> GCPProvider:
@@ -50,4 +167,104 @@ class StorageService(object):
         return provider
 
     def __available_providers(self) -> dict:
-        return {"gcp": GCPProvider}
+        return {"gcp": GCPProvider, "local": LocalProvider}
+
+
+class AsyncStorageService(object):
+    def __init__(
+        self,
+        identifier,
+        concurrency: int = AsyncExecutor.DEFAULT_CONCURRENCY,
+        **options,
+    ):
+        self.service = StorageService(identifier, **options)
+        self.executor = AsyncExecutor(concurrency)
+
+    def get_bucket(self) -> str:
+        return self.service.get_bucket()
+
+    def set_bucket(self, bucket: str) -> None:
+        return self.service.set_bucket(bucket)
+
+    async def request_retrieve(self, remote_file_path: str) -> dict:
+        return await self.executor.run(self.service.request_retrieve, remote_file_path)
+
+    async def request_upload(self, remote_file_path: str, local_file_path: str) -> dict:
+        return await self.executor.run(
+            self.service.request_upload, remote_file_path, local_file_path
+        )
+
+    async def request_upload_many(self, files: list, max_workers: int = None) -> dict:
+        return await self.executor.run(
+            self.service.request_upload_many, files, max_workers
+        )
+
+    async def request_upload_stream(
+        self, remote_file_path: str, source: object, chunk_size: int = None
+    ) -> dict:
+        return await self.executor.run(
+            self.service.request_upload_stream, remote_file_path, source, chunk_size
+        )
+
+    async def request_upload_resumable(
+        self, remote_file_path: str, local_file_path: str, chunk_size: int = None
+    ) -> dict:
+        return await self.executor.run(
+            self.service.request_upload_resumable,
+            remote_file_path,
+            local_file_path,
+            chunk_size,
+        )
+
+    async def request_download(
+        self, remote_file_path: str, local_file_path: str
+    ) -> dict:
+        return await self.executor.run(
+            self.service.request_download, remote_file_path, local_file_path
+        )
+
+    async def request_open(self, remote_file_path: str) -> io.BufferedIOBase:
+        return await self.executor.run(self.service.request_open, remote_file_path)
+
+    async def request_delete(self, remote_file_path: str) -> dict:
+        return await self.executor.run(self.service.request_delete, remote_file_path)
+
+    async def request_list(self, prefix: str = "", delimiter: str = None) -> iter:
+        results = self.service.request_list(prefix, delimiter)
+        done = object()
+
+        while True:
+            result = await self.executor.run(next, results, done)
+
+            if result is done:
+                return
+
+            yield result
+
+    async def sync(self, local_dir: str, remote_prefix: str, **options) -> dict:
+        return await self.executor.run(
+            self.service.sync, local_dir, remote_prefix, **options
+        )
+
+    async def request_retrieve_many(self, remote_file_paths: list) -> list:
+        return await self.executor.run(
+            self.service.request_retrieve_many, remote_file_paths
+        )
+
+    async def request_delete_many(self, remote_file_paths: list) -> list:
+        return await self.executor.run(
+            self.service.request_delete_many, remote_file_paths
+        )
+
+    def invalidate_bucket(self, bucket: str = None) -> None:
+        return self.service.invalidate_bucket(bucket)
+
+    async def close(self) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.executor.shutdown)
+        self.service.close()
+
+    async def __aenter__(self) -> "AsyncStorageService":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
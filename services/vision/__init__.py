@@ -1,24 +1,111 @@
+import asyncio
+import hashlib
+
 from lib.ai import errors as AIError
+from lib.common.async_executor import AsyncExecutor
+from lib.common.priority_scheduler import PriorityScheduler
 
+from api.ai.vision.base.batch_job import BatchJob
+from api.ai.vision.base.image_preprocessor import ImagePreprocessor
+from api.ai.vision.base.perceptual_index import PerceptualIndex
+from api.ai.vision.fake.provider import Provider as FakeProvider
 from api.ai.vision.gcp.provider import Provider as GCPProvider
 
+from services.storage import StorageService
+
 
 class VisionService(object):
-    def __init__(self, identifier):
-        self.provider = self.__from_identifier(identifier)()
+    DEFAULT_FEATURES = ["web", "logo"]
+    OPERATION_FEATURES = {"web_detection": ["web"], "logo_detection": ["logo"]}
+
+    def __init__(
+        self,
+        identifier,
+        cache: object = None,
+        preprocessor: ImagePreprocessor = None,
+        dedup: PerceptualIndex = None,
+        scheduler: PriorityScheduler = None,
+        priority: int = PriorityScheduler.INTERACTIVE,
+        **options,
+    ):
+        self.provider = self.__from_identifier(identifier)(**options)
+        self.cache = cache
+        self.preprocessor = preprocessor or ImagePreprocessor()
+        self.dedup = dedup
+        self.scheduler = scheduler
+        self.priority = priority
 
     def request_web_detection(self, uri: str) -> list:
         try:
-            return self.provider.request_web_detection(uri)
+            return self.__cached(
+                "web_detection", [], uri, self.provider.request_web_detection
+            )
         except AIError.FileObjectNotFound:
             raise AIError.FileObjectNotFound
 
     def request_logo_detection(self, uri: str) -> list:
         try:
-            return self.provider.request_logo_detection(uri)
+            return self.__cached(
+                "logo_detection", [], uri, self.provider.request_logo_detection
+            )
+        except AIError.FileObjectNotFound:
+            raise AIError.FileObjectNotFound
+
+    def request_annotate(self, uri: str, features: list = None) -> dict:
+        features = features or self.DEFAULT_FEATURES
+
+        try:
+            return self.__cached(
+                "annotate",
+                features,
+                uri,
+                lambda uri: self.provider.request_annotate(uri, features),
+            )
         except AIError.FileObjectNotFound:
             raise AIError.FileObjectNotFound
 
+    def request_web_detection_many(self, uris: list) -> list:
+        return self.__cached_many(
+            "web_detection", uris, self.provider.request_web_detection_many
+        )
+
+    def request_logo_detection_many(self, uris: list) -> list:
+        return self.__cached_many(
+            "logo_detection", uris, self.provider.request_logo_detection_many
+        )
+
+    def request_web_detection_job(
+        self,
+        uris: list,
+        output_uri: str,
+        storage: StorageService = None,
+        batch_size: int = BatchJob.DEFAULT_BATCH_SIZE,
+    ) -> BatchJob:
+        return self.provider.request_web_detection_job(
+            uris, output_uri, storage or self.__job_storage(), batch_size
+        )
+
+    def request_logo_detection_job(
+        self,
+        uris: list,
+        output_uri: str,
+        storage: StorageService = None,
+        batch_size: int = BatchJob.DEFAULT_BATCH_SIZE,
+    ) -> BatchJob:
+        return self.provider.request_logo_detection_job(
+            uris, output_uri, storage or self.__job_storage(), batch_size
+        )
+
+    def close(self) -> None:
+        self.provider.close()
+        self.preprocessor.shutdown()
+
+    def __enter__(self) -> "VisionService":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
     # private
 
     def __from_identifier(self, identifier: str) -> GCPProvider:
@@ -29,5 +116,229 @@ class VisionService(object):
 
         return provider
 
+    def __job_storage(self) -> StorageService:
+        return StorageService(
+            self.provider.STORAGE_PROVIDER, **self.provider.STORAGE_OPTIONS
+        )
+
     def __available_providers(self) -> dict:
-        return {"gcp": GCPProvider}
+        return {"gcp": GCPProvider, "fake": FakeProvider}
+
+    def __cache_key(self, operation: str, features: list, source: object) -> str:
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            source = "sha256:" + hashlib.sha256(source).hexdigest()
+        else:
+            source = "uri:" + source
+
+        key = "\n".join(
+            [self.provider.PROVIDER, operation, ",".join(sorted(features)), source]
+        )
+
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def __cached(
+        self, operation: str, features: list, source: object, request: callable
+    ) -> object:
+        source = self.preprocessor.process(source)
+
+        if self.cache is None:
+            return self.__scheduled(operation, features, [source], request)[0]
+
+        key = self.__cache_key(operation, features, source)
+        result = self.cache.get(key)
+
+        if result is None:
+            result = self.__scheduled(operation, features, [source], request)[0]
+            self.cache.set(key, result)
+
+        return result
+
+    def __cached_many(self, operation: str, sources: list, request: callable) -> list:
+        prepared = self.preprocessor.process_many(sources)
+        pending = [source for source in prepared if not isinstance(source, Exception)]
+        results = iter(
+            self.__deduplicated_many(operation, pending, request) if pending else []
+        )
+
+        return [
+            source if isinstance(source, Exception) else next(results)
+            for source in prepared
+        ]
+
+    def __deduplicated_many(
+        self, operation: str, sources: list, request: callable
+    ) -> list:
+        if self.dedup is None:
+            return self.__lookup_many(operation, sources, request)
+
+        digests = [
+            self.dedup.digest(source) if isinstance(source, bytes) else None
+            for source in sources
+        ]
+        results = [
+            None if digest is None else self.dedup.lookup(operation, digest)
+            for digest in digests
+        ]
+        representatives = []
+        aliases = {}
+
+        for index, (digest, result) in enumerate(zip(digests, results)):
+            if result is not None:
+                continue
+
+            aliases[index] = next(
+                (
+                    representative
+                    for representative in representatives
+                    if digest is not None
+                    and digests[representative] is not None
+                    and self.dedup.is_near(digest, digests[representative])
+                ),
+                index,
+            )
+
+            if aliases[index] == index:
+                representatives.append(index)
+
+        if representatives:
+            fetched = self.__lookup_many(
+                operation, [sources[index] for index in representatives], request
+            )
+
+            for index, result in zip(representatives, fetched):
+                results[index] = result
+
+                if digests[index] is not None and not isinstance(result, Exception):
+                    self.dedup.add(operation, digests[index], result)
+
+        return [
+            results[aliases[index]] if index in aliases else result
+            for index, result in enumerate(results)
+        ]
+
+    def __lookup_many(self, operation: str, sources: list, request: callable) -> list:
+        if self.cache is None:
+            return self.__scheduled(operation, [], sources, request, True)
+
+        keys = [self.__cache_key(operation, [], source) for source in sources]
+        results = [self.cache.get(key) for key in keys]
+        missing = {}
+
+        for index, (key, result) in enumerate(zip(keys, results)):
+            if result is None:
+                missing.setdefault(key, index)
+
+        if missing:
+            fetched = self.__scheduled(
+                operation,
+                [],
+                [sources[index] for index in missing.values()],
+                request,
+                True,
+            )
+
+            for key, result in zip(missing, fetched):
+                if not isinstance(result, Exception):
+                    self.cache.set(key, result)
+
+            fetched = dict(zip(missing, fetched))
+            results = [
+                fetched[key] if result is None else result
+                for key, result in zip(keys, results)
+            ]
+
+        return results
+
+    def __scheduled(
+        self,
+        operation: str,
+        features: list,
+        sources: list,
+        request: callable,
+        many: bool = False,
+    ) -> list:
+        features = features or self.OPERATION_FEATURES.get(operation, [])
+
+        if self.scheduler is not None:
+            self.scheduler.acquire(features, len(sources), self.priority)
+
+        try:
+            results = request(sources) if many else [request(sources[0])]
+        except AIError.QuotaExceeded:
+            self.__exhausted(features)
+            raise
+
+        if any(isinstance(result, AIError.QuotaExceeded) for result in results):
+            self.__exhausted(features)
+
+        return results
+
+    def __exhausted(self, features: list) -> None:
+        if self.scheduler is not None:
+            self.scheduler.exhausted(features)
+
+
+class AsyncVisionService(object):
+    def __init__(
+        self,
+        identifier,
+        concurrency: int = AsyncExecutor.DEFAULT_CONCURRENCY,
+        **options,
+    ):
+        self.service = VisionService(identifier, **options)
+        self.executor = AsyncExecutor(concurrency)
+
+    async def request_web_detection(self, uri: str) -> list:
+        return await self.executor.run(self.service.request_web_detection, uri)
+
+    async def request_logo_detection(self, uri: str) -> list:
+        return await self.executor.run(self.service.request_logo_detection, uri)
+
+    async def request_annotate(self, uri: str, features: list = None) -> dict:
+        return await self.executor.run(self.service.request_annotate, uri, features)
+
+    async def request_web_detection_many(self, uris: list) -> list:
+        return await self.executor.run(self.service.request_web_detection_many, uris)
+
+    async def request_logo_detection_many(self, uris: list) -> list:
+        return await self.executor.run(self.service.request_logo_detection_many, uris)
+
+    async def request_web_detection_job(
+        self,
+        uris: list,
+        output_uri: str,
+        storage: StorageService = None,
+        batch_size: int = BatchJob.DEFAULT_BATCH_SIZE,
+    ) -> BatchJob:
+        return await self.executor.run(
+            self.service.request_web_detection_job,
+            uris,
+            output_uri,
+            storage,
+            batch_size,
+        )
+
+    async def request_logo_detection_job(
+        self,
+        uris: list,
+        output_uri: str,
+        storage: StorageService = None,
+        batch_size: int = BatchJob.DEFAULT_BATCH_SIZE,
+    ) -> BatchJob:
+        return await self.executor.run(
+            self.service.request_logo_detection_job,
+            uris,
+            output_uri,
+            storage,
+            batch_size,
+        )
+
+    async def close(self) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.executor.shutdown)
+        self.service.close()
+
+    async def __aenter__(self) -> "AsyncVisionService":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
@@ -0,0 +1,108 @@
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from PIL import Image
+
+from lib.ai import errors as AIError
+
+from api.ai.vision.base.image_preprocessor import ImagePreprocessor
+
+
+class TestAIVisionImagePreprocessor(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "image.png")
+
+        Image.new("RGBA", (400, 200), (255, 0, 0, 255)).save(self.path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_that_passes_remote_uri_through(self):
+        preprocessor = ImagePreprocessor(max_dimension=100)
+
+        self.assertEqual("gs://bucket/image.jpg", preprocessor.process(self.uri()))
+
+    def test_that_reads_local_file_as_is_without_options(self):
+        preprocessor = ImagePreprocessor()
+
+        with open(self.path, "rb") as image_file:
+            self.assertEqual(image_file.read(), preprocessor.process(self.path))
+
+    def test_that_downscales_and_reencodes_to_jpeg(self):
+        preprocessor = ImagePreprocessor(max_dimension=100, quality=70)
+
+        with Image.open(io.BytesIO(preprocessor.process(self.path))) as image:
+            self.assertEqual("JPEG", image.format)
+            self.assertEqual((100, 50), image.size)
+
+    def test_that_keeps_small_image_when_only_max_dimension_is_set(self):
+        preprocessor = ImagePreprocessor(max_dimension=1000)
+
+        with open(self.path, "rb") as image_file:
+            content = image_file.read()
+
+        self.assertEqual(content, preprocessor.process(content))
+
+    def test_that_raises_file_object_not_found_when_local_file_is_missing(self):
+        with self.assertRaises(AIError.FileObjectNotFound):
+            ImagePreprocessor().process(os.path.join(self.directory.name, "missing"))
+
+    def test_that_processes_many_images_on_process_pool_with_errors_in_place(self):
+        preprocessor = ImagePreprocessor(max_dimension=100, max_workers=2)
+
+        try:
+            response = preprocessor.process_many(
+                [self.path, self.uri(), os.path.join(self.directory.name, "missing")]
+            )
+        finally:
+            preprocessor.shutdown()
+
+        with Image.open(io.BytesIO(response[0])) as image:
+            self.assertEqual((100, 50), image.size)
+
+        self.assertEqual(self.uri(), response[1])
+        self.assertIsInstance(response[2], AIError.FileObjectNotFound)
+
+    def test_that_raises_invalid_image_when_local_file_can_not_be_decoded(self):
+        with self.assertRaises(AIError.InvalidImage):
+            ImagePreprocessor(max_dimension=100).process(b"not an image")
+
+    def test_that_reads_many_images_without_process_pool_when_no_options(self):
+        preprocessor = ImagePreprocessor()
+
+        with mock.patch(
+            "api.ai.vision.base.image_preprocessor.ProcessPoolExecutor"
+        ) as executor:
+            response = preprocessor.process_many(
+                [self.path, os.path.join(self.directory.name, "missing")]
+            )
+
+        executor.assert_not_called()
+
+        with open(self.path, "rb") as image_file:
+            self.assertEqual(image_file.read(), response[0])
+
+        self.assertIsInstance(response[1], AIError.FileObjectNotFound)
+
+    def test_that_keeps_invalid_images_in_place_when_processing_many(self):
+        preprocessor = ImagePreprocessor(max_dimension=100, max_workers=2)
+
+        try:
+            response = preprocessor.process_many([b"not an image", self.path])
+        finally:
+            preprocessor.shutdown()
+
+        self.assertIsInstance(response[0], AIError.InvalidImage)
+
+        with Image.open(io.BytesIO(response[1])) as image:
+            self.assertEqual((100, 50), image.size)
+
+    # static
+
+    @staticmethod
+    def uri() -> str:
+        return "gs://bucket/image.jpg"
@@ -0,0 +1,62 @@
+import io
+import unittest
+
+import numpy
+
+from PIL import Image
+
+from api.ai.vision.base.perceptual_index import PerceptualIndex
+
+
+class TestAIVisionPerceptualIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = PerceptualIndex(threshold=4)
+
+    def test_that_gives_resized_and_recompressed_copies_a_near_digest(self):
+        original = self.index.digest(self.image((256, 256), "PNG"))
+        copy = self.index.digest(self.image((64, 64), "JPEG"))
+
+        self.assertTrue(self.index.is_near(original, copy))
+
+    def test_that_gives_different_images_a_far_digest(self):
+        original = self.index.digest(self.image((256, 256), "PNG"))
+        flipped = self.index.digest(self.image((256, 256), "PNG", flip=True))
+
+        self.assertFalse(self.index.is_near(original, flipped))
+
+    def test_that_returns_none_digest_for_undecodable_content(self):
+        self.assertIsNone(self.index.digest(b"not an image"))
+
+    def test_that_finds_nearest_result_within_threshold_per_namespace(self):
+        self.index.add("web", 0b1111, ["web result"])
+        self.index.add("logo", 0b1111, ["logo result"])
+
+        self.assertEqual(["web result"], self.index.lookup("web", 0b0111))
+        self.assertIsNone(self.index.lookup("web", 0b1111 << 40))
+        self.assertEqual({"hits": 1, "misses": 1, "size": 2}, self.index.stats())
+
+    def test_that_grows_beyond_initial_capacity(self):
+        for digest in range(PerceptualIndex.INITIAL_CAPACITY + 1):
+            self.index.add("web", digest << 10, digest)
+
+        self.assertEqual(
+            PerceptualIndex.INITIAL_CAPACITY,
+            self.index.lookup("web", PerceptualIndex.INITIAL_CAPACITY << 10),
+        )
+
+    # static
+
+    @staticmethod
+    def image(size: tuple, image_format: str, flip: bool = False) -> bytes:
+        gradient = numpy.tile(
+            numpy.linspace(0, 255, size[0], dtype=numpy.uint8), (size[1], 1)
+        )
+        gradient[: size[1] // 2] = 255 - gradient[: size[1] // 2]
+
+        if flip:
+            gradient = gradient[:, ::-1]
+
+        output = io.BytesIO()
+        Image.fromarray(gradient, "L").convert("RGB").save(output, format=image_format)
+
+        return output.getvalue()
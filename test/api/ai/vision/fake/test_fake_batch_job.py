@@ -0,0 +1,43 @@
+import io
+import json
+import unittest
+import mock
+
+from lib.ai import errors as AIError
+
+from api.ai.vision.fake.batch_job import BatchJob
+from api.ai.vision.fake.response import Response as FakeResponse
+
+
+class TestAIVisionFakeBatchJob(unittest.TestCase):
+    def setUp(self):
+        self.operation = mock.Mock()
+        self.storage = mock.Mock()
+        self.job = BatchJob(
+            self.operation,
+            "gs://bucket/backfill/",
+            2,
+            2,
+            self.storage,
+            lambda res: FakeResponse(res.response["logo"]).logo_detection_serialize(),
+        )
+
+    def test_that_parses_fake_json_outputs_with_errors_in_place(self):
+        output = {
+            "responses": [
+                FakeResponse({"logo": [("acme", 0.75)]}).json_serialize(),
+                {"error": {"code": 5, "message": "not found"}},
+            ]
+        }
+        self.storage.for_bucket.return_value.request_open.return_value = io.BytesIO(
+            json.dumps(output).encode("utf-8")
+        )
+
+        response = list(self.job.results(timeout=5))
+
+        self.storage.for_bucket.return_value.request_open.assert_called_once_with(
+            "backfill/output-1-to-2.json"
+        )
+
+        self.assertEqual([{"logo": "acme", "score": 0.75}], response[0])
+        self.assertIsInstance(response[1], AIError.FileObjectNotFound)
@@ -0,0 +1,109 @@
+import unittest
+
+from google.api_core import exceptions
+
+from lib.ai import errors as AIError
+from lib.common.retry_policy import RetryPolicy
+
+from api.ai.vision.fake.provider import Provider as FakeProvider
+from api.ai.vision.fake.request import Request as FakeRequest
+
+from services.storage import StorageService
+
+
+class TestAIVisionFakeProvider(unittest.TestCase):
+    def setUp(self):
+        self.provider = FakeProvider()
+
+    def tearDown(self):
+        self.provider.close()
+
+    def test_that_serializes_annotations_like_gcp_provider(self):
+        web = self.provider.request_web_detection(self.uri())
+        logo = self.provider.request_logo_detection(self.uri())
+        annotate = self.provider.request_annotate(self.uri(), ["web", "logo"])
+
+        self.assertEqual({"web": web, "logo": logo}, annotate)
+        self.assertEqual(["label", "score"], sorted(web[0]))
+        self.assertEqual(["logo", "score"], sorted(logo[0]))
+
+    def test_that_splits_many_into_batches_within_limit(self):
+        provider = FakeProvider(max_batch_size=3)
+        uris = [f"gs://bucket-testing/ex1/{index}.jpg" for index in range(7)]
+
+        results = provider.request_logo_detection_many(uris)
+
+        self.assertEqual(
+            [provider.request_logo_detection(uri) for uri in uris], results
+        )
+        self.assertEqual(3 + 7, provider.fault_injector.stats()["calls"])
+
+    def test_that_retries_quota_errors_until_quota_refills(self):
+        provider = FakeProvider(
+            quota=1000,
+            retry_policy=RetryPolicy(
+                max_attempts=50,
+                initial_backoff=0.01,
+                max_backoff=0.02,
+                retryable=(AIError.QuotaExceeded,),
+            ),
+        )
+        provider.quota.take(1000 + 5)
+
+        provider.request_web_detection(self.uri())
+
+        self.assertGreater(provider.retry_policy.stats()["retries"], 0)
+
+    def test_that_returns_errors_in_place_when_batch_keeps_failing(self):
+        provider = FakeProvider(
+            max_batch_size=2,
+            error_rates={"web_detection_many": 1.0},
+            retry_policy=RetryPolicy(max_attempts=1),
+        )
+
+        results = provider.request_web_detection_many([self.uri()] * 3)
+
+        self.assertEqual(3, len(results))
+        self.assertTrue(
+            all(isinstance(res, exceptions.ServiceUnavailable) for res in results)
+        )
+
+    def test_that_writes_job_outputs_to_storage_and_reads_them_back(self):
+        storage = StorageService("local", buckets=["bucket-testing"])
+        uris = [f"gs://bucket-testing/ex1/{index}.jpg" for index in range(5)]
+
+        job = self.provider.request_web_detection_job(
+            uris, "gs://bucket-testing/output/", storage, batch_size=2
+        )
+        results = list(job.results(timeout=5))
+
+        self.assertTrue(job.done())
+        self.assertEqual(
+            [self.provider.request_web_detection(uri) for uri in uris], results
+        )
+        self.assertEqual(
+            [
+                "output/output-1-to-2.json",
+                "output/output-3-to-4.json",
+                "output/output-5-to-5.json",
+            ],
+            [
+                entry["name"]
+                for entry in storage.for_bucket("bucket-testing").request_list(
+                    "output/"
+                )
+            ],
+        )
+        self.assertFalse(hasattr(storage.provider, "bucket"))
+
+    def test_that_raises_value_error_when_job_is_larger_than_limit(self):
+        uris = [self.uri()] * (FakeRequest.MAX_ASYNC_BATCH_SIZE + 1)
+
+        with self.assertRaises(ValueError):
+            self.provider.request_logo_detection_job(uris, "gs://bucket/out/", None)
+
+    # static
+
+    @staticmethod
+    def uri() -> str:
+        return "gs://bucket-testing/ex1/test.jpg"
@@ -0,0 +1,56 @@
+import unittest
+
+from lib.ai import errors as AIError
+from lib.common.token_bucket import TokenBucket
+
+from api.ai.vision.fake.request import Request as FakeRequest
+
+
+class TestAIVisionFakeRequest(unittest.TestCase):
+    def setUp(self):
+        self.request = FakeRequest()
+
+    def test_that_returns_same_annotations_for_same_input(self):
+        first = self.request.annotate(self.uri(), ["web", "logo", "label"])
+        second = FakeRequest().annotate(self.uri(), ["web", "logo", "label"])
+        other = self.request.annotate(b"image bytes", ["web", "logo", "label"])
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other)
+        self.assertTrue(
+            all(description in FakeRequest.LOGOS for description, _ in first["logo"])
+        )
+
+    def test_that_returns_entities_sorted_by_score(self):
+        entities = self.request.detect_web(self.uri())
+        scores = [score for _, score in entities]
+
+        self.assertTrue(1 <= len(entities) <= FakeRequest.ENTITIES)
+        self.assertEqual(sorted(scores, reverse=True), scores)
+        self.assertTrue(all(0 <= score < 1 for score in scores))
+
+    def test_that_raises_feature_not_found_when_feature_is_not_available(self):
+        with self.assertRaises(AIError.FeatureNotFound):
+            self.request.annotate(self.uri(), ["face"])
+
+    def test_that_raises_value_error_when_batch_is_larger_than_limit(self):
+        request = FakeRequest(max_batch_size=2)
+
+        self.assertEqual(2, len(request.detect_logo_many([self.uri()] * 2)))
+
+        with self.assertRaises(ValueError):
+            request.detect_logo_many([self.uri()] * 3)
+
+    def test_that_raises_quota_exceeded_when_quota_is_used_up(self):
+        request = FakeRequest(quota=TokenBucket(4, clock=lambda: 0.0))
+
+        request.detect_web_many([self.uri()] * 4)
+
+        with self.assertRaises(AIError.QuotaExceeded):
+            request.detect_web(self.uri())
+
+    # static
+
+    @staticmethod
+    def uri() -> str:
+        return "gs://bucket-testing/ex1/test.jpg"
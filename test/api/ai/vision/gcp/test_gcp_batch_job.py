@@ -0,0 +1,77 @@
+import io
+import json
+import unittest
+import mock
+
+from lib.ai import errors as AIError
+
+from api.ai.vision.gcp.batch_job import BatchJob
+
+
+class TestAIVisionGCPBatchJob(unittest.TestCase):
+    def setUp(self):
+        self.operation = mock.Mock()
+        self.storage = mock.Mock()
+        self.job = BatchJob(
+            self.operation,
+            "gs://bucket/backfill/",
+            3,
+            2,
+            self.storage,
+            lambda res: [
+                {"label": entity.description, "score": entity.score}
+                for entity in res.web_detection.web_entities
+            ],
+        )
+
+    def test_that_names_output_files_by_batch_range(self):
+        self.assertEqual(
+            ["backfill/output-1-to-2.json", "backfill/output-3-to-3.json"],
+            self.job.output_file_paths("backfill/"),
+        )
+
+    def test_that_streams_serialized_results_from_output_files(self):
+        outputs = {
+            "backfill/output-1-to-2.json": {
+                "responses": [
+                    self.__web_response("desc", 0.99),
+                    {"error": {"code": 5, "message": "not found"}},
+                ]
+            },
+            "backfill/output-3-to-3.json": {
+                "responses": [self.__web_response("desc3", 0.5)]
+            },
+        }
+        self.storage.for_bucket.return_value.request_open.side_effect = (
+            lambda path: io.BytesIO(json.dumps(outputs[path]).encode("utf-8"))
+        )
+
+        response = list(self.job.results(timeout=60))
+
+        self.operation.result.assert_called_once_with(timeout=60)
+        self.storage.for_bucket.assert_called_once_with("bucket")
+        self.storage.set_bucket.assert_not_called()
+
+        self.assertEqual(3, len(response))
+        self.assertEqual("desc", response[0][0].get("label"))
+        self.assertAlmostEqual(0.99, response[0][0].get("score"), places=5)
+        self.assertIsInstance(response[1], AIError.FileObjectNotFound)
+        self.assertEqual("desc3", response[2][0].get("label"))
+
+    def test_that_does_not_read_outputs_when_operation_fails(self):
+        self.operation.result.side_effect = TimeoutError
+
+        with self.assertRaises(TimeoutError):
+            next(self.job.results(timeout=1))
+
+        self.storage.for_bucket.assert_not_called()
+
+    # private
+
+    def __web_response(self, description: str, score: float) -> dict:
+        return {
+            "webDetection": {
+                "webEntities": [{"description": description, "score": score}]
+            },
+            "context": {"uri": "gs://bucket/image.jpg"},
+        }
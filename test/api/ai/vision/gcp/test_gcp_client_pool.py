@@ -0,0 +1,45 @@
+import unittest
+import mock
+
+from lib.ai import errors as AIError
+
+from api.ai.vision.gcp.client_pool import ClientPool
+
+
+class TestAIVisionGCPClientPool(unittest.TestCase):
+    def setUp(self):
+        self.pool = ClientPool(size=2, client_factory=mock.Mock)
+
+    def test_that_raises_value_error_when_pool_size_is_less_than_one(self):
+        with self.assertRaises(ValueError):
+            ClientPool(size=0)
+
+    def test_that_reuses_clients_in_round_robin_after_pool_is_filled(self):
+        first = self.pool.client()
+        second = self.pool.client()
+
+        self.assertIsNot(first, second)
+        self.assertIs(first, self.pool.client())
+        self.assertIs(second, self.pool.client())
+
+    def test_that_closes_grpc_channels_when_closing_pool(self):
+        client = self.pool.client()
+        self.pool.close()
+
+        client.transport.channel.close.assert_called_once()
+        self.assertTrue(self.pool.closed)
+
+    def test_that_raises_client_pool_closed_when_requesting_client_after_close(self):
+        self.pool.close()
+
+        with self.assertRaises(AIError.ClientPoolClosed):
+            self.pool.client()
+
+    def test_that_default_pool_is_shared_until_it_is_closed(self):
+        pool = ClientPool.default()
+
+        self.assertIs(pool, ClientPool.default())
+
+        pool.close()
+
+        self.assertIsNot(pool, ClientPool.default())
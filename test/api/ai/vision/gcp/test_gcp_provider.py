@@ -2,7 +2,9 @@ import unittest
 import mock
 
 from lib.ai import errors as AIError
+from lib.common.retry_policy import RetryPolicy
 
+from api.ai.vision.gcp.client_pool import ClientPool
 from api.ai.vision.gcp.provider import Provider as GCPProvider
 from api.ai.vision.gcp.request import Request as GCPRequest
 
@@ -11,6 +13,21 @@ class TestAIVisionGCPProvider(unittest.TestCase):
     def setUp(self):
         self.provider = GCPProvider()
 
+    def test_that_closing_leaves_shared_default_client_pool_open(self):
+        other = GCPProvider()
+
+        self.provider.close()
+
+        self.assertIs(ClientPool.default(), other.client_pool)
+        self.assertFalse(other.client_pool.closed)
+
+    def test_that_closes_client_pool_passed_in(self):
+        client_pool = ClientPool()
+
+        GCPProvider(client_pool=client_pool).close()
+
+        self.assertTrue(client_pool.closed)
+
     @mock.patch.object(GCPRequest, "detect_web")
     def test_that_raises_file_object_not_found_when_requesting_to_gcp_service_is_error(
         self, mock_request: mock.MagicMock
@@ -52,6 +69,76 @@ class TestAIVisionGCPProvider(unittest.TestCase):
         self.assertEqual(0.60, response[1].get("score"))
         self.assertEqual("desc2", response[1].get("logo"))
 
+    @mock.patch.object(GCPRequest, "annotate")
+    def test_that_can_request_many_features_from_gcp_service(
+        self, mock_request: mock.MagicMock
+    ):
+        annotate_response = mock.Mock()
+        annotate_response.web_detection.web_entities = (
+            self.__mock_web_detection_response()
+        )
+        annotate_response.label_annotations = self.__mock_web_detection_response()
+        mock_request.return_value = annotate_response
+
+        response = self.provider.request_annotate(self.uri(), ["web", "label"])
+
+        mock_request.assert_called_once_with(self.uri(), ["web", "label"])
+
+        self.assertEqual("desc", response["web"][0].get("label"))
+        self.assertEqual(0.50, response["label"][1].get("score"))
+
+    @mock.patch.object(GCPRequest, "detect_logo")
+    def test_that_retries_when_quota_is_exceeded(self, mock_request: mock.MagicMock):
+        mock_request.side_effect = [
+            AIError.QuotaExceeded(),
+            self.__mock_logo_detection_response(),
+        ]
+        provider = GCPProvider(
+            retry_policy=RetryPolicy(
+                retryable=(AIError.QuotaExceeded,), sleep=lambda _: None
+            )
+        )
+
+        response = provider.request_logo_detection(self.uri())
+
+        self.assertEqual(2, mock_request.call_count)
+        self.assertEqual("desc", response[0].get("logo"))
+
+    @mock.patch.object(GCPRequest, "detect_web_many")
+    def test_that_splits_many_images_into_batches_aligned_with_input(
+        self, mock_request: mock.MagicMock
+    ):
+        def detect_web_many(uris: list) -> list:
+            return [
+                (
+                    AIError.FileObjectNotFound()
+                    if uri.endswith("missing")
+                    else self.__mock_web_detection_response()
+                )
+                for uri in uris
+            ]
+
+        mock_request.side_effect = detect_web_many
+
+        uris = [self.uri()] * GCPRequest.MAX_BATCH_SIZE + ["gs://bucket/missing"]
+        response = self.provider.request_web_detection_many(uris)
+
+        self.assertEqual(2, mock_request.call_count)
+        self.assertEqual(len(uris), len(response))
+        self.assertEqual("desc", response[0][0].get("label"))
+        self.assertIsInstance(response[-1], AIError.FileObjectNotFound)
+
+    @mock.patch.object(GCPRequest, "detect_logo_many")
+    def test_that_returns_batch_error_for_each_image_in_failed_batch(
+        self, mock_request: mock.MagicMock
+    ):
+        mock_request.side_effect = RuntimeError("unavailable")
+
+        response = self.provider.request_logo_detection_many([self.uri(), self.uri()])
+
+        self.assertIsInstance(response[0], RuntimeError)
+        self.assertIsInstance(response[1], RuntimeError)
+
     # static
 
     @staticmethod
@@ -1,6 +1,7 @@
 import unittest
 import mock
 
+from google.api_core import exceptions
 from google.cloud import vision
 
 from lib.ai import errors as AIError
@@ -62,6 +63,129 @@ class TestAIVisionGCPRequest(unittest.TestCase):
         self.assertEqual("l2", response.web_detection.web_entities[1].get("mid"))
         self.assertEqual(0.60, response.web_detection.web_entities[1].get("score"))
 
+    def test_that_sends_many_images_in_one_batch_request_with_errors_per_image(self):
+        mock_web_entity_response = self.__mock_web_entity_response()
+        mock_web_entity_response.error.message = ""
+
+        self.request.client = mock.Mock()
+        self.request.client.batch_annotate_images.return_value.responses = [
+            mock_web_entity_response,
+            self.__mock_detect_error_response(),
+        ]
+
+        response = self.request.detect_web_many([self.uri(), "gs://bucket/missing"])
+
+        self.request.client.batch_annotate_images.assert_called_once()
+
+        requests = self.request.client.batch_annotate_images.call_args[0][0]
+
+        self.assertEqual(2, len(requests))
+        self.assertEqual(self.uri(), requests[0].image.source.image_uri)
+        self.assertEqual(
+            vision.enums.Feature.Type.WEB_DETECTION, requests[0].features[0].type
+        )
+        self.assertEqual("a1", response[0][0].get("entity_id"))
+        self.assertIsInstance(response[1], AIError.FileObjectNotFound)
+
+    def test_that_raises_value_error_when_batch_is_larger_than_api_limit(self):
+        with self.assertRaises(ValueError):
+            self.request.detect_logo_many(
+                [self.uri()] * (GCPRequest.MAX_BATCH_SIZE + 1)
+            )
+
+    def test_that_sends_all_features_in_one_annotate_request(self):
+        mock_annotate_response = self.__mock_web_entity_response()
+        mock_annotate_response.error.message = ""
+
+        self.request.client = mock.Mock()
+        self.request.client.batch_annotate_images.return_value.responses = [
+            mock_annotate_response
+        ]
+
+        response = self.request.annotate(self.uri(), ["web", "logo", "label"])
+
+        requests = self.request.client.batch_annotate_images.call_args[0][0]
+
+        self.assertIs(mock_annotate_response, response)
+        self.assertEqual(1, len(requests))
+        self.assertEqual(
+            [
+                vision.enums.Feature.Type.WEB_DETECTION,
+                vision.enums.Feature.Type.LOGO_DETECTION,
+                vision.enums.Feature.Type.LABEL_DETECTION,
+            ],
+            [feature.type for feature in requests[0].features],
+        )
+
+    def test_that_raises_file_object_not_found_when_annotate_response_has_error(self):
+        self.request.client = mock.Mock()
+        self.request.client.batch_annotate_images.return_value.responses = [
+            self.__mock_detect_error_response()
+        ]
+
+        with self.assertRaises(AIError.FileObjectNotFound):
+            self.request.annotate(self.uri(), ["web"])
+
+    def test_that_raises_feature_not_found_when_feature_is_not_available(self):
+        self.request.client = mock.Mock()
+
+        with self.assertRaises(AIError.FeatureNotFound):
+            self.request.annotate(self.uri(), ["web", "abcde"])
+
+        self.request.client.batch_annotate_images.assert_not_called()
+
+    def test_that_submits_async_batch_annotation_with_gcs_output(self):
+        self.request.client = mock.Mock()
+
+        operation = self.request.async_batch_annotate(
+            [self.uri(), self.uri()], ["web"], "gs://bucket/backfill/", 100
+        )
+
+        requests, output_config = (
+            self.request.client.async_batch_annotate_images.call_args[0]
+        )
+
+        self.assertIs(
+            self.request.client.async_batch_annotate_images.return_value, operation
+        )
+        self.assertEqual(2, len(requests))
+        self.assertEqual("gs://bucket/backfill/", output_config.gcs_destination.uri)
+        self.assertEqual(100, output_config.batch_size)
+
+    def test_that_raises_value_error_when_async_batch_is_larger_than_api_limit(self):
+        with self.assertRaises(ValueError):
+            self.request.async_batch_annotate(
+                [self.uri()] * (GCPRequest.MAX_ASYNC_BATCH_SIZE + 1),
+                ["web"],
+                "gs://bucket/backfill/",
+                100,
+            )
+
+    def test_that_sends_image_bytes_as_inline_content(self):
+        mock_annotate_response = self.__mock_web_entity_response()
+        mock_annotate_response.error.message = ""
+
+        self.request.client = mock.Mock()
+        self.request.client.batch_annotate_images.return_value.responses = [
+            mock_annotate_response
+        ]
+
+        self.request.annotate(b"image", ["web"])
+
+        requests = self.request.client.batch_annotate_images.call_args[0][0]
+
+        self.assertEqual(b"image", requests[0].image.content)
+        self.assertEqual("", requests[0].image.source.image_uri)
+
+    def test_that_raises_quota_exceeded_when_resource_is_exhausted(self):
+        self.request.client = mock.Mock()
+        self.request.client.batch_annotate_images.side_effect = (
+            exceptions.ResourceExhausted("quota")
+        )
+
+        with self.assertRaises(AIError.QuotaExceeded):
+            self.request.annotate(self.uri(), ["web"])
+
     # static
 
     @staticmethod
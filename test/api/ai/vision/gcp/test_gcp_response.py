@@ -23,6 +23,29 @@ class TestStorageStorageGCPResponse(unittest.TestCase):
         self.assertEqual(0.60, response[1].get("score"))
         self.assertEqual("desc2", response[1].get("logo"))
 
+    def test_that_can_serialize_label_detection_response(self):
+        response_obj = GCPResponse(self.__mock_web_detection_response())
+        response = response_obj.label_detection_serialize()
+
+        self.assertEqual(0.99, response[0].get("score"))
+        self.assertEqual("desc", response[0].get("label"))
+
+    def test_that_can_serialize_requested_features_of_annotate_response(self):
+        annotate_response = mock.Mock()
+        annotate_response.web_detection.web_entities = (
+            self.__mock_web_detection_response()
+        )
+        annotate_response.logo_annotations = self.__mock_logo_detection_response()
+
+        response_obj = GCPResponse(annotate_response)
+        response = response_obj.annotate_serialize(["web", "logo"])
+
+        self.assertEqual(["web", "logo"], list(response.keys()))
+        self.assertEqual("desc", response["web"][0].get("label"))
+        self.assertEqual(0.50, response["web"][1].get("score"))
+        self.assertEqual("desc", response["logo"][0].get("logo"))
+        self.assertEqual(0.60, response["logo"][1].get("score"))
+
     # private
 
     def __mock_web_detection_response(self) -> list:
@@ -0,0 +1,161 @@
+import base64
+import hashlib
+import os
+import tempfile
+import unittest
+import mock
+
+from api.storage.storage.base.directory_sync import DirectorySync
+
+
+class TestStorageStorageDirectorySync(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.storage = mock.Mock()
+
+        self.__write("same.txt", b"same", 1577836800)
+        self.__write("changed.txt", b"changed!", 1577836800)
+        self.__write("sub/new.txt", b"new", 1577836800)
+
+        self.storage.request_list.return_value = [
+            self.__entry("same.txt", b"same", "2020-01-02T00:00:00+00:00"),
+            self.__entry("changed.txt", b"old", "2020-01-02T00:00:00+00:00"),
+            self.__entry("gone.txt", b"gone", "2020-01-02T00:00:00+00:00"),
+            {"name": "deploy/sub/", "prefix": False, "size": 0},
+        ]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_that_raises_value_error_when_direction_is_not_available(self):
+        with self.assertRaises(ValueError):
+            DirectorySync(self.storage, self.directory.name, "deploy", "sideways")
+
+    def test_that_plans_only_differences_for_upload(self):
+        directory_sync = DirectorySync(
+            self.storage, self.directory.name, "deploy/", delete=True
+        )
+
+        plan = directory_sync.run(dry_run=True)["plan"]
+
+        self.storage.request_list.assert_called_once_with("deploy/")
+        self.storage.request_upload.assert_not_called()
+
+        self.assertEqual(
+            [
+                ("upload", "deploy/changed.txt", "size differs"),
+                ("upload", "deploy/sub/new.txt", "missing from target"),
+                ("delete", "deploy/gone.txt", "missing from source"),
+            ],
+            [
+                (action["action"], action["remote_file_path"], action["reason"])
+                for action in plan
+            ],
+        )
+
+    def test_that_uploads_and_deletes_differences_in_parallel(self):
+        self.storage.request_delete.side_effect = FileNotFoundError
+
+        summary = DirectorySync(
+            self.storage, self.directory.name, "deploy", delete=True, max_workers=2
+        ).run()
+
+        self.storage.request_upload.assert_any_call(
+            "deploy/sub/new.txt", os.path.join(self.directory.name, "sub", "new.txt")
+        )
+
+        self.assertEqual(2, self.storage.request_upload.call_count)
+        self.assertIsInstance(summary["results"][2], FileNotFoundError)
+        self.assertEqual(1, summary["errors"])
+
+    def test_that_compares_checksums_when_sizes_match(self):
+        self.storage.request_list.return_value = [
+            self.__entry("same.txt", b"same", "2021-01-01T00:00:00+00:00"),
+            self.__entry("changed.txt", b"changeD!", "2019-01-01T00:00:00+00:00"),
+        ]
+
+        plan = DirectorySync(
+            self.storage,
+            self.directory.name,
+            "deploy",
+            DirectorySync.DOWNLOAD,
+            DirectorySync.CHECKSUM,
+        ).plan()
+
+        self.assertEqual(
+            ["deploy/changed.txt"], [action["remote_file_path"] for action in plan]
+        )
+        self.assertEqual("checksum differs", plan[0]["reason"])
+
+    def test_that_compares_modification_times_when_no_checksum_is_available(self):
+        self.storage.request_list.return_value = [
+            dict(
+                self.__entry("same.txt", b"same", "2021-01-01T00:00:00+00:00"),
+                md5_hash=None,
+                crc32c=None,
+            ),
+            dict(
+                self.__entry("changed.txt", b"changed!", "2019-01-01T00:00:00+00:00"),
+                md5_hash=None,
+                crc32c=None,
+            ),
+        ]
+
+        plan = DirectorySync(
+            self.storage,
+            self.directory.name,
+            "deploy",
+            DirectorySync.DOWNLOAD,
+            DirectorySync.CHECKSUM,
+        ).plan()
+
+        self.assertEqual(
+            [("deploy/same.txt", "remote object is newer")],
+            [(action["remote_file_path"], action["reason"]) for action in plan],
+        )
+
+    def test_that_downloads_newer_remote_objects_and_deletes_local_leftovers(self):
+        summary = DirectorySync(
+            self.storage,
+            self.directory.name,
+            "deploy",
+            DirectorySync.DOWNLOAD,
+            delete=True,
+        ).run()
+
+        self.assertEqual(
+            [
+                ("download", "deploy/changed.txt"),
+                ("download", "deploy/gone.txt"),
+                ("download", "deploy/same.txt"),
+                ("delete", "deploy/sub/new.txt"),
+            ],
+            [
+                (action["action"], action["remote_file_path"])
+                for action in summary["plan"]
+            ],
+        )
+        self.assertFalse(
+            os.path.exists(os.path.join(self.directory.name, "sub", "new.txt"))
+        )
+
+    # private
+
+    def __write(self, path: str, content: bytes, mtime: int) -> None:
+        local_file_path = os.path.join(self.directory.name, *path.split("/"))
+        os.makedirs(os.path.dirname(local_file_path), exist_ok=True)
+
+        with open(local_file_path, "wb") as local_file:
+            local_file.write(content)
+
+        os.utime(local_file_path, (mtime, mtime))
+
+    def __entry(self, path: str, content: bytes, updated: str) -> dict:
+        return {
+            "name": f"deploy/{path}",
+            "prefix": False,
+            "size": len(content),
+            "md5_hash": base64.b64encode(hashlib.md5(content).digest()).decode(),
+            "crc32c": None,
+            "updated": updated,
+        }
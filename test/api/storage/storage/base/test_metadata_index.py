@@ -0,0 +1,98 @@
+import os
+import tempfile
+import unittest
+
+from api.storage.storage.base.metadata_index import MetadataIndex
+
+
+class TestStorageStorageMetadataIndex(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.now = 1.0
+        self.index = MetadataIndex(
+            os.path.join(self.directory.name, "index.sqlite"), clock=lambda: self.now
+        )
+
+    def tearDown(self):
+        self.index.close()
+        self.directory.cleanup()
+
+    def test_that_answers_existence_and_size_from_listing(self):
+        counts = self.index.refresh(
+            [self.__entry("ex1/a.txt", 10, 1), {"name": "ex1/dir/", "prefix": True}]
+        )
+
+        self.assertEqual(1, counts["added"])
+        self.assertTrue(self.index.exists("ex1/a.txt"))
+        self.assertFalse(self.index.exists("ex1/dir/"))
+        self.assertEqual(10, self.index.size("ex1/a.txt"))
+        self.assertIsNone(self.index.size("ex1/missing.txt"))
+
+    def test_that_refreshes_prefix_incrementally(self):
+        self.index.refresh(
+            [
+                self.__entry("ex1/a.txt", 10, 1),
+                self.__entry("ex1/b.txt", 20, 1),
+                self.__entry("ex2/c.txt", 30, 1),
+            ]
+        )
+        self.now = 2.0
+
+        counts = self.index.refresh(
+            [self.__entry("ex1/a.txt", 10, 1), self.__entry("ex1/b.txt", 25, 2)],
+            "ex1/",
+        )
+
+        self.assertEqual(
+            {"added": 0, "updated": 1, "unchanged": 1, "removed": 0}, counts
+        )
+        self.assertEqual(25, self.index.size("ex1/b.txt"))
+        self.assertEqual({"count": 2, "total_size": 35}, self.index.stats("ex1/"))
+
+        self.now = 3.0
+
+        counts = self.index.refresh([self.__entry("ex1/a.txt", 10, 1)], "ex1/")
+
+        self.assertEqual(1, counts["removed"])
+        self.assertEqual(["ex1/a.txt", "ex2/c.txt"], self.index.names())
+
+    def test_that_treats_like_wildcards_in_prefix_literally(self):
+        self.index.refresh(
+            [self.__entry("ex_1/a.txt", 1, 1), self.__entry("exx1/a.txt", 1, 1)]
+        )
+
+        self.assertEqual(["ex_1/a.txt"], self.index.names("ex_1/"))
+
+    def test_that_matches_prefix_case_sensitively(self):
+        self.index.refresh(
+            [self.__entry("photos/a.jpg", 1, 1), self.__entry("Photos/a.jpg", 2, 1)]
+        )
+        self.now = 2.0
+
+        counts = self.index.refresh([], "photos/")
+
+        self.assertEqual(1, counts["removed"])
+        self.assertEqual(["Photos/a.jpg"], self.index.names())
+        self.assertEqual({"count": 0, "total_size": 0}, self.index.stats("photos/"))
+
+    def test_that_matches_prefix_ending_with_highest_code_point(self):
+        prefix = "ex1" + chr(0x10FFFF)
+        self.index.refresh(
+            [self.__entry(prefix + "/a.txt", 1, 1), self.__entry("ex2/a.txt", 1, 1)]
+        )
+
+        self.assertEqual([prefix + "/a.txt"], self.index.names(prefix))
+        self.assertEqual(["ex2/a.txt"], self.index.names("ex2"))
+
+    # private
+
+    def __entry(self, name: str, size: int, generation: int) -> dict:
+        return {
+            "name": name,
+            "prefix": False,
+            "size": size,
+            "crc32c": "AAAAAA==",
+            "md5_hash": "1B2M2Y8AsgTpgAmY7PhCfg==",
+            "generation": generation,
+            "updated": "2020-01-01T00:00:00+00:00",
+        }
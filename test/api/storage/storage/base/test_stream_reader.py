@@ -0,0 +1,37 @@
+import io
+import unittest
+
+from api.storage.storage.base.stream_reader import StreamReader
+
+
+class TestStorageStorageBaseStreamReader(unittest.TestCase):
+    def test_that_can_read_bytes(self):
+        reader = StreamReader.open(b"content")
+
+        self.assertEqual(b"content", reader.read())
+        self.assertEqual(7, reader.tell())
+
+    def test_that_can_read_memoryview(self):
+        reader = StreamReader.open(memoryview(b"content")[1:4])
+
+        self.assertEqual(b"ont", reader.read())
+
+    def test_that_can_read_file_object(self):
+        reader = StreamReader.open(io.BytesIO(b"content"))
+
+        self.assertEqual(b"cont", reader.read(4))
+        self.assertEqual(b"ent", reader.read(4))
+
+    def test_that_fills_each_read_across_chunk_boundaries(self):
+        reader = StreamReader.open(iter([b"ab", b"", b"cde", b"f"]))
+
+        self.assertEqual(b"abcd", reader.read(4))
+        self.assertEqual(4, reader.tell())
+        self.assertEqual(b"ef", reader.read(4))
+        self.assertEqual(b"", reader.read(4))
+
+    def test_that_starts_at_beginning_even_for_unseekable_sources(self):
+        reader = StreamReader.open(iter([b"content"]))
+
+        self.assertEqual(0, reader.tell())
+        self.assertFalse(reader.seekable())
@@ -0,0 +1,41 @@
+import unittest
+import mock
+import requests
+
+from google.cloud import exceptions
+
+from api.storage.storage.gcp.batch import Batch
+
+
+class TestStorageStorageGCPBatch(unittest.TestCase):
+    def setUp(self):
+        self.batch = Batch(mock.Mock())
+
+    def test_that_records_errors_per_response_instead_of_raising(self):
+        first_target = mock.Mock()
+        second_target = mock.Mock()
+
+        self.batch._target_objects = [first_target, second_target]
+        self.batch._finish_futures(
+            [self.__response(200, b'{"name": "ex1/test.txt"}'), self.__response(404)]
+        )
+
+        self.assertIsNone(self.batch.errors[0])
+        self.assertIsInstance(self.batch.errors[1], exceptions.NotFound)
+        self.assertEqual({"name": "ex1/test.txt"}, first_target._properties)
+
+    def test_that_raises_value_error_when_responses_do_not_match_requests(self):
+        self.batch._target_objects = [None, None]
+
+        with self.assertRaises(ValueError):
+            self.batch._finish_futures([self.__response(204)])
+
+    # private
+
+    def __response(self, status_code: int, content: bytes = b"") -> requests.Response:
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = content
+        response.request = requests.Request("GET", "contentid://1").prepare()
+
+        return response
@@ -0,0 +1,47 @@
+import os
+import unittest
+import mock
+
+from api.storage.storage.gcp.blob_reader import BlobReader
+
+
+class TestStorageStorageGCPBlobReader(unittest.TestCase):
+    def setUp(self):
+        self.blob = mock.Mock()
+        self.blob.size = len(self.content())
+        self.blob.download_as_string.side_effect = self.__download_as_string
+
+    def test_that_reads_whole_object_with_ranged_requests(self):
+        reader = BlobReader.open(self.blob, buffer_size=4)
+
+        self.assertEqual(self.content(), reader.read())
+
+    def test_that_can_seek_and_read_from_position(self):
+        reader = BlobReader.open(self.blob, buffer_size=4)
+        reader.seek(6)
+
+        self.assertEqual(b"ghij", reader.read(4))
+
+        reader.seek(-3, os.SEEK_END)
+
+        self.assertEqual(b"xyz", reader.read())
+        self.assertEqual(len(self.content()), reader.tell())
+
+    def test_that_does_not_request_past_end_of_object(self):
+        reader = BlobReader.open(self.blob)
+        reader.read()
+        calls = self.blob.download_as_string.call_count
+
+        self.assertEqual(b"", reader.read(10))
+        self.assertEqual(calls, self.blob.download_as_string.call_count)
+
+    # static
+
+    @staticmethod
+    def content() -> bytes:
+        return b"abcdefghijklmnopqrstuvwxyz"
+
+    # private
+
+    def __download_as_string(self, start: int, end: int) -> bytes:
+        return self.content()[start:][: end - start + 1]
@@ -64,6 +64,27 @@ class TestStorageStorageGCPBlobRequest(unittest.TestCase):
 
         self.assertTrue(response)
 
+    @mock.patch.object(storage.blob.Blob, "reload")
+    def test_that_raises_file_not_found_when_reloading_blob_which_is_not_existed(
+        self, mock_object: mock.MagicMock
+    ):
+        mock_object.side_effect = exceptions.NotFound("")
+
+        with self.assertRaises(StorageError.FileNotFound):
+            self.blob.reload()
+
+        mock_object.assert_called_once()
+
+    @mock.patch.object(storage.blob.Blob, "reload")
+    def test_that_returns_true_when_blob_can_be_reloaded(
+        self, mock_object: mock.MagicMock
+    ):
+        response = self.blob.reload()
+
+        mock_object.assert_called_once()
+
+        self.assertTrue(response)
+
     @mock.patch.object(storage.blob.Blob, "exists")
     def test_that_raises_error_file_not_found_when_blob_object_is_not_existed(
         self, mock_object: mock.MagicMock
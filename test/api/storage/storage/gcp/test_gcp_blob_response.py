@@ -34,6 +34,15 @@ class TestStorageStorageGCPBlobResponse(unittest.TestCase):
 
         self.assertFalse(response.exists())
 
+    def test_that_returns_known_exists_without_asking_storage(self):
+        blob = self.__mock_blob_object()
+        blob.blob.exists = mock.Mock()
+
+        response = BlobResponse(blob, False)
+
+        self.assertFalse(response.exists())
+        blob.blob.exists.assert_not_called()
+
     def test_that_can_serialize_to_dict(self):
         serialize = self.response.serialize()
 
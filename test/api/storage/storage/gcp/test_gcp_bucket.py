@@ -38,7 +38,7 @@ class TestStorageStorageGCPBucket(unittest.TestCase):
 
         self.assertEqual("bucket-testing", bucket.name())
 
-    @mock.patch.object(BlobRequest, "is_existed")
+    @mock.patch.object(BlobRequest, "reload")
     def test_that_raises_file_not_found_when_it_can_not_retrieve_file(
         self, mock_blob: mock.MagicMock
     ):
@@ -50,7 +50,7 @@ class TestStorageStorageGCPBucket(unittest.TestCase):
 
         mock_blob.assert_called_once()
 
-    @mock.patch.object(BlobRequest, "is_existed")
+    @mock.patch.object(BlobRequest, "reload")
     @mock.patch.object(BlobResponse, "serialize")
     def test_that_returns_file_properties_when_file_is_existed_in_bucket(
         self, mock_blob_response: mock.MagicMock, mock_blob: mock.MagicMock
@@ -110,7 +110,7 @@ class TestStorageStorageGCPBucket(unittest.TestCase):
         self.assertEqual("gs://bucket-testing/ex1/test.txt", response.get("uri"))
         self.assertTrue(response.get("exists"))
 
-    @mock.patch.object(BlobRequest, "is_existed")
+    @mock.patch.object(BlobRequest, "delete")
     def test_that_raises_file_not_found_when_it_can_not_delete_file_in_storage(
         self, mock_blob: mock.MagicMock
     ):
@@ -131,15 +131,14 @@ class TestStorageStorageGCPBucket(unittest.TestCase):
         mock_deleted_blob: mock.MagicMock,
         mock_blob: mock.MagicMock,
     ):
-        mock_blob.return_value = True
         mock_deleted_blob.return_value = True
         mock_blob_response.return_value = self.__mock_deleted_blob_response()
 
         bucket = Bucket(StorageClientTesting(), self.bucket())
         response = bucket.delete(self.remote_file_path)
 
-        mock_blob.assert_called_once()
-        mock_deleted_blob.assert_called_once()
+        mock_blob.assert_not_called()
+        mock_deleted_blob.assert_called_once_with(self.remote_file_path)
         mock_blob_response.assert_called_once()
 
         self.assertEqual(None, response.get("id"))
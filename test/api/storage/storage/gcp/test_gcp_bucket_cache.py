@@ -0,0 +1,87 @@
+import unittest
+import mock
+
+from google.cloud import exceptions
+
+from lib.storage import errors as StorageError
+
+from api.storage.storage.gcp.bucket_cache import BucketCache
+
+
+class TestStorageStorageGCPBucketCache(unittest.TestCase):
+    def setUp(self):
+        self.now = 0
+        self.client = mock.Mock()
+        self.cache = BucketCache(ttl=10, clock=lambda: self.now)
+
+    def test_that_fetches_bucket_only_once_within_ttl(self):
+        first = self.cache.get(self.client, self.bucket())
+        second = self.cache.get(self.client, self.bucket())
+
+        self.client.get_bucket.assert_called_once_with(self.bucket())
+        self.assertIs(first, second)
+
+    def test_that_fetches_bucket_again_after_ttl_is_expired(self):
+        self.cache.get(self.client, self.bucket())
+        self.now = 11
+        self.cache.get(self.client, self.bucket())
+
+        self.assertEqual(2, self.client.get_bucket.call_count)
+
+    def test_that_fetches_bucket_again_after_invalidating(self):
+        self.cache.get(self.client, self.bucket())
+        self.cache.invalidate(self.bucket())
+        self.cache.get(self.client, self.bucket())
+
+        self.assertEqual(2, self.client.get_bucket.call_count)
+
+    def test_that_raises_bucket_not_found_when_bucket_is_not_existed(self):
+        self.client.get_bucket.side_effect = exceptions.NotFound("")
+
+        with self.assertRaises(StorageError.BucketNotFound):
+            self.cache.get(self.client, self.bucket())
+
+    def test_that_uses_lazy_bucket_handle_without_request_when_trusting_bucket(self):
+        cache = BucketCache(trust_bucket=True)
+        cache.get(self.client, self.bucket())
+
+        self.client.bucket.assert_called_once_with(self.bucket())
+        self.client.get_bucket.assert_not_called()
+
+    def test_that_can_tell_bucket_not_found_from_object_not_found(self):
+        self.assertTrue(
+            BucketCache.is_bucket_not_found(
+                exceptions.NotFound("The specified bucket does not exist.")
+            )
+        )
+        self.assertFalse(
+            BucketCache.is_bucket_not_found(
+                exceptions.NotFound("No such object: ex1/test.txt")
+            )
+        )
+
+    def test_that_missing_object_in_bucket_named_bucket_is_not_bucket_not_found(
+        self,
+    ):
+        self.assertFalse(
+            BucketCache.is_bucket_not_found(
+                exceptions.NotFound(
+                    "GET https://storage.googleapis.com/storage/v1/b/photo-bucket/o/"
+                    "a.jpg: No such object: photo-bucket/a.jpg"
+                )
+            )
+        )
+        self.assertTrue(
+            BucketCache.is_bucket_not_found(
+                exceptions.NotFound(
+                    "GET https://storage.googleapis.com/storage/v1/b/photo-bucket/o/"
+                    "a.jpg: The specified bucket does not exist."
+                )
+            )
+        )
+
+    # static
+
+    @staticmethod
+    def bucket() -> str:
+        return "bucket-testing"
@@ -0,0 +1,96 @@
+import base64
+import hashlib
+import tempfile
+import unittest
+import mock
+
+from google.cloud import exceptions
+
+from lib.common.checksum_cache import ChecksumCache
+from lib.storage import errors as StorageError
+
+from api.storage.storage.gcp.checksum_upload import ChecksumUpload
+
+
+class BlobTesting(object):
+    def __init__(self, content: bytes = None):
+        self.name = "ex1/test.bin"
+        self.content = content
+        self.md5_hash = None
+        self.crc32c = None
+
+    def reload(self) -> None:
+        if self.content is None:
+            raise exceptions.NotFound("No such object: ex1/test.bin")
+
+        self.md5_hash = TestStorageStorageGCPChecksumUpload.md5(self.content)
+
+
+class TestStorageStorageGCPChecksumUpload(unittest.TestCase):
+    def setUp(self):
+        self.local_file = tempfile.NamedTemporaryFile(suffix=".bin")
+        self.local_file.write(b"content")
+        self.local_file.flush()
+
+        self.upload = mock.Mock(side_effect=self.__store)
+
+    def tearDown(self):
+        self.local_file.close()
+
+    def test_that_skips_upload_when_remote_object_is_identical(self):
+        upload = self.__checksum_upload(BlobTesting(b"content"))
+
+        upload.run()
+
+        self.upload.assert_not_called()
+
+        self.assertTrue(upload.skipped)
+        self.assertTrue(upload.verified)
+
+    def test_that_uploads_and_verifies_when_remote_object_is_missing_or_differs(self):
+        for content in (None, b"old content"):
+            blob = BlobTesting(content)
+            upload = self.__checksum_upload(blob, ChecksumCache())
+
+            self.assertIs(blob, upload.run())
+            self.assertFalse(upload.skipped)
+            self.assertTrue(upload.verified)
+
+        self.assertEqual(2, self.upload.call_count)
+
+    def test_that_raises_checksum_mismatch_when_server_reports_other_content(self):
+        self.upload.side_effect = lambda blob, path: self.__store(blob, path, b"x")
+
+        with self.assertRaises(StorageError.ChecksumMismatch):
+            self.__checksum_upload(BlobTesting()).run()
+
+    def test_that_leaves_verified_unknown_when_server_reports_no_comparable_checksum(
+        self,
+    ):
+        self.upload.side_effect = lambda blob, path: None
+
+        upload = self.__checksum_upload(BlobTesting())
+        upload.run()
+
+        self.assertIsNone(upload.verified)
+
+    # static
+
+    @staticmethod
+    def md5(content: bytes) -> str:
+        return base64.b64encode(hashlib.md5(content).digest()).decode()
+
+    # private
+
+    def __checksum_upload(
+        self, blob: BlobTesting, checksum_cache: ChecksumCache = None
+    ) -> ChecksumUpload:
+        return ChecksumUpload(blob, self.local_file.name, self.upload, checksum_cache)
+
+    def __store(
+        self, blob: BlobTesting, local_file_path: str, content: bytes = None
+    ) -> None:
+        with open(local_file_path, "rb") as local_file:
+            blob.content = content or local_file.read()
+
+        blob.md5_hash = self.md5(blob.content)
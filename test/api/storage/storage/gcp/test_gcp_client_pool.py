@@ -0,0 +1,62 @@
+import unittest
+import mock
+
+from lib.storage import errors as StorageError
+
+from api.storage.storage.gcp.client_pool import ClientPool
+
+
+class TestStorageStorageGCPClientPool(unittest.TestCase):
+    def setUp(self):
+        self.pool = ClientPool(size=2, client_factory=self.__mock_client)
+
+    def test_that_raises_value_error_when_pool_size_is_less_than_one(self):
+        with self.assertRaises(ValueError):
+            ClientPool(size=0)
+
+    def test_that_reuses_clients_in_round_robin_after_pool_is_filled(self):
+        first = self.pool.client()
+        second = self.pool.client()
+
+        self.assertIsNot(first, second)
+        self.assertIs(first, self.pool.client())
+        self.assertIs(second, self.pool.client())
+
+    def test_that_mounts_keep_alive_adapter_sized_by_max_connections(self):
+        client = self.pool.client()
+
+        client._http.mount.assert_called_once()
+
+        adapter = client._http.mount.call_args[0][1]
+
+        self.assertEqual(ClientPool.DEFAULT_MAX_CONNECTIONS, adapter._pool_maxsize)
+
+    def test_that_closes_http_sessions_when_closing_pool(self):
+        client = self.pool.client()
+        self.pool.close()
+
+        client._http_internal.close.assert_called_once()
+        self.assertTrue(self.pool.closed)
+
+    def test_that_raises_client_pool_closed_when_requesting_client_after_close(self):
+        self.pool.close()
+
+        with self.assertRaises(StorageError.ClientPoolClosed):
+            self.pool.client()
+
+    def test_that_default_pool_is_shared_until_it_is_closed(self):
+        pool = ClientPool.default()
+
+        self.assertIs(pool, ClientPool.default())
+
+        pool.close()
+
+        self.assertIsNot(pool, ClientPool.default())
+
+    # private
+
+    def __mock_client(self) -> mock.MagicMock:
+        client = mock.Mock()
+        client._http_internal = client._http
+
+        return client
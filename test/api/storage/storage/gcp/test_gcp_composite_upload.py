@@ -0,0 +1,116 @@
+import os
+import tempfile
+import unittest
+import mock
+
+from google.cloud import exceptions
+
+from api.storage.storage.gcp.batch import Batch
+from api.storage.storage.gcp.composite_upload import CompositeUpload
+
+
+class BlobTesting(object):
+    def __init__(self, bucket: "BucketTesting", name: str):
+        self.bucket = bucket
+        self.name = name
+        self.content = b""
+        self.content_type = None
+
+    def upload_from_file(self, stream: object, size: int = None) -> None:
+        self.content = stream.read(size)
+        self.bucket.objects[self.name] = self
+
+    def compose(self, sources: list) -> None:
+        self.bucket.composes.append(len(sources))
+        self.content = b"".join(source.content for source in sources)
+        self.bucket.objects[self.name] = self
+
+    def delete(self) -> None:
+        del self.bucket.objects[self.name]
+
+
+class BucketTesting(object):
+    def __init__(self):
+        self.client = mock.Mock()
+        self.objects = {}
+        self.composes = []
+
+    def blob(self, name: str, chunk_size: int = None) -> BlobTesting:
+        return BlobTesting(self, name)
+
+
+@mock.patch.object(Batch, "finish")
+class TestStorageStorageGCPCompositeUpload(unittest.TestCase):
+    def setUp(self):
+        self.bucket = BucketTesting()
+        self.local_file = tempfile.NamedTemporaryFile(suffix=".bin")
+        self.local_file.write(os.urandom(1000))
+        self.local_file.flush()
+
+    def tearDown(self):
+        self.local_file.close()
+
+    def test_that_composes_parts_into_destination_and_deletes_parts(
+        self, mock_finish: mock.MagicMock
+    ):
+        blob = self.__upload(parts=4)
+
+        self.assertEqual(self.__content(), blob.content)
+        self.assertEqual([4], self.bucket.composes)
+        self.assertEqual(["ex1/test.bin"], list(self.bucket.objects))
+
+    def test_that_nests_compose_when_there_are_more_than_max_components(
+        self, mock_finish: mock.MagicMock
+    ):
+        blob = self.__upload(parts=100)
+
+        self.assertEqual(self.__content(), blob.content)
+        self.assertEqual([32, 32, 32, 4, 4], self.bucket.composes)
+        self.assertEqual(["ex1/test.bin"], list(self.bucket.objects))
+
+    def test_that_deletes_parts_when_composing_fails(self, mock_finish: mock.MagicMock):
+        with mock.patch.object(
+            BlobTesting, "compose", side_effect=RuntimeError("compose failed")
+        ):
+            with self.assertRaises(RuntimeError):
+                self.__upload(parts=4)
+
+        self.assertEqual([], list(self.bucket.objects))
+
+    def test_that_raises_part_error_when_deleting_parts_also_fails(
+        self, mock_finish: mock.MagicMock
+    ):
+        with mock.patch.object(
+            BlobTesting, "upload_from_file", side_effect=RuntimeError("part failed")
+        ), mock.patch.object(
+            BlobTesting, "delete", side_effect=exceptions.NotFound("No such object")
+        ):
+            with self.assertRaisesRegex(RuntimeError, "part failed"):
+                self.__upload(parts=4)
+
+    def test_that_returns_composed_blob_when_deleting_parts_fails(
+        self, mock_finish: mock.MagicMock
+    ):
+        blob = self.bucket.blob("ex1/test.bin")
+        upload = CompositeUpload(self.bucket, blob, self.local_file.name, 4)
+
+        with mock.patch.object(
+            BlobTesting, "delete", side_effect=exceptions.ServiceUnavailable("")
+        ):
+            self.assertIs(blob, upload.run())
+
+        self.assertEqual(self.__content(), blob.content)
+        self.assertEqual(1, len(upload.cleanup_errors))
+        self.assertIsInstance(upload.cleanup_errors[0], exceptions.ServiceUnavailable)
+
+    # private
+
+    def __upload(self, parts: int) -> BlobTesting:
+        blob = self.bucket.blob("ex1/test.bin")
+        upload = CompositeUpload(self.bucket, blob, self.local_file.name, parts)
+
+        return upload.run()
+
+    def __content(self) -> bytes:
+        with open(self.local_file.name, "rb") as local_file:
+            return local_file.read()
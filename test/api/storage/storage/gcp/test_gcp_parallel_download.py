@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+import mock
+
+from api.storage.storage.gcp.parallel_download import ParallelDownload
+
+
+class TestStorageStorageGCPParallelDownload(unittest.TestCase):
+    def setUp(self):
+        self.local_dir = tempfile.TemporaryDirectory()
+        self.local_file_path = os.path.join(self.local_dir.name, "test.bin")
+        self.content = os.urandom(1000)
+        self.blob = self.__mock_blob()
+
+    def tearDown(self):
+        self.local_dir.cleanup()
+
+    def test_that_downloads_small_object_with_single_request(self):
+        ParallelDownload(self.blob, self.local_file_path, threshold=1000).run()
+
+        self.blob.download_to_filename.assert_called_once()
+        self.blob.download_to_file.assert_not_called()
+
+        self.assertEqual(self.content, self.__downloaded())
+
+    def test_that_downloads_large_object_as_concurrent_ranges(self):
+        ParallelDownload(self.blob, self.local_file_path, threshold=10, parts=3).run()
+
+        self.blob.download_to_filename.assert_not_called()
+
+        ranges = sorted(
+            (call[1]["start"], call[1]["end"])
+            for call in self.blob.download_to_file.call_args_list
+        )
+
+        self.assertEqual([(0, 333), (334, 667), (668, 999)], ranges)
+        self.assertEqual(self.content, self.__downloaded())
+
+    def test_that_leaves_no_partial_file_when_a_range_fails(self):
+        self.blob.download_to_file.side_effect = RuntimeError("connection dropped")
+
+        with self.assertRaises(RuntimeError):
+            ParallelDownload(self.blob, self.local_file_path, threshold=10).run()
+
+        self.assertEqual([], os.listdir(self.local_dir.name))
+
+    # private
+
+    def __mock_blob(self) -> mock.MagicMock:
+        def download_to_filename(file_path: str) -> None:
+            with open(file_path, "wb") as local_file:
+                local_file.write(self.content)
+
+        def download_to_file(local_file: object, start: int, end: int) -> None:
+            local_file.write(self.content[start:][: end - start + 1])
+
+        blob = mock.Mock()
+        blob.size = len(self.content)
+        blob.download_to_filename.side_effect = download_to_filename
+        blob.download_to_file.side_effect = download_to_file
+
+        return blob
+
+    def __downloaded(self) -> bytes:
+        with open(self.local_file_path, "rb") as local_file:
+            return local_file.read()
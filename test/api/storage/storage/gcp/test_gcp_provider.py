@@ -1,6 +1,16 @@
+import io
+import os
+import tempfile
 import unittest
 import mock
 
+from google.api_core import exceptions
+
+from lib.common.circuit_breaker_group import CircuitBreakerGroup
+from lib.common.hedger import Hedger
+from lib.common.retry_policy import RetryPolicy
+
+from api.storage.storage.gcp.client_pool import ClientPool
 from api.storage.storage.gcp.provider import Provider as GCPProvider
 from api.storage.storage.gcp.request import Request as GCPRequest
 
@@ -11,6 +21,21 @@ class TestStorageStorageGCPProvider(unittest.TestCase):
     def setUp(self):
         self.provider = GCPProvider()
 
+    def test_that_closing_leaves_shared_default_client_pool_open(self):
+        other = GCPProvider()
+
+        self.provider.close()
+
+        self.assertIs(ClientPool.default(), other.client_pool)
+        self.assertFalse(other.client_pool.closed)
+
+    def test_that_closes_client_pool_passed_in(self):
+        client_pool = ClientPool()
+
+        GCPProvider(client_pool=client_pool).close()
+
+        self.assertTrue(client_pool.closed)
+
     def test_that_can_set_and_get_bucket(self):
         self.provider.set_bucket("bucket-testing")
         self.assertEqual("bucket-testing", self.provider.get_bucket())
@@ -51,6 +76,71 @@ class TestStorageStorageGCPProvider(unittest.TestCase):
         self.assertEqual("gs://bucket-testing/ex1/test.txt", response.get("uri"))
         self.assertTrue(response.get("exists"))
 
+    @mock.patch.object(GCPRequest, "upload")
+    def test_that_can_upload_many_files_in_input_order_with_errors_per_file(
+        self, mock_request: mock.MagicMock
+    ):
+        def upload(remote_file_path: str, local_file_path: str) -> mock.MagicMock:
+            if remote_file_path == "ex1/missing.txt":
+                raise StorageError.FileNotFound("uploading file not found")
+
+            return self.__mock_existed_file_object()
+
+        mock_request.side_effect = upload
+
+        with tempfile.NamedTemporaryFile() as local_file:
+            local_file.write(b"12345")
+            local_file.flush()
+
+            self.provider.set_bucket(self.bucket)
+            response = self.provider.request_upload_many(
+                [
+                    (self.remote_file_path(), local_file.name),
+                    ("ex1/missing.txt", os.path.join(local_file.name, "missing")),
+                    (self.remote_file_path(), local_file.name),
+                ],
+                max_workers=2,
+            )
+
+        self.assertEqual(3, mock_request.call_count)
+        self.assertTrue(response["results"][0].get("exists"))
+        self.assertIsInstance(response["results"][1], StorageError.FileNotFound)
+        self.assertTrue(response["results"][2].get("exists"))
+        self.assertEqual(10, response["total_bytes"])
+        self.assertGreaterEqual(response["bytes_per_second"], 0)
+
+    @mock.patch.object(GCPRequest, "upload_checked")
+    def test_that_reports_skipped_and_verified_uploads_in_checksum_mode(
+        self, mock_request: mock.MagicMock
+    ):
+        def upload_checked(remote_file_path, local_file_path, checksum_cache):
+            upload = mock.Mock(blob=self.__mock_existed_file_object(), verified=True)
+            upload.skipped = remote_file_path == "ex1/same.txt"
+
+            return upload
+
+        mock_request.side_effect = upload_checked
+        checksum_cache = mock.Mock()
+        provider = GCPProvider(checksum_uploads=True, checksum_cache=checksum_cache)
+
+        with tempfile.NamedTemporaryFile() as local_file:
+            local_file.write(b"12345")
+            local_file.flush()
+
+            provider.set_bucket(self.bucket)
+            response = provider.request_upload_many(
+                [("ex1/same.txt", local_file.name), ("ex1/new.txt", local_file.name)]
+            )
+
+        mock_request.assert_any_call("ex1/new.txt", local_file.name, checksum_cache)
+
+        self.assertTrue(response["results"][0]["skipped"])
+        self.assertFalse(response["results"][1]["skipped"])
+        self.assertTrue(response["results"][1]["verified"])
+        self.assertEqual(1, response["skipped"])
+        self.assertEqual(2, response["verified"])
+        self.assertEqual(5, response["total_bytes"])
+
     @mock.patch.object(GCPRequest, "delete")
     def test_that_raises_file_not_found_when_deleting_file_from_bucket_but_file_is_not_existed(
         self, mock_request: mock.MagicMock
@@ -109,6 +199,158 @@ class TestStorageStorageGCPProvider(unittest.TestCase):
         self.assertEqual("gs://bucket-testing/ex1/test.txt", response.get("uri"))
         self.assertTrue(response.get("exists"))
 
+    @mock.patch.object(GCPRequest, "retrieve")
+    def test_that_retries_transient_errors_when_retrieving_file(
+        self, mock_request: mock.MagicMock
+    ):
+        mock_request.side_effect = [
+            exceptions.ServiceUnavailable(""),
+            self.__mock_existed_file_object(),
+        ]
+        provider = GCPProvider(retry_policy=RetryPolicy(sleep=lambda _: None))
+        provider.set_bucket(self.bucket)
+
+        response = provider.request_retrieve(self.remote_file_path())
+
+        self.assertEqual(2, mock_request.call_count)
+        self.assertEqual(self.remote_file_path(), response.get("name"))
+        self.assertEqual(1, provider.retry_policy.stats()["retries"])
+
+    @mock.patch.object(GCPRequest, "upload")
+    def test_that_does_not_retry_upload_after_server_error(
+        self, mock_request: mock.MagicMock
+    ):
+        mock_request.side_effect = exceptions.InternalServerError("")
+        provider = GCPProvider(retry_policy=RetryPolicy(sleep=lambda _: None))
+        provider.set_bucket(self.bucket)
+
+        with self.assertRaises(exceptions.InternalServerError):
+            provider.request_upload(self.remote_file_path(), "file.txt")
+
+        mock_request.assert_called_once()
+
+    @mock.patch.object(GCPRequest, "delete")
+    def test_that_fails_fast_with_circuit_open_after_repeated_server_errors(
+        self, mock_request: mock.MagicMock
+    ):
+        mock_request.side_effect = exceptions.ServiceUnavailable("")
+        provider = GCPProvider(
+            retry_policy=RetryPolicy(max_attempts=1),
+            circuit_breakers=CircuitBreakerGroup(
+                StorageError.CircuitOpen,
+                window=2,
+                minimum_calls=2,
+                failure_errors=(exceptions.ServiceUnavailable,),
+            ),
+        )
+        provider.set_bucket(self.bucket)
+
+        for _ in range(2):
+            with self.assertRaises(exceptions.ServiceUnavailable):
+                provider.request_delete(self.remote_file_path())
+
+        with self.assertRaises(StorageError.CircuitOpen):
+            provider.request_delete(self.remote_file_path())
+
+        self.assertEqual(2, mock_request.call_count)
+
+    @mock.patch.object(Hedger, "call")
+    @mock.patch.object(GCPRequest, "retrieve")
+    def test_that_hedges_retrieve_when_hedger_is_given(
+        self, mock_request: mock.MagicMock, mock_hedge: mock.MagicMock
+    ):
+        mock_hedge.return_value = self.__mock_existed_file_object()
+        provider = GCPProvider(hedger=Hedger())
+        provider.set_bucket(self.bucket)
+
+        response = provider.request_retrieve(self.remote_file_path())
+
+        mock_hedge.assert_called_once_with(mock_request, self.remote_file_path())
+
+        self.assertEqual(self.remote_file_path(), response.get("name"))
+
+    @mock.patch.object(GCPRequest, "list_objects")
+    def test_that_can_list_objects_and_prefixes(self, mock_request: mock.MagicMock):
+        mock_request.return_value = iter(
+            [self.__mock_existed_file_object(), "ex1/dir/"]
+        )
+        self.provider.set_bucket("bucket-testing")
+
+        response = list(self.provider.request_list("ex1/", "/"))
+
+        mock_request.assert_called_once_with("ex1/", "/", 1, mock.ANY)
+
+        self.assertEqual(self.remote_file_path(), response[0].get("name"))
+        self.assertFalse(response[0].get("prefix"))
+        self.assertEqual("ex1/dir/", response[1].get("name"))
+        self.assertEqual("gs://bucket-testing/ex1/dir/", response[1].get("uri"))
+        self.assertTrue(response[1].get("prefix"))
+
+    @mock.patch.object(GCPRequest, "_Request__list_page")
+    def test_that_retries_transient_errors_when_listing_a_page(
+        self, mock_page: mock.MagicMock
+    ):
+        mock_page.side_effect = [
+            ([self.__mock_existed_file_object()], [], "token"),
+            exceptions.ServiceUnavailable(""),
+            ([], ["ex1/dir/"], None),
+        ]
+        provider = GCPProvider(retry_policy=RetryPolicy(sleep=lambda _: None))
+        provider.set_bucket("bucket-testing")
+
+        response = list(provider.request_list("ex1/", "/"))
+
+        self.assertEqual(
+            [
+                mock.call("ex1/", "/", None),
+                mock.call("ex1/", "/", "token"),
+                mock.call("ex1/", "/", "token"),
+            ],
+            mock_page.call_args_list,
+        )
+        self.assertEqual(["ex1/test.txt", "ex1/dir/"], [r["name"] for r in response])
+        self.assertEqual(1, provider.retry_policy.stats()["retries"])
+
+    @mock.patch.object(GCPRequest, "upload_stream")
+    def test_that_rewinds_and_retries_seekable_stream_after_rejection(
+        self, mock_request: mock.MagicMock
+    ):
+        source = io.BytesIO(b"header,data")
+        source.read(7)
+        reads = []
+
+        def upload_stream(remote_file_path, source, chunk_size):
+            reads.append(source.read())
+
+            if len(reads) == 1:
+                raise exceptions.TooManyRequests("")
+
+            return self.__mock_existed_file_object()
+
+        mock_request.side_effect = upload_stream
+        provider = GCPProvider(retry_policy=RetryPolicy(sleep=lambda _: None))
+        provider.set_bucket(self.bucket)
+
+        response = provider.request_upload_stream(self.remote_file_path(), source)
+
+        self.assertEqual([b"data", b"data"], reads)
+        self.assertEqual(self.remote_file_path(), response.get("name"))
+
+    @mock.patch.object(GCPRequest, "upload_stream")
+    def test_that_does_not_retry_stream_which_can_not_be_replayed(
+        self, mock_request: mock.MagicMock
+    ):
+        mock_request.side_effect = exceptions.TooManyRequests("")
+        provider = GCPProvider(retry_policy=RetryPolicy(sleep=lambda _: None))
+        provider.set_bucket(self.bucket)
+
+        with self.assertRaises(exceptions.TooManyRequests):
+            provider.request_upload_stream(
+                self.remote_file_path(), (chunk for chunk in [b"a", b"b"])
+            )
+
+        mock_request.assert_called_once()
+
     # static
 
     @staticmethod
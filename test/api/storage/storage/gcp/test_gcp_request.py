@@ -1,3 +1,4 @@
+import tempfile
 import unittest
 import mock
 
@@ -5,6 +6,8 @@ from google.cloud import exceptions
 
 from lib.storage import errors as StorageError
 
+from api.storage.storage.gcp.batch import Batch
+from api.storage.storage.gcp.composite_upload import CompositeUpload
 from api.storage.storage.gcp.request import Request as GCPRequest
 
 
@@ -23,11 +26,76 @@ class TestStorageStorageGCPRequest(unittest.TestCase):
 
         mock_storage_client.assert_called_once()
 
+    @mock.patch.object(GCPRequest, "_Request__blob_object")
+    def test_that_raises_bucket_not_found_when_uploading_to_trusted_bucket_which_is_not_existed(
+        self, mock_blob: mock.MagicMock
+    ):
+        mock_blob_object = self.__mock_blob_object()
+        mock_blob_object.upload_from_filename = mock.Mock(
+            side_effect=exceptions.NotFound("The specified bucket does not exist.")
+        )
+
+        mock_blob.return_value = mock_blob_object
+
+        with self.assertRaises(StorageError.BucketNotFound):
+            self.request.upload(self.remote_file_path, self.local_file_path)
+
+    @mock.patch.object(GCPRequest, "_Request__blob_object")
+    def test_that_raises_uploading_file_not_found_when_checked_file_is_not_existed(
+        self, mock_blob: mock.MagicMock
+    ):
+        mock_blob.return_value = self.__mock_blob_object()
+
+        with self.assertRaises(StorageError.FileNotFound):
+            self.request.upload_checked(self.remote_file_path, "missing/test.txt")
+
+    @mock.patch.object(GCPRequest, "_Request__blob_object")
+    def test_that_checked_upload_sends_file_when_remote_object_is_missing(
+        self, mock_blob: mock.MagicMock
+    ):
+        mock_blob_object = self.__mock_blob_object()
+        mock_blob_object.reload.side_effect = exceptions.NotFound("No such object")
+        mock_blob_object.upload_from_filename = mock.Mock()
+        mock_blob_object.md5_hash = None
+        mock_blob_object.crc32c = None
+
+        mock_blob.return_value = mock_blob_object
+
+        with tempfile.NamedTemporaryFile() as local_file:
+            upload = self.request.upload_checked(self.remote_file_path, local_file.name)
+
+        mock_blob_object.upload_from_filename.assert_called_once_with(local_file.name)
+
+        self.assertFalse(upload.skipped)
+        self.assertIs(mock_blob_object, upload.blob)
+
+    @mock.patch.object(GCPRequest, "_Request__blob_object")
+    def test_that_keeps_cached_bucket_when_object_is_missing_in_bucket_named_bucket(
+        self, mock_blob: mock.MagicMock
+    ):
+        mock_blob_object = self.__mock_deleted_file_object()
+        mock_blob_object.reload = mock.Mock(
+            side_effect=exceptions.NotFound("No such object: photo-bucket/test.txt")
+        )
+        mock_blob.return_value = mock_blob_object
+
+        request = GCPRequest("photo-bucket", bucket_cache=mock.Mock())
+
+        with self.assertRaises(StorageError.FileNotFound):
+            request.retrieve(self.remote_file_path)
+
+        request.bucket_cache.invalidate.assert_not_called()
+
     @mock.patch.object(GCPRequest, "_Request__blob_object")
     def test_that_can_not_retrieve_file_object_from_bucket_when_file_is_not_existed(
         self, mock_blob: mock.MagicMock
     ):
-        mock_blob.return_value = self.__mock_deleted_file_object()
+        mock_blob_object = self.__mock_deleted_file_object()
+        mock_blob_object.reload = mock.Mock(
+            side_effect=exceptions.NotFound("No such object: ex1/test.txt")
+        )
+
+        mock_blob.return_value = mock_blob_object
 
         with self.assertRaises(StorageError.FileNotFound):
             self.request.retrieve(self.remote_file_path)
@@ -48,7 +116,7 @@ class TestStorageStorageGCPRequest(unittest.TestCase):
         response = self.request.retrieve(self.remote_file_path)
 
         mock_blob.assert_called_once_with(self.remote_file_path)
-        mock_retrieve.assert_called_once()
+        mock_retrieve.assert_called_once_with(mock_blob_object)
 
         self.assertEqual(1, response.id)
         self.assertEqual("bucket-testing", response.bucket.name)
@@ -90,17 +158,71 @@ class TestStorageStorageGCPRequest(unittest.TestCase):
         self.assertEqual("bucket-testing", response.bucket.name)
         self.assertTrue(response.exists())
 
+    @mock.patch.object(GCPRequest, "_Request__blob_object")
+    @mock.patch.object(CompositeUpload, "run")
+    def test_that_uses_composite_upload_when_file_is_larger_than_threshold(
+        self, mock_composite: mock.MagicMock, mock_blob: mock.MagicMock
+    ):
+        mock_composite.return_value = self.__mock_existed_file_object()
+
+        request = GCPRequest("abcde", composite_threshold=4)
+
+        with tempfile.NamedTemporaryFile() as local_file:
+            local_file.write(b"12345")
+            local_file.flush()
+
+            response = request.upload(self.remote_file_path, local_file.name)
+
+        mock_composite.assert_called_once()
+
+        self.assertEqual(1, response.id)
+
+    @mock.patch.object(GCPRequest, "_Request__blob_object")
+    def test_that_can_upload_stream_in_resumable_chunks(
+        self, mock_blob: mock.MagicMock
+    ):
+        mock_blob_object = mock.Mock()
+        mock_blob.return_value = mock_blob_object
+
+        response = self.request.upload_stream(
+            self.remote_file_path, iter([b"a", b"b"]), chunk_size=256 * 1024
+        )
+
+        mock_blob.assert_called_once_with(self.remote_file_path)
+
+        stream = mock_blob_object.upload_from_file.call_args[0][0]
+
+        self.assertEqual(b"ab", stream.read())
+        self.assertEqual(256 * 1024, response.chunk_size)
+
     @mock.patch.object(GCPRequest, "_Request__blob_object")
     def test_that_can_not_delete_file_from_bucket_when_file_is_not_existed(
         self, mock_blob: mock.MagicMock
     ):
-        mock_blob.return_value = self.__mock_deleted_file_object()
+        mock_blob_object = self.__mock_deleted_file_object()
+        mock_blob_object.delete = mock.Mock(
+            side_effect=exceptions.NotFound("No such object: ex1/test.txt")
+        )
+
+        mock_blob.return_value = mock_blob_object
 
         with self.assertRaises(StorageError.FileNotFound):
             self.request.delete(self.remote_file_path)
 
         mock_blob.assert_called_once_with(self.remote_file_path)
 
+    @mock.patch.object(GCPRequest, "_Request__blob_object")
+    def test_that_deletes_file_with_single_request_without_checking_existence(
+        self, mock_blob: mock.MagicMock
+    ):
+        mock_blob_object = mock.Mock()
+        mock_blob.return_value = mock_blob_object
+
+        self.request.delete(self.remote_file_path)
+
+        mock_blob_object.delete.assert_called_once()
+        mock_blob_object.exists.assert_not_called()
+
     @mock.patch.object(GCPRequest, "_Request__blob_object")
     @mock.patch.object(GCPRequest, "_Request__delete_from_storage")
     def test_that_can_delete_file_from_bucket(
@@ -121,6 +243,108 @@ class TestStorageStorageGCPRequest(unittest.TestCase):
         self.assertEqual("bucket-testing", response.bucket.name)
         self.assertFalse(response.exists())
 
+    @mock.patch.object(GCPRequest, "_Request__storage_client")
+    def test_that_lists_objects_and_prefixes_page_by_page(
+        self, mock_storage_client: mock.MagicMock
+    ):
+        first_page = mock.MagicMock()
+        first_page.__iter__.return_value = ["blob-1", "blob-2"]
+        first_page.prefixes = ("ex1/dir/",)
+        second_page = mock.MagicMock()
+        second_page.__iter__.return_value = ["blob-3"]
+        second_page.prefixes = ()
+        mock_storage_client.return_value.list_blobs.side_effect = [
+            mock.Mock(pages=iter([first_page]), next_page_token="token"),
+            mock.Mock(pages=iter([second_page]), next_page_token=None),
+        ]
+
+        response = list(self.request.list_objects("ex1/", "/"))
+
+        self.assertEqual(
+            [
+                mock.call(
+                    page_token=None,
+                    prefix="ex1/",
+                    delimiter="/",
+                    fields=GCPRequest.LIST_FIELDS,
+                ),
+                mock.call(
+                    page_token="token",
+                    prefix="ex1/",
+                    delimiter="/",
+                    fields=GCPRequest.LIST_FIELDS,
+                ),
+            ],
+            mock_storage_client.return_value.list_blobs.call_args_list,
+        )
+        self.assertEqual(["blob-1", "blob-2", "ex1/dir/", "blob-3"], response)
+
+    @mock.patch.object(GCPRequest, "_Request__storage_client")
+    def test_that_fetches_every_list_page_through_given_call(
+        self, mock_storage_client: mock.MagicMock
+    ):
+        page = mock.MagicMock()
+        page.__iter__.return_value = ["blob-1"]
+        page.prefixes = ()
+        mock_storage_client.return_value.list_blobs.return_value = mock.Mock(
+            pages=iter([page]), next_page_token=None
+        )
+        calls = []
+
+        def call(function, *args):
+            calls.append(args)
+
+            return function(*args)
+
+        response = list(self.request.list_objects("ex1/", call=call))
+
+        self.assertEqual([("ex1/", None, None)], calls)
+        self.assertEqual(["blob-1"], response)
+
+    @mock.patch.object(GCPRequest, "_Request__storage_client")
+    def test_that_raises_bucket_not_found_when_listing_missing_bucket(
+        self, mock_storage_client: mock.MagicMock
+    ):
+        mock_storage_client.return_value.list_blobs.return_value.pages = iter(
+            self.__raise(exceptions.NotFound("The specified bucket does not exist."))
+        )
+
+        with self.assertRaises(StorageError.BucketNotFound):
+            list(self.request.list_objects())
+
+    @mock.patch.object(GCPRequest, "_Request__storage_client")
+    @mock.patch.object(Batch, "finish", autospec=True)
+    def test_that_returns_file_not_found_per_path_when_deleting_many_files(
+        self, mock_finish: mock.MagicMock, mock_storage_client: mock.MagicMock
+    ):
+        def finish(batch):
+            batch.errors = [None, exceptions.NotFound("No such object")]
+
+        mock_finish.side_effect = finish
+
+        response = self.request.delete_many(["ex1/test.txt", "ex1/missing.txt"])
+
+        mock_finish.assert_called_once()
+
+        self.assertNotIsInstance(response[0], Exception)
+        self.assertIsInstance(response[1], StorageError.FileNotFound)
+
+    @mock.patch.object(GCPRequest, "_Request__storage_client")
+    @mock.patch.object(Batch, "finish", autospec=True)
+    def test_that_splits_retrieving_many_files_into_batches_of_max_size(
+        self, mock_finish: mock.MagicMock, mock_storage_client: mock.MagicMock
+    ):
+        def finish(batch):
+            batch.errors = [None] * Batch.MAX_SIZE
+
+        mock_finish.side_effect = finish
+
+        remote_file_paths = [f"ex1/{i}.txt" for i in range(Batch.MAX_SIZE + 1)]
+        response = self.request.retrieve_many(remote_file_paths)
+
+        self.assertEqual(2, mock_finish.call_count)
+        self.assertEqual(Batch.MAX_SIZE + 1, len(response))
+
     # static
 
     @staticmethod
@@ -140,6 +364,10 @@ class TestStorageStorageGCPRequest(unittest.TestCase):
 
     # private
 
+    def __raise(self, error: Exception) -> iter:
+        raise error
+        yield
+
     def __mock_blob_object(self) -> mock.MagicMock:
         obj = mock.Mock()
         obj.upload_from_filename = lambda local_file_path: "uploading"
@@ -0,0 +1,167 @@
+import os
+import tempfile
+import unittest
+import mock
+import requests
+
+from api.storage.storage.gcp.resumable_upload import ResumableUpload
+
+
+class ResumableSessionTesting(object):
+    def __init__(self, fail_at_chunk: int = None):
+        self.received = b""
+        self.chunks = 0
+        self.fail_at_chunk = fail_at_chunk
+        self.expired = False
+
+    def request(
+        self, method: str, url: str, data: bytes = None, headers: dict = None, **kwargs
+    ) -> requests.Response:
+        content_range = headers["content-range"]
+        total = content_range.split("/")[1]
+
+        if self.expired:
+            self.expired = False
+            self.received = b""
+
+            return self.__response(410)
+
+        if content_range.startswith("bytes */"):
+            if len(self.received) == int(total):
+                return self.__response(200, b'{"name": "ex1/test.bin"}')
+
+            return self.__response(308)
+
+        self.chunks += 1
+
+        if self.chunks == self.fail_at_chunk:
+            raise RuntimeError("connection dropped")
+
+        self.received += data
+
+        if len(self.received) == int(total):
+            return self.__response(200, b'{"name": "ex1/test.bin"}')
+
+        return self.__response(308)
+
+    # private
+
+    def __response(self, status_code: int, content: bytes = b"") -> requests.Response:
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = content
+
+        if self.received:
+            response.headers["range"] = f"bytes=0-{len(self.received) - 1}"
+
+        return response
+
+
+class TestStorageStorageGCPResumableUpload(unittest.TestCase):
+    def setUp(self):
+        self.state_dir = tempfile.TemporaryDirectory()
+        self.local_file = tempfile.NamedTemporaryFile(suffix=".bin")
+        self.local_file.write(os.urandom(self.chunk_size() * 3 + 10))
+        self.local_file.flush()
+
+    def tearDown(self):
+        self.local_file.close()
+        self.state_dir.cleanup()
+
+    def test_that_raises_value_error_when_chunk_size_is_not_aligned(self):
+        with self.assertRaises(ValueError):
+            ResumableUpload(
+                self.__mock_blob(ResumableSessionTesting()), self.local_file.name, 1000
+            )
+
+    def test_that_uploads_file_in_chunks_and_clears_state(self):
+        session = ResumableSessionTesting()
+        upload = self.__upload(session)
+
+        blob = upload.run()
+
+        self.assertEqual(4, session.chunks)
+        self.assertEqual(self.__content(), session.received)
+        self.assertFalse(os.path.exists(upload.state_file()))
+        blob._set_properties.assert_called_once_with({"name": "ex1/test.bin"})
+
+    def test_that_resumes_from_last_committed_chunk_after_failure(self):
+        session = ResumableSessionTesting(fail_at_chunk=3)
+        upload = self.__upload(session)
+
+        with self.assertRaises(RuntimeError):
+            upload.run()
+
+        self.assertTrue(os.path.exists(upload.state_file()))
+
+        retry = self.__upload(session)
+        retry.run()
+
+        retry.blob.create_resumable_upload_session.assert_not_called()
+
+        self.assertEqual(self.__content(), session.received)
+        self.assertFalse(os.path.exists(retry.state_file()))
+
+    def test_that_reloads_blob_instead_of_uploading_again_when_session_finished(
+        self,
+    ):
+        session = ResumableSessionTesting()
+        upload = self.__upload(session)
+
+        with mock.patch("os.remove"):
+            upload.run()
+
+        self.assertTrue(os.path.exists(upload.state_file()))
+
+        retry = self.__upload(session)
+        retry.run()
+
+        retry.blob.reload.assert_called_once()
+        retry.blob.create_resumable_upload_session.assert_not_called()
+
+        self.assertEqual(4, session.chunks)
+        self.assertFalse(os.path.exists(retry.state_file()))
+
+    def test_that_restarts_when_saved_session_has_expired(self):
+        session = ResumableSessionTesting(fail_at_chunk=2)
+        upload = self.__upload(session)
+
+        with self.assertRaises(RuntimeError):
+            upload.run()
+
+        session.expired = True
+        retry = self.__upload(session)
+        retry.run()
+
+        retry.blob.create_resumable_upload_session.assert_called_once()
+
+        self.assertEqual(self.__content(), session.received)
+
+    # static
+
+    @staticmethod
+    def chunk_size() -> int:
+        return 256 * 1024
+
+    # private
+
+    def __upload(self, session: ResumableSessionTesting) -> ResumableUpload:
+        return ResumableUpload(
+            self.__mock_blob(session),
+            self.local_file.name,
+            self.chunk_size(),
+            self.state_dir.name,
+        )
+
+    def __mock_blob(self, session: ResumableSessionTesting) -> mock.MagicMock:
+        blob = mock.Mock()
+        blob.bucket.name = "bucket-testing"
+        blob.name = "ex1/test.bin"
+        blob.client._http = session
+        blob.create_resumable_upload_session.return_value = "https://upload/session"
+
+        return blob
+
+    def __content(self) -> bytes:
+        with open(self.local_file.name, "rb") as local_file:
+            return local_file.read()
@@ -0,0 +1,47 @@
+import os
+import tempfile
+import unittest
+
+from lib.storage import errors as StorageError
+
+from api.storage.storage.local.directory_store import DirectoryStore
+
+
+class TestStorageStorageLocalDirectoryStore(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = DirectoryStore(self.directory.name)
+        self.store.create_bucket("bucket-testing")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_that_stores_objects_as_files_under_bucket_directory(self):
+        metadata = self.store.write("bucket-testing", "ex1/test.txt", b"content")
+        path = os.path.join(self.directory.name, "bucket-testing", "ex1", "test.txt")
+
+        with open(path, "rb") as local_file:
+            self.assertEqual(b"content", local_file.read())
+
+        self.assertEqual(7, metadata["size"])
+        self.assertTrue(metadata["url"].startswith("file://"))
+        self.assertEqual(b"content", self.store.read("bucket-testing", "ex1/test.txt"))
+
+    def test_that_lists_nested_names_and_ignores_temporary_uploads(self):
+        for name in ("ex1/sub/b.txt", "ex1/a.txt", "ex2/c.txt"):
+            self.store.write("bucket-testing", name, b"")
+
+        self.assertFalse(self.store.has_bucket(DirectoryStore.TEMP_DIR))
+        self.assertEqual(
+            ["ex1/a.txt", "ex1/sub/b.txt"], self.store.names("bucket-testing", "ex1/")
+        )
+
+    def test_that_raises_not_found_errors(self):
+        with self.assertRaises(StorageError.BucketNotFound):
+            self.store.names("abcde")
+
+        with self.assertRaises(StorageError.FileNotFound):
+            self.store.delete("bucket-testing", "ex1/missing.txt")
+
+        with self.assertRaises(StorageError.FileNotFound):
+            self.store.read("bucket-testing", "../outside.txt")
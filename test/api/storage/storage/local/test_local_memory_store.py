@@ -0,0 +1,44 @@
+import base64
+import hashlib
+import unittest
+
+from lib.storage import errors as StorageError
+
+from api.storage.storage.local.memory_store import MemoryStore
+
+
+class TestStorageStorageLocalMemoryStore(unittest.TestCase):
+    def setUp(self):
+        self.store = MemoryStore()
+        self.store.create_bucket("bucket-testing")
+
+    def test_that_raises_bucket_not_found_when_bucket_is_not_created(self):
+        self.assertFalse(self.store.has_bucket("abcde"))
+
+        with self.assertRaises(StorageError.BucketNotFound):
+            self.store.write("abcde", "ex1/test.txt", b"content")
+
+    def test_that_writes_reads_and_deletes_objects_with_metadata(self):
+        first = self.store.write("bucket-testing", "ex1/test.txt", b"content")
+        second = self.store.write("bucket-testing", "ex1/test.txt", b"content")
+
+        self.assertEqual(b"content", self.store.read("bucket-testing", "ex1/test.txt"))
+        self.assertEqual(7, second["size"])
+        self.assertEqual(
+            base64.b64encode(hashlib.md5(b"content").digest()).decode(),
+            second["md5_hash"],
+        )
+        self.assertGreater(second["generation"], first["generation"])
+
+        self.store.delete("bucket-testing", "ex1/test.txt")
+
+        with self.assertRaises(StorageError.FileNotFound):
+            self.store.stat("bucket-testing", "ex1/test.txt")
+
+    def test_that_lists_names_under_prefix_in_order(self):
+        for name in ("ex2/b.txt", "ex1/b.txt", "ex1/a.txt"):
+            self.store.write("bucket-testing", name, b"")
+
+        self.assertEqual(
+            ["ex1/a.txt", "ex1/b.txt"], self.store.names("bucket-testing", "ex1/")
+        )
@@ -0,0 +1,166 @@
+import os
+import tempfile
+import threading
+import unittest
+import mock
+
+from google.api_core import exceptions
+
+from lib.common.retry_policy import RetryPolicy
+from lib.storage import errors as StorageError
+
+from api.storage.storage.local.directory_store import DirectoryStore
+from api.storage.storage.local.provider import Provider as LocalProvider
+
+
+class TestStorageStorageLocalProvider(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.local_file_path = os.path.join(self.directory.name, "test.txt")
+        self.provider = LocalProvider(buckets=[self.bucket()])
+        self.provider.set_bucket(self.bucket())
+
+        with open(self.local_file_path, "wb") as local_file:
+            local_file.write(b"12345")
+
+    def tearDown(self):
+        self.provider.close()
+        self.directory.cleanup()
+
+    def test_that_raises_bucket_not_found_when_bucket_is_not_existed(self):
+        self.provider.set_bucket("abcde")
+
+        with self.assertRaises(StorageError.BucketNotFound):
+            self.provider.request_upload(self.remote_file_path(), self.local_file_path)
+
+    def test_that_uploads_retrieves_downloads_and_deletes_file(self):
+        upload = self.provider.request_upload(
+            self.remote_file_path(), self.local_file_path
+        )
+        retrieve = self.provider.request_retrieve(self.remote_file_path())
+        download_path = os.path.join(self.directory.name, "download.txt")
+        self.provider.request_download(self.remote_file_path(), download_path)
+        delete = self.provider.request_delete(self.remote_file_path())
+
+        with open(download_path, "rb") as local_file:
+            self.assertEqual(b"12345", local_file.read())
+
+        self.assertEqual(upload, retrieve)
+        self.assertEqual("local://bucket-testing/ex1/test.txt", upload["uri"])
+        self.assertTrue(upload["exists"])
+        self.assertIsNone(delete["id"])
+        self.assertFalse(delete["exists"])
+
+        with self.assertRaises(StorageError.FileNotFound):
+            self.provider.request_retrieve(self.remote_file_path())
+
+    def test_that_uploads_stream_and_opens_object(self):
+        self.provider.request_upload_stream(
+            self.remote_file_path(), (chunk for chunk in [b"12", b"345"])
+        )
+
+        with self.provider.request_open(self.remote_file_path()) as reader:
+            self.assertEqual(b"12345", reader.read())
+
+    def test_that_lists_objects_and_prefixes_with_delimiter(self):
+        for remote_file_path in ("ex1/a.txt", "ex1/sub/b.txt", "ex1/sub/c.txt"):
+            self.provider.request_upload(remote_file_path, self.local_file_path)
+
+        entries = list(self.provider.request_list("ex1/", delimiter="/"))
+
+        self.assertEqual(
+            [("ex1/a.txt", False, 5), ("ex1/sub/", True, None)],
+            [(entry["name"], entry["prefix"], entry["size"]) for entry in entries],
+        )
+
+    def test_that_batches_retrieve_and_delete_with_errors_per_file(self):
+        self.provider.request_upload(self.remote_file_path(), self.local_file_path)
+
+        paths = [self.remote_file_path(), "ex1/missing.txt"]
+        retrieved = self.provider.request_retrieve_many(paths)
+        deleted = self.provider.request_delete_many(paths)
+
+        self.assertTrue(retrieved[0]["exists"])
+        self.assertIsInstance(retrieved[1], StorageError.FileNotFound)
+        self.assertFalse(deleted[0]["exists"])
+        self.assertIsInstance(deleted[1], StorageError.FileNotFound)
+        self.assertEqual(3, self.provider.fault_injector.stats()["calls"])
+
+    def test_that_upload_many_runs_up_to_max_workers_at_once(self):
+        lock = threading.Lock()
+        barrier = threading.Barrier(16, timeout=5)
+        running = []
+
+        def upload(remote_file_path: str, local_file_path: str) -> dict:
+            with lock:
+                running.append(remote_file_path)
+
+            barrier.wait()
+
+            return {}
+
+        files = [(f"ex1/{index}.txt", self.local_file_path) for index in range(16)]
+
+        with mock.patch.object(self.provider, "request_upload", side_effect=upload):
+            response = self.provider.request_upload_many(files, max_workers=16)
+
+        self.assertEqual(16, len(running))
+        self.assertFalse(
+            any(isinstance(result, Exception) for result in response["results"])
+        )
+
+    def test_that_retries_injected_transient_errors(self):
+        provider = LocalProvider(
+            buckets=[self.bucket()],
+            error_rates={"retrieve": 0.5},
+            seed=3,
+            retry_policy=RetryPolicy(max_attempts=20, sleep=lambda seconds: None),
+        )
+        provider.set_bucket(self.bucket())
+        provider.request_upload(self.remote_file_path(), self.local_file_path)
+
+        for _ in range(10):
+            provider.request_retrieve(self.remote_file_path())
+
+        self.assertGreater(provider.retry_policy.stats()["retries"], 0)
+        self.assertEqual(
+            provider.fault_injector.stats()["failures"],
+            provider.retry_policy.stats()["retries"],
+        )
+
+    def test_that_raises_injected_error_when_retries_are_exhausted(self):
+        provider = LocalProvider(
+            buckets=[self.bucket()],
+            error_rate=1.0,
+            retry_policy=RetryPolicy(max_attempts=2, sleep=lambda seconds: None),
+        )
+        provider.set_bucket(self.bucket())
+
+        with self.assertRaises(exceptions.ServiceUnavailable):
+            provider.request_retrieve(self.remote_file_path())
+
+    def test_that_uses_directory_store_when_root_is_given(self):
+        provider = LocalProvider(root=self.directory.name, buckets=[self.bucket()])
+        provider.set_bucket(self.bucket())
+
+        response = provider.request_upload_many(
+            [(self.remote_file_path(), self.local_file_path)] * 3, max_workers=3
+        )
+
+        self.assertIsInstance(provider.store, DirectoryStore)
+        self.assertEqual(15, response["total_bytes"])
+        self.assertTrue(
+            os.path.exists(
+                os.path.join(self.directory.name, self.bucket(), "ex1", "test.txt")
+            )
+        )
+
+    # static
+
+    @staticmethod
+    def bucket() -> str:
+        return "bucket-testing"
+
+    @staticmethod
+    def remote_file_path() -> str:
+        return "ex1/test.txt"
@@ -0,0 +1,56 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from lib.common.async_executor import AsyncExecutor
+
+
+class TestLibCommonAsyncExecutor(unittest.TestCase):
+    def setUp(self):
+        self.executor = AsyncExecutor(concurrency=2)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_that_raises_value_error_when_concurrency_is_less_than_one(self):
+        with self.assertRaises(ValueError):
+            AsyncExecutor(concurrency=0)
+
+    def test_that_runs_blocking_function_off_the_event_loop(self):
+        loop_thread = []
+
+        async def run() -> int:
+            loop_thread.append(threading.get_ident())
+            return await self.executor.run(threading.get_ident)
+
+        self.assertNotEqual(loop_thread, [asyncio.run(run())])
+
+    def test_that_propagates_errors_from_function(self):
+        def fail() -> None:
+            raise FileNotFoundError
+
+        with self.assertRaises(FileNotFoundError):
+            asyncio.run(self.executor.run(fail))
+
+    def test_that_never_runs_more_calls_than_concurrency(self):
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+
+        def work() -> None:
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+
+            time.sleep(0.01)
+
+            with lock:
+                running[0] -= 1
+
+        async def run() -> None:
+            await asyncio.gather(*[self.executor.run(work) for _ in range(10)])
+
+        asyncio.run(run())
+
+        self.assertLessEqual(peak[0], 2)
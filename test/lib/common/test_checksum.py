@@ -0,0 +1,47 @@
+import base64
+import hashlib
+import os
+import tempfile
+import unittest
+import mock
+
+from lib.common import checksum
+from lib.common.checksum import Checksum
+
+
+class TestLibCommonChecksum(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "file.bin")
+        self.content = os.urandom(Checksum.CHUNK_SIZE + 10)
+
+        with open(self.path, "wb") as local_file:
+            local_file.write(self.content)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_that_hashes_file_in_chunks_as_base64_md5(self):
+        expected = base64.b64encode(hashlib.md5(self.content).digest()).decode()
+
+        self.assertEqual(expected, Checksum.file(self.path, ("md5",))["md5"])
+
+    def test_that_hashes_bytes_like_a_file_with_the_same_content(self):
+        self.assertEqual(Checksum.file(self.path), Checksum.data(self.content))
+
+    @mock.patch.object(checksum, "crcmod", None)
+    def test_that_skips_crc32c_when_crcmod_is_not_installed(self):
+        self.assertFalse(Checksum.available("crc32c"))
+        self.assertEqual(["md5"], list(Checksum.file(self.path).keys()))
+
+    def test_that_matches_on_md5_then_crc32c(self):
+        self.assertTrue(Checksum.matches({"md5": "a"}, {"md5_hash": "a"}))
+        self.assertFalse(
+            Checksum.matches(
+                {"md5": "a", "crc32c": "c"}, {"md5_hash": "b", "crc32c": "c"}
+            )
+        )
+        self.assertTrue(
+            Checksum.matches({"crc32c": "c"}, {"md5_hash": None, "crc32c": "c"})
+        )
+        self.assertIsNone(Checksum.matches({"md5": "a"}, {"crc32c": "c"}))
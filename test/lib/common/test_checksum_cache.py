@@ -0,0 +1,39 @@
+import os
+import tempfile
+import unittest
+
+from lib.common.checksum_cache import ChecksumCache
+
+
+class TestLibCommonChecksumCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "file.txt")
+        self.cache = ChecksumCache(os.path.join(self.directory.name, "cache.sqlite"))
+
+        self.__write(b"content")
+
+    def tearDown(self):
+        self.cache.close()
+        self.directory.cleanup()
+
+    def test_that_reuses_checksum_until_file_changes(self):
+        first = self.cache.get(self.path, ("md5",))
+        second = self.cache.get(self.path, ("md5",))
+
+        self.__write(b"changed content")
+        third = self.cache.get(self.path, ("md5",))
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, third)
+        self.assertEqual(1, self.cache.hits)
+        self.assertEqual(2, self.cache.misses)
+
+    # private
+
+    def __write(self, content: bytes) -> None:
+        with open(self.path, "wb") as local_file:
+            local_file.write(content)
+
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + len(content)))
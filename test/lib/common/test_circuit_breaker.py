@@ -0,0 +1,71 @@
+import unittest
+import mock
+
+from lib.common.circuit_breaker import CircuitBreaker
+
+
+class TestLibCommonCircuitBreaker(unittest.TestCase):
+    def setUp(self):
+        self.now = 0.0
+        self.breaker = CircuitBreaker(
+            "retrieve",
+            KeyError,
+            failure_rate=0.5,
+            window=4,
+            minimum_calls=4,
+            reset_timeout=10,
+            failure_errors=(ConnectionError,),
+            clock=lambda: self.now,
+        )
+
+    def test_that_opens_when_failure_rate_is_reached_and_fails_fast(self):
+        self.__outcomes([True, False, True, False])
+
+        self.assertEqual(CircuitBreaker.OPEN, self.breaker.state)
+
+        function = mock.Mock()
+
+        with self.assertRaises(KeyError):
+            self.breaker.call(function)
+
+        function.assert_not_called()
+
+    def test_that_does_not_count_errors_outside_failure_errors(self):
+        for _ in range(4):
+            with self.assertRaises(FileNotFoundError):
+                self.breaker.call(mock.Mock(side_effect=FileNotFoundError))
+
+        self.assertEqual(CircuitBreaker.CLOSED, self.breaker.state)
+
+    def test_that_closes_after_successful_probe_in_half_open_state(self):
+        self.__outcomes([False] * 4)
+        self.now = 10.0
+
+        self.assertEqual("ok", self.breaker.call(mock.Mock(return_value="ok")))
+        self.assertEqual(CircuitBreaker.CLOSED, self.breaker.state)
+
+    def test_that_reopens_after_failed_probe_and_allows_one_probe_at_a_time(self):
+        self.__outcomes([False] * 4)
+        self.now = 10.0
+
+        def probe() -> None:
+            with self.assertRaises(KeyError):
+                self.breaker.call(mock.Mock())
+
+            raise ConnectionError
+
+        with self.assertRaises(ConnectionError):
+            self.breaker.call(probe)
+
+        self.assertEqual(CircuitBreaker.OPEN, self.breaker.state)
+
+    # private
+
+    def __outcomes(self, outcomes: list) -> None:
+        for success in outcomes:
+            if success:
+                self.breaker.call(mock.Mock())
+                continue
+
+            with self.assertRaises(ConnectionError):
+                self.breaker.call(mock.Mock(side_effect=ConnectionError))
@@ -0,0 +1,20 @@
+import unittest
+import mock
+
+from lib.common.circuit_breaker_group import CircuitBreakerGroup
+
+
+class TestLibCommonCircuitBreakerGroup(unittest.TestCase):
+    def test_that_keeps_one_breaker_per_operation(self):
+        group = CircuitBreakerGroup(KeyError, window=2, minimum_calls=2)
+
+        for _ in range(2):
+            with self.assertRaises(ConnectionError):
+                group.call("upload", mock.Mock(side_effect=ConnectionError))
+
+        self.assertEqual("ok", group.call("retrieve", mock.Mock(return_value="ok")))
+        self.assertIs(group.get("upload"), group.get("upload"))
+        self.assertEqual({"upload": "open", "retrieve": "closed"}, group.states())
+
+        with self.assertRaises(KeyError):
+            group.call("upload", mock.Mock())
@@ -0,0 +1,84 @@
+import unittest
+
+from google.api_core import exceptions
+
+from lib.common.fault_injector import FaultInjector
+
+
+class TestLibCommonFaultInjector(unittest.TestCase):
+    def setUp(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def test_that_sleeps_for_latency_with_jitter(self):
+        fault_injector = self.__fault_injector(latency=0.05, jitter=0.01)
+
+        for _ in range(20):
+            fault_injector.call("retrieve")
+
+        self.assertEqual(20, len(self.sleeps))
+        self.assertTrue(all(0.05 <= sleep <= 0.06 for sleep in self.sleeps))
+
+    def test_that_draws_latency_from_configured_distribution(self):
+        fault_injector = self.__fault_injector(
+            latency=0.05, jitter=0.02, distribution=FaultInjector.EXPONENTIAL, seed=1
+        )
+
+        for _ in range(200):
+            fault_injector.call("annotate")
+
+        self.assertTrue(all(sleep >= 0.05 for sleep in self.sleeps))
+        self.assertGreater(max(self.sleeps), 0.05 + 0.02 * 3)
+
+        with self.assertRaises(ValueError):
+            self.__fault_injector(distribution="pareto")
+
+    def test_that_injects_errors_at_configured_rate_per_operation(self):
+        fault_injector = self.__fault_injector(
+            error_rate=0.0, error_rates={"upload": 1.0}
+        )
+
+        fault_injector.call("retrieve")
+
+        with self.assertRaises(exceptions.ServiceUnavailable):
+            fault_injector.call("upload")
+
+        self.assertEqual(
+            {"calls": 2, "failures": 1, "transferred": 0}, fault_injector.stats()
+        )
+
+    def test_that_same_seed_fails_the_same_calls(self):
+        first = self.__failures(self.__fault_injector(error_rate=0.3, seed=7))
+        second = self.__failures(self.__fault_injector(error_rate=0.3, seed=7))
+
+        self.assertEqual(first, second)
+        self.assertTrue(0 < sum(first) < len(first))
+
+    def test_that_caps_bandwidth_across_transfers(self):
+        fault_injector = self.__fault_injector(bandwidth=1000)
+
+        fault_injector.transfer(1000)
+        fault_injector.transfer(500)
+        fault_injector.transfer(500)
+
+        self.assertEqual([0.5, 1.0], self.sleeps)
+        self.assertEqual(2000, fault_injector.stats()["transferred"])
+
+    # private
+
+    def __fault_injector(self, **options) -> FaultInjector:
+        return FaultInjector(
+            sleep=self.sleeps.append, clock=lambda: self.now, **options
+        )
+
+    def __failures(self, fault_injector: FaultInjector) -> list:
+        failures = []
+
+        for _ in range(50):
+            try:
+                fault_injector.call("retrieve")
+                failures.append(False)
+            except exceptions.ServiceUnavailable:
+                failures.append(True)
+
+        return failures
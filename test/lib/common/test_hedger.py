@@ -0,0 +1,105 @@
+import threading
+import time
+import unittest
+
+from lib.common.hedger import Hedger
+
+
+class TestLibCommonHedger(unittest.TestCase):
+    def setUp(self):
+        self.hedger = Hedger(percentile=50, min_samples=3)
+
+    def tearDown(self):
+        self.hedger.shutdown()
+
+    def test_that_does_not_hedge_before_enough_samples(self):
+        self.assertIsNone(self.hedger.threshold())
+        self.assertEqual(2, self.hedger.call(lambda value: value * 2, 1))
+        self.assertEqual(0, self.hedger.hedges)
+
+    def test_that_sends_second_request_when_first_is_slower_than_threshold(self):
+        for _ in range(3):
+            self.hedger.call(lambda: None)
+
+        release = threading.Event()
+        calls = []
+
+        def function() -> str:
+            calls.append(None)
+
+            if len(calls) == 1:
+                release.wait(5)
+                return "slow"
+
+            return "fast"
+
+        try:
+            self.assertEqual("fast", self.hedger.call(function))
+        finally:
+            release.set()
+
+        self.assertEqual(1, self.hedger.hedges)
+
+    def test_that_raises_error_when_every_request_fails(self):
+        def function() -> None:
+            raise ConnectionError
+
+        with self.assertRaises(ConnectionError):
+            self.hedger.call(function)
+
+    def test_that_does_not_count_time_queued_for_a_worker_toward_threshold(self):
+        hedger = Hedger(percentile=50, min_samples=3, max_workers=1)
+
+        for _ in range(3):
+            hedger.call(time.sleep, 0.05)
+
+        release = threading.Event()
+        results = []
+
+        try:
+            hedger.worker_pool.submit(release.wait, 5)
+            caller = threading.Thread(
+                target=lambda: results.append(hedger.call(lambda: "queued"))
+            )
+            caller.start()
+            time.sleep(0.2)
+        finally:
+            release.set()
+
+        caller.join(5)
+        hedger.shutdown()
+
+        self.assertEqual(["queued"], results)
+        self.assertEqual(0, hedger.hedges)
+
+    def test_that_skips_hedges_beyond_max_hedges(self):
+        hedger = Hedger(percentile=50, min_samples=3, max_hedges=1)
+
+        for _ in range(3):
+            hedger.call(lambda: None)
+
+        release = threading.Event()
+        callers = [
+            threading.Thread(target=hedger.call, args=(release.wait, 5))
+            for _ in range(2)
+        ]
+
+        try:
+            for caller in callers:
+                caller.start()
+
+            deadline = time.monotonic() + 5
+
+            while hedger.hedges + hedger.skipped_hedges < 2:
+                self.assertLess(time.monotonic(), deadline)
+                time.sleep(0.01)
+        finally:
+            release.set()
+
+        for caller in callers:
+            caller.join(5)
+
+        hedger.shutdown()
+
+        self.assertEqual(1, hedger.hedges)
+        self.assertEqual(1, hedger.skipped_hedges)
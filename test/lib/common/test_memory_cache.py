@@ -0,0 +1,38 @@
+import unittest
+
+from lib.common.memory_cache import MemoryCache
+
+
+class TestLibCommonMemoryCache(unittest.TestCase):
+    def setUp(self):
+        self.now = 0.0
+        self.cache = MemoryCache(max_entries=2, ttl=10, clock=lambda: self.now)
+
+    def test_that_raises_value_error_when_max_entries_is_less_than_one(self):
+        with self.assertRaises(ValueError):
+            MemoryCache(max_entries=0)
+
+    def test_that_counts_hits_and_misses(self):
+        self.assertIsNone(self.cache.get("a"))
+
+        self.cache.set("a", [{"label": "desc"}])
+
+        self.assertEqual([{"label": "desc"}], self.cache.get("a"))
+        self.assertEqual({"hits": 1, "misses": 1, "size": 1}, self.cache.stats())
+
+    def test_that_expires_entries_after_ttl(self):
+        self.cache.set("a", 1)
+        self.now = 10.0
+
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(0, self.cache.stats()["size"])
+
+    def test_that_evicts_least_recently_used_entry(self):
+        self.cache.set("a", 1)
+        self.cache.set("b", 2)
+        self.cache.get("a")
+        self.cache.set("c", 3)
+
+        self.assertEqual(1, self.cache.get("a"))
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(3, self.cache.get("c"))
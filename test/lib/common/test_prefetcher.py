@@ -0,0 +1,36 @@
+import threading
+import unittest
+
+from lib.common.prefetcher import Prefetcher
+
+
+class TestLibCommonPrefetcher(unittest.TestCase):
+    def test_that_yields_items_in_order(self):
+        self.assertEqual([0, 1, 2], list(Prefetcher(iter(range(3)))))
+
+    def test_that_fetches_next_item_while_current_one_is_consumed(self):
+        fetched = threading.Event()
+
+        def items() -> iter:
+            yield "first"
+            fetched.set()
+            yield "second"
+
+        prefetcher = Prefetcher(items())
+
+        self.assertEqual("first", next(prefetcher))
+        self.assertTrue(fetched.wait(1))
+
+        prefetcher.close()
+
+    def test_that_raises_error_of_source_to_consumer(self):
+        def items() -> iter:
+            yield 1
+            raise ConnectionError
+
+        prefetcher = Prefetcher(items())
+
+        self.assertEqual(1, next(prefetcher))
+
+        with self.assertRaises(ConnectionError):
+            next(prefetcher)
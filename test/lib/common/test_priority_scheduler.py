@@ -0,0 +1,50 @@
+import threading
+import time
+import unittest
+
+from lib.common.priority_scheduler import PriorityScheduler
+from lib.common.rate_limiter import RateLimiter
+
+
+class TestLibCommonPriorityScheduler(unittest.TestCase):
+    def test_that_gives_waiting_interactive_calls_precedence_over_backfill(self):
+        limiter = RateLimiter(rate=20)
+        scheduler = PriorityScheduler(limiter)
+        order = []
+
+        scheduler.acquire(["web"], 20)
+
+        def call(name: str, priority: int) -> None:
+            scheduler.acquire(["web"], 1, priority)
+            order.append(name)
+
+        backfill = [
+            threading.Thread(
+                target=call, args=(f"backfill-{i}", PriorityScheduler.BACKFILL)
+            )
+            for i in range(3)
+        ]
+
+        for thread in backfill:
+            thread.start()
+
+        while scheduler.pending() < 3:
+            time.sleep(0.001)
+
+        interactive = threading.Thread(
+            target=call, args=("interactive", PriorityScheduler.INTERACTIVE)
+        )
+        interactive.start()
+
+        for thread in backfill + [interactive]:
+            thread.join()
+
+        self.assertIn("interactive", order[:2])
+        self.assertEqual(4, len(order))
+
+    def test_that_gives_up_after_timeout(self):
+        scheduler = PriorityScheduler(RateLimiter(rate=1))
+        scheduler.acquire(["web"])
+
+        self.assertFalse(scheduler.acquire(["web"], timeout=0.01))
+        self.assertEqual(0, scheduler.pending())
@@ -0,0 +1,53 @@
+import unittest
+
+from lib.common.rate_limiter import RateLimiter
+
+
+class TestLibCommonRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.now = 0.0
+        self.limiter = RateLimiter(
+            rate=10, feature_rates={"logo": 1}, clock=lambda: self.now
+        )
+
+    def test_that_reserves_from_project_and_feature_buckets(self):
+        self.assertEqual(0.0, self.limiter.reserve(["logo"]))
+        self.assertEqual(1.0, self.limiter.reserve(["logo"]))
+        self.assertEqual(0.0, self.limiter.reserve(["web"]))
+
+    def test_that_takes_nothing_when_any_bucket_has_to_wait(self):
+        self.limiter.reserve(["logo"])
+
+        for _ in range(9):
+            self.assertEqual(1.0, self.limiter.reserve(["logo"]))
+
+        self.assertEqual(0.0, self.limiter.reserve(["web"], 9))
+
+    def test_that_charges_project_bucket_once_per_feature(self):
+        self.assertEqual(0.0, self.limiter.reserve(["web", "logo", "label"], 3))
+        self.assertEqual(0.0, self.limiter.reserve(["web"]))
+        self.assertEqual(0.1, self.limiter.reserve(["web"]))
+
+    def test_that_drains_buckets_of_exhausted_features(self):
+        self.limiter.drain(["web"])
+
+        self.assertGreater(self.limiter.reserve(["web"]), 0.0)
+
+    def test_that_shares_one_limiter_per_project(self):
+        first = RateLimiter.shared("project-a", rate=5)
+
+        self.assertIs(first, RateLimiter.shared("project-a"))
+        self.assertIsNot(first, RateLimiter.shared("project-b", rate=5))
+
+    def test_that_returns_shared_limiter_when_options_match(self):
+        first = RateLimiter.shared("project-c", rate=5, feature_rates={"logo": 1})
+
+        self.assertIs(
+            first, RateLimiter.shared("project-c", rate=5, feature_rates={"logo": 1})
+        )
+
+    def test_that_rejects_shared_limiter_with_other_options(self):
+        RateLimiter.shared("project-d", rate=5)
+
+        with self.assertRaises(ValueError):
+            RateLimiter.shared("project-d", rate=10)
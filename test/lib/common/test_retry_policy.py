@@ -0,0 +1,81 @@
+import unittest
+import mock
+
+from google.api_core import exceptions
+
+from lib.common.retry_policy import RetryPolicy
+
+
+class TestLibCommonRetryPolicy(unittest.TestCase):
+    def setUp(self):
+        self.now = 0.0
+        self.sleeps = []
+        self.policy = RetryPolicy(
+            max_attempts=3,
+            deadline=10,
+            initial_backoff=1,
+            clock=lambda: self.now,
+            sleep=self.sleeps.append,
+        )
+
+    def test_that_raises_value_error_when_max_attempts_is_less_than_one(self):
+        with self.assertRaises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+    def test_that_retries_transient_errors_with_jittered_backoff(self):
+        function = mock.Mock(
+            side_effect=[exceptions.ServiceUnavailable(""), ConnectionResetError, "ok"]
+        )
+
+        self.assertEqual("ok", self.policy.call(function, "a", key="b"))
+
+        function.assert_called_with("a", key="b")
+
+        self.assertEqual(2, len(self.sleeps))
+        self.assertTrue(0 <= self.sleeps[0] <= 1)
+        self.assertTrue(0 <= self.sleeps[1] <= 2)
+        self.assertEqual({"calls": 1, "retries": 2, "failures": 0}, self.policy.stats())
+
+    def test_that_gives_up_after_max_attempts(self):
+        function = mock.Mock(side_effect=exceptions.InternalServerError(""))
+
+        with self.assertRaises(exceptions.InternalServerError):
+            self.policy.call(function)
+
+        self.assertEqual(3, function.call_count)
+        self.assertEqual(1, self.policy.stats()["failures"])
+
+    def test_that_does_not_retry_permanent_errors(self):
+        function = mock.Mock(side_effect=exceptions.NotFound(""))
+
+        with self.assertRaises(exceptions.NotFound):
+            self.policy.call(function)
+
+        function.assert_called_once()
+
+    def test_that_retries_only_rejected_requests_when_not_idempotent(self):
+        rejected = mock.Mock(side_effect=[exceptions.TooManyRequests(""), "ok"])
+        failed = mock.Mock(side_effect=exceptions.ServiceUnavailable(""))
+
+        self.assertEqual("ok", self.policy.call(rejected, idempotent=False))
+
+        with self.assertRaises(exceptions.ServiceUnavailable):
+            self.policy.call(failed, idempotent=False)
+
+        failed.assert_called_once()
+
+    def test_that_stops_retrying_when_deadline_would_pass(self):
+        def function() -> None:
+            self.now += 10
+            raise exceptions.BadGateway("")
+
+        with self.assertRaises(exceptions.BadGateway):
+            self.policy.call(function)
+
+        self.assertEqual([], self.sleeps)
+
+    def test_that_retries_extra_retryable_errors(self):
+        policy = RetryPolicy(retryable=(KeyError,), sleep=lambda _: None)
+        function = mock.Mock(side_effect=[KeyError, "ok"])
+
+        self.assertEqual("ok", policy.call(function, idempotent=False))
@@ -0,0 +1,93 @@
+import os
+import tempfile
+import unittest
+
+from lib.common.sqlite_cache import SQLiteCache
+
+
+class TestLibCommonSQLiteCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "cache.sqlite")
+        self.now = 0.0
+        self.cache = self.__cache()
+
+    def tearDown(self):
+        self.cache.close()
+        self.directory.cleanup()
+
+    def test_that_counts_hits_and_misses(self):
+        self.assertIsNone(self.cache.get("a"))
+
+        self.cache.set("a", [{"label": "desc", "score": 0.99}])
+
+        self.assertEqual([{"label": "desc", "score": 0.99}], self.cache.get("a"))
+        self.assertEqual({"hits": 1, "misses": 1, "size": 1}, self.cache.stats())
+
+    def test_that_shares_entries_between_connections_to_the_same_file(self):
+        other = self.__cache()
+
+        try:
+            self.cache.set("a", {"web": []})
+
+            self.assertEqual({"web": []}, other.get("a"))
+        finally:
+            other.close()
+
+    def test_that_expires_entries_after_ttl(self):
+        self.cache.set("a", 1)
+        self.now = 10.0
+
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(0, self.cache.stats()["size"])
+
+    def test_that_evicts_least_recently_used_entry(self):
+        self.cache.set("a", 1)
+        self.now = 1.0
+        self.cache.set("b", 2)
+        self.now = 2.0
+        self.cache.get("a")
+        self.now = 3.0
+        self.cache.set("c", 3)
+
+        self.assertEqual(1, self.cache.get("a"))
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(3, self.cache.get("c"))
+
+    def test_that_evicts_in_batches_and_refreshes_access_time_coarsely(self):
+        cache = SQLiteCache(
+            os.path.join(self.directory.name, "batched.sqlite"),
+            max_entries=100,
+            access_resolution=60,
+            clock=lambda: self.now,
+        )
+
+        try:
+            for index in range(109):
+                self.now = float(index)
+                cache.set(str(index), index)
+
+            self.assertEqual(10, cache.evict_interval)
+            self.assertEqual(109, cache.stats()["size"])
+
+            self.now = 109.0
+            cache.get("0")
+            cache.set("109", 109)
+
+            self.assertEqual(100, cache.stats()["size"])
+            self.assertEqual(0, cache.get("0"))
+            self.assertIsNone(cache.get("10"))
+            self.assertEqual(11, cache.get("11"))
+        finally:
+            cache.close()
+
+    # private
+
+    def __cache(self) -> SQLiteCache:
+        return SQLiteCache(
+            self.path,
+            max_entries=2,
+            ttl=10,
+            access_resolution=0,
+            clock=lambda: self.now,
+        )
@@ -0,0 +1,32 @@
+import unittest
+
+from lib.common.token_bucket import TokenBucket
+
+
+class TestLibCommonTokenBucket(unittest.TestCase):
+    def setUp(self):
+        self.now = 0.0
+        self.bucket = TokenBucket(rate=2, capacity=4, clock=lambda: self.now)
+
+    def test_that_raises_value_error_when_rate_is_not_positive(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+
+    def test_that_allows_burst_up_to_capacity_then_refills_at_rate(self):
+        self.assertTrue(all(self.bucket.try_acquire() for _ in range(4)))
+        self.assertFalse(self.bucket.try_acquire())
+        self.assertEqual(0.5, self.bucket.wait_time())
+
+        self.now = 0.5
+
+        self.assertTrue(self.bucket.try_acquire())
+
+    def test_that_charges_requests_larger_than_capacity_as_debt(self):
+        self.bucket.take(8)
+
+        self.assertEqual(2.5, self.bucket.wait_time())
+
+    def test_that_drain_empties_the_bucket(self):
+        self.bucket.drain()
+
+        self.assertFalse(self.bucket.try_acquire())
@@ -0,0 +1,56 @@
+import threading
+import time
+import unittest
+
+from lib.common.worker_pool import WorkerPool
+
+
+class TestLibCommonWorkerPool(unittest.TestCase):
+    def setUp(self):
+        self.pool = WorkerPool(max_workers=4)
+
+    def tearDown(self):
+        self.pool.shutdown()
+
+    def test_that_raises_value_error_when_max_workers_is_less_than_one(self):
+        with self.assertRaises(ValueError):
+            WorkerPool(max_workers=0)
+
+    def test_that_returns_results_in_input_order(self):
+        def work(item: int) -> int:
+            time.sleep(0.01 * (5 - item))
+            return item * 2
+
+        self.assertEqual([0, 2, 4, 6, 8], self.pool.map(work, range(5)))
+
+    def test_that_returns_errors_in_place_of_failed_items(self):
+        def work(item: int) -> int:
+            if item == 1:
+                raise FileNotFoundError
+
+            return item
+
+        response = self.pool.map(work, [0, 1, 2])
+
+        self.assertEqual(0, response[0])
+        self.assertIsInstance(response[1], FileNotFoundError)
+        self.assertEqual(2, response[2])
+
+    def test_that_never_runs_more_items_than_max_in_flight(self):
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+
+        def work(item: int) -> None:
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+
+            time.sleep(0.01)
+
+            with lock:
+                running[0] -= 1
+
+        self.pool.map(work, range(12), max_in_flight=2)
+
+        self.assertLessEqual(peak[0], 2)
@@ -0,0 +1,79 @@
+import asyncio
+import unittest
+import mock
+
+from lib.storage import errors as StorageError
+
+from api.storage.storage.gcp.provider import Provider as GCPProvider
+
+from services.storage import AsyncStorageService
+
+
+class TestServiceAsyncStorageService(unittest.TestCase):
+    def setUp(self):
+        self.service = AsyncStorageService("GCP", concurrency=4)
+        self.service.set_bucket("bucket-testing")
+
+    def tearDown(self):
+        asyncio.run(self.service.close())
+
+    def test_that_raises_error_when_initialize_provider_which_is_not_available(self):
+        with self.assertRaises(StorageError.ProviderNotFound):
+            AsyncStorageService("abcde")
+
+    @mock.patch.object(GCPProvider, "request_retrieve")
+    def test_that_can_request_retrieve(self, mock_retrieve: mock.MagicMock):
+        mock_retrieve.return_value = {"uri": "gs://bucket-testing/ex1/test.txt"}
+
+        response = asyncio.run(self.service.request_retrieve(self.remote_file_path()))
+
+        mock_retrieve.assert_called_once_with(self.remote_file_path())
+
+        self.assertEqual("gs://bucket-testing/ex1/test.txt", response.get("uri"))
+
+    @mock.patch.object(GCPProvider, "request_delete")
+    def test_that_raises_file_not_found_like_sync_service(
+        self, mock_delete: mock.MagicMock
+    ):
+        mock_delete.side_effect = StorageError.FileNotFound
+
+        with self.assertRaises(StorageError.FileNotFound):
+            asyncio.run(self.service.request_delete(self.remote_file_path()))
+
+    @mock.patch.object(GCPProvider, "request_upload")
+    def test_that_can_run_many_requests_concurrently(self, mock_upload: mock.MagicMock):
+        mock_upload.side_effect = lambda remote_file_path, local_file_path: {
+            "name": remote_file_path
+        }
+
+        async def run() -> list:
+            return await asyncio.gather(
+                *[
+                    self.service.request_upload(f"ex1/{i}.txt", "test.txt")
+                    for i in range(20)
+                ]
+            )
+
+        response = asyncio.run(run())
+
+        self.assertEqual(20, mock_upload.call_count)
+        self.assertEqual("ex1/19.txt", response[19].get("name"))
+
+    @mock.patch.object(GCPProvider, "request_list")
+    def test_that_can_iterate_listing_asynchronously(self, mock_list: mock.MagicMock):
+        mock_list.return_value = iter([{"name": "ex1/a.txt"}, {"name": "ex1/b.txt"}])
+
+        async def names() -> list:
+            return [entry["name"] async for entry in self.service.request_list("ex1/")]
+
+        response = asyncio.run(names())
+
+        mock_list.assert_called_once_with("ex1/", None)
+
+        self.assertEqual(["ex1/a.txt", "ex1/b.txt"], response)
+
+    # static
+
+    @staticmethod
+    def remote_file_path() -> str:
+        return "ex1/test.txt"
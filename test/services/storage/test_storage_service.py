@@ -1,9 +1,13 @@
+import os
+import tempfile
 import unittest
 import mock
 
 from lib.storage import errors as StorageError
 
+from api.storage.storage.gcp.client_pool import ClientPool
 from api.storage.storage.gcp.provider import Provider as GCPProvider
+from api.storage.storage.local.provider import Provider as LocalProvider
 
 from services.storage import StorageService
 
@@ -20,6 +24,35 @@ class TestServiceStorageService(unittest.TestCase):
         self.assertIsInstance(self.service, StorageService)
         self.assertIsInstance(self.service.provider, GCPProvider)
 
+    def test_that_can_initiate_local_provider(self):
+        service = StorageService("local", buckets=["bucket-testing"])
+
+        self.assertIsInstance(service.provider, LocalProvider)
+
+    def test_that_passes_options_to_provider(self):
+        client_pool = ClientPool()
+        service = StorageService("GCP", client_pool=client_pool)
+
+        self.assertIs(client_pool, service.provider.client_pool)
+
+    @mock.patch.object(GCPProvider, "close")
+    def test_that_closes_provider_when_leaving_context(
+        self, mock_close: mock.MagicMock
+    ):
+        with StorageService("GCP"):
+            pass
+
+        mock_close.assert_called_once()
+
+    def test_that_scopes_a_copy_to_a_bucket_without_changing_the_service(self):
+        self.service.set_bucket("bucket-testing")
+
+        scoped = self.service.for_bucket("other-bucket")
+
+        self.assertEqual("other-bucket", scoped.get_bucket())
+        self.assertEqual("bucket-testing", self.service.get_bucket())
+        self.assertIs(self.service.provider.client_pool, scoped.provider.client_pool)
+
     def test_that_can_set_and_get_bucket(self):
         self.service.set_bucket("bucket-testing")
         self.assertEqual("bucket-testing", self.service.get_bucket())
@@ -112,6 +145,71 @@ class TestServiceStorageService(unittest.TestCase):
         self.assertEqual("gs://bucket-testing/ex1/test.txt", response.get("uri"))
         self.assertFalse(response.get("exists"))
 
+    @mock.patch.object(GCPProvider, "request_delete_many")
+    def test_that_can_request_delete_many(self, mock_response: mock.MagicMock):
+        mock_response.return_value = [
+            self.__mock_deleted_file_storage_response(),
+            StorageError.FileNotFound(),
+        ]
+
+        self.service.set_bucket("bucket-testing")
+        response = self.service.request_delete_many(
+            [self.remote_file_path, "ex1/missing.txt"]
+        )
+
+        mock_response.assert_called_once_with(
+            [self.remote_file_path, "ex1/missing.txt"]
+        )
+
+        self.assertFalse(response[0].get("exists"))
+        self.assertIsInstance(response[1], StorageError.FileNotFound)
+
+    @mock.patch.object(GCPProvider, "request_retrieve_many")
+    def test_that_raises_bucket_not_found_when_retrieving_many_from_missing_bucket(
+        self, mock_retrieve: mock.MagicMock
+    ):
+        mock_retrieve.side_effect = StorageError.BucketNotFound
+
+        with self.assertRaises(StorageError.BucketNotFound):
+            self.service.set_bucket("abcde")
+            self.service.request_retrieve_many([self.remote_file_path])
+
+    @mock.patch.object(GCPProvider, "request_list")
+    def test_that_raises_bucket_not_found_when_listing_missing_bucket(
+        self, mock_list: mock.MagicMock
+    ):
+        mock_list.side_effect = StorageError.BucketNotFound
+
+        with self.assertRaises(StorageError.BucketNotFound):
+            list(self.service.request_list("ex1/"))
+
+    @mock.patch.object(GCPProvider, "request_list")
+    def test_that_sync_plans_without_transferring_on_dry_run(
+        self, mock_list: mock.MagicMock
+    ):
+        mock_list.return_value = []
+
+        with tempfile.TemporaryDirectory() as local_dir:
+            open(os.path.join(local_dir, "test.txt"), "w").close()
+
+            with mock.patch.object(GCPProvider, "request_upload") as mock_upload:
+                summary = self.service.sync(local_dir, "ex1/", dry_run=True)
+
+        mock_upload.assert_not_called()
+
+        self.assertEqual([], summary["results"])
+        self.assertEqual("ex1/test.txt", summary["plan"][0]["remote_file_path"])
+        self.assertEqual("upload", summary["plan"][0]["action"])
+
+    @mock.patch.object(GCPProvider, "request_list")
+    def test_that_raises_bucket_not_found_when_syncing_missing_bucket(
+        self, mock_list: mock.MagicMock
+    ):
+        mock_list.side_effect = StorageError.BucketNotFound
+
+        with self.assertRaises(StorageError.BucketNotFound):
+            self.service.sync(".", "ex1/")
+
     # static
 
     @staticmethod
@@ -0,0 +1,46 @@
+import asyncio
+import unittest
+import mock
+
+from lib.ai import errors as AIError
+
+from api.ai.vision.gcp.provider import Provider as GCPProvider
+
+from services.vision import AsyncVisionService
+
+
+class TestAIAsyncVisionService(unittest.TestCase):
+    def setUp(self):
+        self.service = AsyncVisionService("GCP", concurrency=4)
+
+    def tearDown(self):
+        asyncio.run(self.service.close())
+
+    def test_that_raises_error_when_initialize_provider_which_is_not_available(self):
+        with self.assertRaises(AIError.ProviderNotFound):
+            AsyncVisionService("abcde")
+
+    @mock.patch.object(GCPProvider, "request_web_detection")
+    def test_that_can_request_web_detection(self, mock_response: mock.MagicMock):
+        mock_response.return_value = [{"score": 0.99, "label": "desc"}]
+
+        response = asyncio.run(self.service.request_web_detection(self.uri()))
+
+        mock_response.assert_called_once_with(self.uri())
+
+        self.assertEqual("desc", response[0].get("label"))
+
+    @mock.patch.object(GCPProvider, "request_logo_detection")
+    def test_that_raises_file_object_not_found_like_sync_service(
+        self, mock_response: mock.MagicMock
+    ):
+        mock_response.side_effect = AIError.FileObjectNotFound
+
+        with self.assertRaises(AIError.FileObjectNotFound):
+            asyncio.run(self.service.request_logo_detection(self.uri()))
+
+    # static
+
+    @staticmethod
+    def uri() -> str:
+        return "gs://bucket/file.txt"
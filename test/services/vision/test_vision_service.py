@@ -3,7 +3,14 @@ import mock
 
 from lib.ai import errors as AIError
 
+from lib.common.memory_cache import MemoryCache
+from lib.common.priority_scheduler import PriorityScheduler
+from lib.common.rate_limiter import RateLimiter
+
+from api.ai.vision.fake.provider import Provider as FakeProvider
+from api.ai.vision.gcp.client_pool import ClientPool
 from api.ai.vision.gcp.provider import Provider as GCPProvider
+from api.storage.storage.local.provider import Provider as LocalProvider
 
 from services.vision import VisionService
 
@@ -16,10 +23,45 @@ class TestAIVisionService(unittest.TestCase):
         with self.assertRaises(AIError.ProviderNotFound):
             VisionService("abcde")
 
+    def test_that_runs_fake_provider_end_to_end_with_cache(self):
+        service = VisionService("fake", cache=MemoryCache(), max_batch_size=4)
+        uris = [f"gs://bucket-testing/ex1/{index}.jpg" for index in range(10)]
+
+        first = service.request_web_detection_many(uris)
+        second = service.request_web_detection_many(uris)
+
+        self.assertIsInstance(service.provider, FakeProvider)
+        self.assertEqual(first, second)
+        self.assertEqual(3, service.provider.fault_injector.stats()["calls"])
+
+        service.close()
+
     def test_that_can_initiate_provider(self):
         self.assertIsInstance(self.service, VisionService)
         self.assertIsInstance(self.service.provider, GCPProvider)
 
+    def test_that_passes_options_to_provider(self):
+        client_pool = ClientPool()
+        service = VisionService("GCP", client_pool=client_pool)
+
+        self.assertIs(client_pool, service.provider.client_pool)
+
+    def test_that_leaves_cache_passed_in_open_when_closing(self):
+        cache = mock.Mock()
+
+        VisionService("fake", cache=cache).close()
+
+        cache.close.assert_not_called()
+
+    @mock.patch.object(GCPProvider, "close")
+    def test_that_closes_provider_when_leaving_context(
+        self, mock_close: mock.MagicMock
+    ):
+        with VisionService("GCP"):
+            pass
+
+        mock_close.assert_called_once()
+
     @mock.patch.object(GCPProvider, "request_web_detection")
     def test_that_raises_file_object_not_found_when_file_is_not_existed(
         self, mock_request: mock.MagicMock
@@ -57,6 +99,210 @@ class TestAIVisionService(unittest.TestCase):
         self.assertEqual(0.60, response[1].get("score"))
         self.assertEqual("desc2", response[1].get("logo"))
 
+    @mock.patch.object(GCPProvider, "request_annotate")
+    def test_that_can_request_annotate_with_default_features(
+        self, mock_response: mock.MagicMock
+    ):
+        mock_response.return_value = {
+            "web": self.__mock_vision_web_detection_response(),
+            "logo": self.__mock_vision_logo_detection_response(),
+        }
+
+        response = self.service.request_annotate(self.uri())
+
+        mock_response.assert_called_once_with(self.uri(), ["web", "logo"])
+
+        self.assertEqual("desc", response["web"][0].get("label"))
+        self.assertEqual("desc", response["logo"][0].get("logo"))
+
+    @mock.patch.object(GCPProvider, "request_annotate")
+    def test_that_raises_file_object_not_found_when_annotating_missing_file(
+        self, mock_request: mock.MagicMock
+    ):
+        mock_request.side_effect = AIError.FileObjectNotFound
+
+        with self.assertRaises(AIError.FileObjectNotFound):
+            self.service.request_annotate(self.uri(), ["label"])
+
+    @mock.patch.object(GCPProvider, "request_logo_detection_many")
+    def test_that_can_request_logo_detection_many(self, mock_response: mock.MagicMock):
+        mock_response.return_value = [
+            self.__mock_vision_logo_detection_response(),
+            AIError.FileObjectNotFound(),
+        ]
+
+        response = self.service.request_logo_detection_many([self.uri(), self.uri()])
+
+        mock_response.assert_called_once_with([self.uri(), self.uri()])
+
+        self.assertEqual("desc", response[0][0].get("logo"))
+        self.assertIsInstance(response[1], AIError.FileObjectNotFound)
+
+    @mock.patch.object(GCPProvider, "request_web_detection")
+    def test_that_returns_cached_result_for_same_uri(
+        self, mock_response: mock.MagicMock
+    ):
+        mock_response.return_value = self.__mock_vision_web_detection_response()
+        cache = MemoryCache()
+        service = VisionService("GCP", cache=cache)
+
+        first = service.request_web_detection(self.uri())
+        second = service.request_web_detection(self.uri())
+
+        mock_response.assert_called_once_with(self.uri())
+
+        self.assertEqual(first, second)
+        self.assertEqual({"hits": 1, "misses": 1, "size": 1}, cache.stats())
+
+    @mock.patch.object(GCPProvider, "request_annotate")
+    def test_that_caches_annotate_results_per_feature_set(
+        self, mock_response: mock.MagicMock
+    ):
+        mock_response.return_value = {"web": []}
+        service = VisionService("GCP", cache=MemoryCache())
+
+        service.request_annotate(self.uri(), ["web", "logo"])
+        service.request_annotate(self.uri(), ["logo", "web"])
+        service.request_annotate(self.uri(), ["label"])
+
+        self.assertEqual(2, mock_response.call_count)
+
+    @mock.patch.object(GCPProvider, "request_logo_detection_many")
+    def test_that_requests_only_uncached_unique_uris_in_batch(
+        self, mock_response: mock.MagicMock
+    ):
+        mock_response.side_effect = lambda uris: [
+            AIError.FileObjectNotFound() if uri.endswith("missing") else [uri]
+            for uri in uris
+        ]
+        service = VisionService("GCP", cache=MemoryCache())
+        service.request_logo_detection_many(["gs://bucket/a"])
+
+        response = service.request_logo_detection_many(
+            ["gs://bucket/a", "gs://bucket/b", "gs://bucket/b", "gs://bucket/missing"]
+        )
+
+        mock_response.assert_called_with(["gs://bucket/b", "gs://bucket/missing"])
+
+        self.assertEqual(["gs://bucket/a"], response[0])
+        self.assertEqual(["gs://bucket/b"], response[1])
+        self.assertEqual(["gs://bucket/b"], response[2])
+        self.assertIsInstance(response[3], AIError.FileObjectNotFound)
+
+    @mock.patch.object(GCPProvider, "request_web_detection_job")
+    def test_that_submits_web_detection_job_with_storage_service(
+        self, mock_request: mock.MagicMock
+    ):
+        storage = mock.Mock()
+
+        job = self.service.request_web_detection_job(
+            [self.uri()], "gs://bucket/backfill/", storage
+        )
+
+        mock_request.assert_called_once_with(
+            [self.uri()], "gs://bucket/backfill/", storage, 100
+        )
+
+        self.assertIs(mock_request.return_value, job)
+
+    def test_that_runs_fake_jobs_on_offline_storage_by_default(self):
+        service = VisionService("fake")
+
+        job = service.request_logo_detection_job([self.uri()], "gs://bucket/backfill/")
+
+        self.assertIsInstance(job.storage.provider, LocalProvider)
+        self.assertEqual(
+            [service.request_logo_detection(self.uri())], list(job.results(5))
+        )
+
+        service.close()
+
+    @mock.patch.object(GCPProvider, "request_web_detection_many")
+    def test_that_sends_preprocessed_content_and_keeps_preprocessing_errors_in_place(
+        self, mock_response: mock.MagicMock
+    ):
+        preprocessor = mock.Mock()
+        preprocessor.process_many.return_value = [
+            b"image",
+            AIError.FileObjectNotFound(),
+            self.uri(),
+        ]
+        mock_response.return_value = [["content"], ["uri"]]
+        service = VisionService("GCP", preprocessor=preprocessor)
+
+        response = service.request_web_detection_many(
+            ["image.jpg", "missing.jpg", self.uri()]
+        )
+
+        mock_response.assert_called_once_with([b"image", self.uri()])
+
+        self.assertEqual(["content"], response[0])
+        self.assertIsInstance(response[1], AIError.FileObjectNotFound)
+        self.assertEqual(["uri"], response[2])
+
+    @mock.patch.object(GCPProvider, "request_logo_detection_many")
+    def test_that_reuses_results_of_near_duplicate_images(
+        self, mock_response: mock.MagicMock
+    ):
+        dedup = mock.Mock()
+        dedup.digest.side_effect = lambda content: {b"a": 1, b"a2": 3, b"b": 255}[
+            content
+        ]
+        dedup.lookup.side_effect = lambda operation, digest: (
+            ["stored"] if digest == 255 else None
+        )
+        dedup.is_near.side_effect = lambda first, second: abs(first - second) < 4
+        mock_response.return_value = [["a"], ["uri"]]
+        service = VisionService("GCP", dedup=dedup)
+
+        response = service.request_logo_detection_many([b"a", b"a2", b"b", self.uri()])
+
+        mock_response.assert_called_once_with([b"a", self.uri()])
+        dedup.add.assert_called_once_with("logo_detection", 1, ["a"])
+
+        self.assertEqual([["a"], ["a"], ["stored"], ["uri"]], response)
+
+    @mock.patch.object(GCPProvider, "request_logo_detection_many")
+    def test_that_acquires_quota_for_each_image_with_service_priority(
+        self, mock_response: mock.MagicMock
+    ):
+        scheduler = mock.Mock()
+        mock_response.return_value = [["a"], ["b"]]
+        service = VisionService("GCP", scheduler=scheduler, priority=10)
+
+        service.request_logo_detection_many([self.uri(), "gs://bucket/b"])
+
+        scheduler.acquire.assert_called_once_with(["logo"], 2, 10)
+        scheduler.exhausted.assert_not_called()
+
+    @mock.patch.object(GCPProvider, "request_annotate")
+    def test_that_charges_project_quota_per_image_and_feature(
+        self, mock_request: mock.MagicMock
+    ):
+        limiter = RateLimiter(rate=6, clock=lambda: 0.0)
+        mock_request.return_value = {}
+        service = VisionService("GCP", scheduler=PriorityScheduler(limiter))
+
+        service.request_annotate(self.uri(), ["web", "logo", "label"])
+        service.request_annotate(self.uri(), ["web"])
+
+        self.assertEqual(0.0, limiter.reserve([], 2))
+        self.assertGreater(limiter.reserve([]), 0.0)
+
+    @mock.patch.object(GCPProvider, "request_annotate")
+    def test_that_drains_quota_when_resource_is_exhausted(
+        self, mock_request: mock.MagicMock
+    ):
+        scheduler = mock.Mock()
+        mock_request.side_effect = AIError.QuotaExceeded
+        service = VisionService("GCP", scheduler=scheduler)
+
+        with self.assertRaises(AIError.QuotaExceeded):
+            service.request_annotate(self.uri(), ["web", "label"])
+
+        scheduler.acquire.assert_called_once_with(["web", "label"], 1, 0)
+        scheduler.exhausted.assert_called_once_with(["web", "label"])
+
     # static
 
     @staticmethod